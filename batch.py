@@ -0,0 +1,174 @@
+# Batch runner → plays many quiet games across a process pool (one worker per core)
+# and reports the aggregate win rate, moves per game and games per second.
+# run_until keeps playing numbered deals until the win-rate interval is tight enough.
+
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from profiling import SimulatorProfile
+from simulator import SolitaireSimulator, MAX_MOVES, OUTCOMES
+from stats import StatsAggregator
+
+
+def play_stats(num_games, max_moves=MAX_MOVES, first_deal=None, profile=None):
+    """
+    Plays num_games games in this process with move reporting turned off.
+    With first_deal, plays deal numbers first_deal .. first_deal + num_games - 1;
+    otherwise random deals. With a SimulatorProfile as profile, every game is
+    profiled and merged into it. Returns a StatsAggregator over the games.
+    """
+    stats = StatsAggregator(max_moves)
+    for k in range(num_games):
+        seed = None if first_deal is None else first_deal + k
+        simulator = SolitaireSimulator(verbose=False, max_moves=max_moves, seed=seed, profile=profile is not None)
+        simulator.run_simulation()
+        stats.add_simulator(simulator)
+        if profile is not None:
+            profile.merge(simulator.profile)
+    return stats
+
+
+def play_games(num_games, max_moves=MAX_MOVES, first_deal=None):
+    """Like play_stats, but returns only (games, total_moves, outcome_counts)."""
+    stats = play_stats(num_games, max_moves, first_deal)
+    return stats.games, stats.total_moves, dict(stats.outcomes)
+
+
+def profile_games(num_games, max_moves=MAX_MOVES, first_deal=None):
+    """
+    Like play_games, with profiling on. Returns (games, total_moves, outcome_counts,
+    profile), the profile summed over the games.
+    """
+    profile = SimulatorProfile()
+    stats = play_stats(num_games, max_moves, first_deal, profile)
+    return stats.games, stats.total_moves, dict(stats.outcomes), profile
+
+
+def split(num_games, chunk_size):
+    """Splits num_games into chunk sizes of at most chunk_size."""
+    chunks = [chunk_size] * (num_games // chunk_size)
+    if num_games % chunk_size:
+        chunks.append(num_games % chunk_size)
+    return chunks
+
+
+def run_batch(num_games, workers=None, chunk_size=None, max_moves=MAX_MOVES, first_deal=None, profile=False):
+    """
+    Plays num_games games spread over a pool sized to the core count.
+
+    With first_deal, each chunk plays its own range of consecutive deal numbers,
+    so the results do not depend on the worker count or chunk size. Without it,
+    each worker reseeds the global random module on startup, otherwise forked
+    workers would inherit the same state and deal identical games.
+    With profile=True the summary also holds a 'profile' (SimulatorProfile)
+    aggregated over all games.
+    Returns a dict with win_rate, moves_per_game, games_per_sec and the
+    per-outcome counts.
+    """
+    if num_games <= 0:
+        raise ValueError("num_games must be positive")
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        # A few chunks per worker keeps the pool busy without much IPC.
+        chunk_size = max(1, num_games // (workers * 4))
+
+    chunks = split(num_games, chunk_size)
+    if first_deal is None:
+        deals = [None] * len(chunks)
+    else:
+        deals = [first_deal + i * chunk_size for i in range(len(chunks))]
+    play = profile_games if profile else play_games
+    start = time.perf_counter()
+    if workers == 1:
+        results = [play(size, max_moves, deal) for size, deal in zip(chunks, deals)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=random.seed) as pool:
+            results = list(pool.map(play, chunks, [max_moves] * len(chunks), deals))
+    elapsed = time.perf_counter() - start
+
+    games = 0
+    total_moves = 0
+    outcomes = dict.fromkeys(OUTCOMES, 0)
+    for chunk_games, chunk_moves, chunk_outcomes, *_ in results:
+        games += chunk_games
+        total_moves += chunk_moves
+        for outcome, count in chunk_outcomes.items():
+            outcomes[outcome] += count
+
+    summary = {
+        'games': games,
+        'wins': outcomes['win'],
+        'win_rate': outcomes['win'] / games,
+        'moves_per_game': total_moves / games,
+        'games_per_sec': games / elapsed if elapsed > 0 else float('inf'),
+        'elapsed': elapsed,
+        'workers': workers,
+        'outcomes': outcomes,
+    }
+    if profile:
+        summary['profile'] = SimulatorProfile()
+        for result in results:
+            summary['profile'].merge(result[3])
+    return summary
+
+
+def run_until(half_width, max_games, first_deal=0, workers=None, chunk_size=100, max_moves=MAX_MOVES,
+              min_games=100):
+    """
+    Plays deal numbers from first_deal on, chunk by chunk, until the 95% Wilson
+    interval on the win rate is within ±half_width or max_games were played.
+    Chunks are merged in deal order and convergence is checked after each one,
+    so the games counted do not depend on the worker count. Returns the StatsAggregator.
+    """
+    if max_games <= 0:
+        raise ValueError("max_games must be positive")
+    workers = workers or os.cpu_count() or 1
+    chunks = split(max_games, chunk_size)
+    stats = StatsAggregator(max_moves)
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for start in range(0, len(chunks), workers):
+            sizes = chunks[start:start + workers]
+            deals = [first_deal + (start + i) * chunk_size for i in range(len(sizes))]
+            if pool is None:
+                results = [play_stats(size, max_moves, deal) for size, deal in zip(sizes, deals)]
+            else:
+                results = pool.map(play_stats, sizes, [max_moves] * len(sizes), deals)
+            for result in results:
+                stats.merge(result)
+                if stats.converged(half_width, min_games):
+                    return stats
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play many quiet games across a process pool.")
+    parser.add_argument('num_games', type=int, nargs='?',
+                        help="games to play (default 1000, or at most 100000 with --until)")
+    parser.add_argument('workers', type=int, nargs='?', help="pool size (default: one per core)")
+    parser.add_argument('first_deal', type=int, nargs='?', help="play numbered deals from here (default: random)")
+    parser.add_argument('--profile', action='store_true', help="report per-tier counters and timings")
+    parser.add_argument('--until', type=float, metavar='HALF_WIDTH',
+                        help="play numbered deals until the 95%% win-rate interval is this tight")
+    args = parser.parse_args()
+    if args.until is not None:
+        print(run_until(args.until, args.num_games or 100000, first_deal=args.first_deal or 0,
+                        workers=args.workers).report())
+        sys.exit(0)
+    profile = args.profile
+    summary = run_batch(args.num_games or 1000, workers=args.workers, first_deal=args.first_deal, profile=profile)
+    print(f"--- Batch of {summary['games']} games on {summary['workers']} workers ---")
+    print(f"Win rate:       {summary['win_rate']:.2%}")
+    print(f"Moves per game: {summary['moves_per_game']:.1f}")
+    print(f"Games per sec:  {summary['games_per_sec']:.1f}")
+    for outcome, count in summary['outcomes'].items():
+        print(f"  {outcome:<11} {count}")
+    if profile:
+        print(summary['profile'].report())
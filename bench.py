@@ -0,0 +1,199 @@
+# Benchmarks → times the engine hot paths (deck, deal, rule checks, one greedy
+# move, whole games on fixed deals) and writes the results as JSON with the
+# machine and Python version. Two saved runs compare as percentage deltas.
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from timeit import Timer
+
+from deck import Deck
+from game import SolitaireGame
+from simulator import SolitaireSimulator, MAX_MOVES
+from state import GameState
+
+# Fixed inputs so every run times the same work
+DEAL_SEEDS = range(50)
+POSITION_SEEDS = range(20)
+POSITION_DEPTH = 30    # greedy moves played before a position is captured
+REPEAT = 5             # best of REPEAT runs is reported, as timeit suggests
+
+
+def machine_info():
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def _time(stmt, number, repeat=REPEAT):
+    """Best seconds per call of stmt over repeat runs of number calls."""
+    return min(Timer(stmt).repeat(repeat=repeat, number=number)) / number
+
+
+def bench_deck_init(scale):
+    seeds = iter(range(10 ** 9))
+    return _time(lambda: Deck(next(seeds)), 2000 * scale)
+
+
+def bench_deck_shuffle(scale):
+    deck = Deck(0)
+    return _time(deck.shuffle, 2000 * scale)
+
+
+def bench_game_deal(scale):
+    seeds = iter(range(10 ** 9))
+    return _time(lambda: SolitaireGame(next(seeds)), 1000 * scale)
+
+
+def _rule_pairs():
+    """(card, pile) pairs from a few dealt games: each tableau top against every pile."""
+    pairs = []
+    for seed in range(5):
+        game = SolitaireGame(seed)
+        for src in game.tableau:
+            for dest in game.tableau:
+                pairs.append((src.cards[-1], dest))
+    return game, pairs
+
+
+def bench_can_place_tableau(scale):
+    game, pairs = _rule_pairs()
+    can_place = game.can_place_tableau
+
+    def run():
+        for card, pile in pairs:
+            can_place(card, pile)
+    return _time(run, 100 * scale) / len(pairs)
+
+
+def bench_is_one_rank_lower(scale):
+    game, pairs = _rule_pairs()
+    lower = game.is_one_rank_lower
+    cards = [(card, pile.cards[-1]) for card, pile in pairs]
+
+    def run():
+        for a, b in cards:
+            lower(a, b)
+    return _time(run, 100 * scale) / len(cards)
+
+
+def _positions():
+    """Packed positions reached after POSITION_DEPTH greedy moves on fixed deals."""
+    states = []
+    for seed in POSITION_SEEDS:
+        simulator = SolitaireSimulator(verbose=False, max_moves=POSITION_DEPTH, seed=seed)
+        simulator.run_simulation()
+        states.append(GameState.from_game(simulator.game))
+    return states
+
+
+def bench_best_non_draw_move(scale):
+    """One make_best_non_draw_move call; each position is rebuilt untimed before the call."""
+    states = _positions()
+    best = None
+    for _ in range(REPEAT):
+        total = 0.0
+        calls = 0
+        for _ in range(10 * scale):
+            for state in states:
+                simulator = SolitaireSimulator(verbose=False, game=state.to_game())
+                start = time.perf_counter()
+                simulator.make_best_non_draw_move()
+                total += time.perf_counter() - start
+                calls += 1
+        per_call = total / calls
+        best = per_call if best is None else min(best, per_call)
+    return best
+
+
+def bench_full_games(scale):
+    """Seconds per quiet greedy game over the fixed deal seeds."""
+    def run():
+        for seed in DEAL_SEEDS:
+            SolitaireSimulator(verbose=False, max_moves=MAX_MOVES, seed=seed).run_simulation()
+    return _time(run, 1, repeat=max(1, scale)) / len(DEAL_SEEDS)
+
+
+BENCHMARKS = {
+    'deck_init': bench_deck_init,
+    'deck_shuffle': bench_deck_shuffle,
+    'game_deal': bench_game_deal,
+    'can_place_tableau': bench_can_place_tableau,
+    'is_one_rank_lower': bench_is_one_rank_lower,
+    'best_non_draw_move': bench_best_non_draw_move,
+    'full_game': bench_full_games,
+}
+
+
+def run_benchmarks(names=None, scale=1):
+    """
+    Runs the named benchmarks (all by default). scale multiplies the loop counts.
+    Returns a JSON-ready dict: machine info plus seconds per operation for each.
+    """
+    results = {}
+    for name in names or BENCHMARKS:
+        results[name] = {'seconds_per_op': BENCHMARKS[name](scale)}
+    return {
+        'machine': machine_info(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'scale': scale,
+        'benchmarks': results,
+    }
+
+
+def compare(baseline, current):
+    """
+    Percentage change in seconds per op for each benchmark present in both runs.
+    Positive means slower than the baseline.
+    """
+    deltas = {}
+    for name, result in current['benchmarks'].items():
+        before = baseline['benchmarks'].get(name)
+        if before and before['seconds_per_op'] > 0:
+            deltas[name] = (result['seconds_per_op'] / before['seconds_per_op'] - 1.0) * 100.0
+    return deltas
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time the Solitaire engine hot paths.")
+    parser.add_argument('names', nargs='*', help="benchmarks to run (default: all)")
+    parser.add_argument('--scale', type=int, default=1, help="multiply loop counts")
+    parser.add_argument('--save', help="write the results as JSON to this file")
+    parser.add_argument('--json', action='store_true', help="print the JSON report instead of a table")
+    parser.add_argument('--compare', help="baseline JSON file to compare against")
+    parser.add_argument('--threshold', type=float, default=5.0,
+                        help="percent slowdown reported as a regression (exit status 1)")
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.names, args.scale)
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(report, f, indent=2)
+    deltas = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline['machine'] != report['machine']:
+            print("warning: baseline was recorded on a different machine or Python", file=sys.stderr)
+        deltas = compare(baseline, report)
+        report['delta_percent'] = deltas
+    regressions = sum(delta > args.threshold for delta in deltas.values())
+    if args.json:
+        print(json.dumps(report, indent=2))
+        sys.exit(1 if regressions else 0)
+    for name, result in report['benchmarks'].items():
+        line = f"{name:<20} {result['seconds_per_op'] * 1e6:12.3f} us/op"
+        if name in deltas:
+            line += f"  {deltas[name]:+7.1f}%"
+            if deltas[name] > args.threshold:
+                line += "  REGRESSION"
+        print(line)
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,115 @@
+# Campaign runner → long batches of numbered deals split into fixed shards. After
+# every finished shard a JSON checkpoint with the completed deal ranges and the
+# merged StatsAggregator is written atomically, so a killed run resumes where it
+# stopped and ends with the same statistics as an uninterrupted one.
+
+import json
+import os
+import sys
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+from batch import play_stats
+from simulator import MAX_MOVES
+from stats import StatsAggregator
+
+VERSION = 1
+
+
+def _add_range(ranges, start, stop):
+    """Adds [start, stop) to a sorted list of [start, stop) ranges, coalescing neighbours."""
+    ranges.append([start, stop])
+    ranges.sort()
+    merged = [ranges[0]]
+    for first, last in ranges[1:]:
+        if first <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], last)
+        else:
+            merged.append([first, last])
+    ranges[:] = merged
+
+
+def _covered(ranges, start, stop):
+    return any(first <= start and stop <= last for first, last in ranges)
+
+
+def write_checkpoint(path, checkpoint):
+    """
+    Writes the checkpoint to a temporary file and renames it over path, so a
+    crash leaves the old one. The temporary name is unique across hosts, since
+    cluster workers on different machines may write the same shard result.
+    """
+    tmp = f'{path}.{uuid.uuid4().hex}.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(checkpoint, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path, config):
+    """The checkpoint at path, or a fresh one. Raises ValueError if it belongs to another campaign."""
+    if not os.path.exists(path):
+        return {'version': VERSION, 'config': config, 'completed': [],
+                'stats': StatsAggregator(config['max_moves']).as_dict()}
+    with open(path) as f:
+        checkpoint = json.load(f)
+    if checkpoint.get('version') != VERSION or checkpoint['config'] != config:
+        raise ValueError(f"{path} is a checkpoint of a different campaign: {checkpoint.get('config')}")
+    return checkpoint
+
+
+def shards(config):
+    """(first_deal, num_games) of every shard of the campaign, in deal order."""
+    first, stop, size = config['first_deal'], config['first_deal'] + config['num_games'], config['shard_size']
+    return [(start, min(size, stop - start)) for start in range(first, stop, size)]
+
+
+def run_campaign(path, num_games, first_deal=0, shard_size=1000, workers=None, max_moves=MAX_MOVES,
+                 max_shards=None):
+    """
+    Plays deals first_deal .. first_deal + num_games - 1 in shards of shard_size,
+    checkpointing to path after each shard and skipping shards already recorded
+    there. max_shards bounds the shards played by this call (None: all).
+    Returns (StatsAggregator over every completed shard, True if the campaign is finished).
+    """
+    if num_games <= 0 or shard_size <= 0:
+        raise ValueError("num_games and shard_size must be positive")
+    config = {'first_deal': first_deal, 'num_games': num_games, 'shard_size': shard_size, 'max_moves': max_moves}
+    checkpoint = load_checkpoint(path, config)
+    stats = StatsAggregator.from_dict(checkpoint['stats'])
+    pending = [shard for shard in shards(config)
+               if not _covered(checkpoint['completed'], shard[0], shard[0] + shard[1])]
+    if max_shards is not None:
+        pending = pending[:max_shards]
+
+    workers = workers or os.cpu_count() or 1
+    starts = [start for start, _ in pending]
+    sizes = [size for _, size in pending]
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 and len(pending) > 1 else None
+    try:
+        if pool is None:
+            results = map(play_stats, sizes, [max_moves] * len(pending), starts)
+        else:
+            results = pool.map(play_stats, sizes, [max_moves] * len(pending), starts)
+        # Results come back in shard order; the counters merge exactly in any order
+        for start, size, result in zip(starts, sizes, results):
+            stats.merge(result)
+            _add_range(checkpoint['completed'], start, start + size)
+            checkpoint['stats'] = stats.as_dict()
+            write_checkpoint(path, checkpoint)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    done = _covered(checkpoint['completed'], first_deal, first_deal + num_games)
+    return stats, done
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else 'campaign.json'
+    num_games = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    first_deal = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+    workers = int(sys.argv[4]) if len(sys.argv) > 4 else None
+    stats, done = run_campaign(path, num_games, first_deal=first_deal, workers=workers)
+    print(stats.report())
+    print("Campaign complete." if done else f"Campaign incomplete; rerun to resume from {path}.")
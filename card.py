@@ -1,16 +1,74 @@
-# Holds the Card class → properties like rank, suit, color, 
+# Holds the Card class → properties like rank, suit, color,
 # plus helpers (e.g., is_red(), __str__() for printing).
+# There is one shared Card object per card (CARDS); face-up state lives in Pile.
+
+RANKS = ['ace','2','3','4','5','6','7','8','9','10','jack','queen','king']
+SUITS = ['hearts', 'diamonds', 'clubs', 'spades']
+RED, BLACK = 0, 1
+
+RANK_INDEX = {rank: i for i, rank in enumerate(RANKS)}
+SUIT_INDEX = {suit: i for i, suit in enumerate(SUITS)}
+
+# Every card is an int code 0..51 laid out as suit * 13 + rank (the same order
+# Deck builds them in). Rule checks index these tables instead of comparing
+# strings: RANK_OF[code] is 0 (ace) .. 12 (king).
+RANK_OF = tuple(code % 13 for code in range(52))
+SUIT_OF = tuple(code // 13 for code in range(52))
+COLOR_OF = tuple(RED if code // 13 < 2 else BLACK for code in range(52))
+
+
+def card_code(rank, suit):
+    """Returns the int code of a card given its rank and suit names."""
+    return SUIT_INDEX[suit] * 13 + RANK_INDEX[rank]
+
 
 class Card:
-    # Intialize Card
-    def __init__(self, rank, suit, face_up=False):
-        self.rank = rank
-        self.suit = suit
-        self.face_up = face_up
+    """
+    One of the 52 cards. Cards are immutable and interned: Card('ace', 'spades')
+    and Card.from_code(39) return the same object, so games share them. Whether
+    a card is face up depends on where it lies and is kept by its Pile; the
+    face_up argument is still accepted for old callers and ignored. repr shows
+    only the rank and suit ('ace of spades'), no longer '(up)' / '(down)'.
+    """
+    __slots__ = ('code',)
+
+    # Return the shared card for a rank and suit
+    def __new__(cls, rank, suit, face_up=None):
+        return CARDS[card_code(rank, suit)]
+
+    # The shared card for an int code
+    @staticmethod
+    def from_code(code, face_up=None):
+        return CARDS[code]
 
-    # Flip card
-    def flip(self):
-        self.face_up = not self.face_up
+    def __setattr__(self, name, value):
+        raise AttributeError("Card objects are immutable")
+
+    def __reduce__(self):
+        return Card.from_code, (self.code,)
+
+    # String views over the int code
+    @property
+    def rank(self):
+        return RANKS[RANK_OF[self.code]]
+
+    @property
+    def suit(self):
+        return SUITS[SUIT_OF[self.code]]
+
+    @property
+    def color(self):
+        return 'red' if COLOR_OF[self.code] == RED else 'black'
 
     def __repr__(self):
-        return f"{self.rank} of {self.suit} ({'up' if self.face_up else 'down'})"
\ No newline at end of file
+        return f"{self.rank} of {self.suit}"
+
+
+def _make_card(code):
+    card = object.__new__(Card)
+    object.__setattr__(card, 'code', code)
+    return card
+
+
+# The 52 card singletons, indexed by code
+CARDS = tuple(_make_card(code) for code in range(52))
@@ -0,0 +1,192 @@
+# Cluster runner → spreads a campaign's shards over many hosts through a shared
+# directory. The coordinator writes one file per shard into pending/; workers on
+# any host claim a shard by renaming it into claimed/ (only one rename wins),
+# play it and write its StatsAggregator to results/. A claim older than the
+# lease is presumed dead and goes back to pending/. Results are keyed by shard,
+# so a shard played twice is still counted once.
+
+import json
+import os
+import socket
+import sys
+import time
+
+from batch import play_stats
+from campaign import VERSION, _add_range, shards, write_checkpoint
+from simulator import MAX_MOVES
+from stats import StatsAggregator
+
+PENDING = 'pending'
+CLAIMED = 'claimed'
+RESULTS = 'results'
+LEASE_SECONDS = 600.0   # must exceed the time one shard takes on the slowest worker
+
+
+def _shard_name(start, size):
+    # Zero-padded so a directory listing sorts in deal order
+    return f'{start:012d}-{size}'
+
+
+def _parse_shard(name):
+    start, size = name.split('-')
+    return int(start), int(size)
+
+
+def _listdir(directory, name):
+    return sorted(os.listdir(os.path.join(directory, name)))
+
+
+def _done_shards(directory):
+    return {name[:-len('.json')] for name in _listdir(directory, RESULTS) if name.endswith('.json')}
+
+
+def init_queue(directory, num_games, first_deal=0, shard_size=1000, max_moves=MAX_MOVES):
+    """
+    Sets up (or tops up) the queue in directory for deals first_deal ..
+    first_deal + num_games - 1: every shard without a result and not already
+    queued or claimed is put in pending/. Raises ValueError if directory holds
+    another campaign. Returns the campaign config.
+    """
+    if num_games <= 0 or shard_size <= 0:
+        raise ValueError("num_games and shard_size must be positive")
+    config = {'first_deal': first_deal, 'num_games': num_games, 'shard_size': shard_size, 'max_moves': max_moves}
+    for name in (PENDING, CLAIMED, RESULTS):
+        os.makedirs(os.path.join(directory, name), exist_ok=True)
+    path = os.path.join(directory, 'config.json')
+    if os.path.exists(path):
+        with open(path) as f:
+            existing = json.load(f)
+        if existing != {'version': VERSION, 'config': config}:
+            raise ValueError(f"{directory} holds a queue of a different campaign: {existing.get('config')}")
+    else:
+        write_checkpoint(path, {'version': VERSION, 'config': config})
+
+    known = _done_shards(directory) | set(_listdir(directory, PENDING)) | set(_listdir(directory, CLAIMED))
+    for start, size in shards(config):
+        name = _shard_name(start, size)
+        if name not in known:
+            open(os.path.join(directory, PENDING, name), 'w').close()
+    return config
+
+
+def load_config(directory):
+    with open(os.path.join(directory, 'config.json')) as f:
+        return json.load(f)['config']
+
+
+def requeue_expired(directory, lease=LEASE_SECONDS, now=None):
+    """
+    Moves claims older than lease seconds back to pending/ (their worker is
+    presumed dead) and drops claims whose shard already has a result.
+    Returns the names of the shards requeued.
+    """
+    now = time.time() if now is None else now
+    done = _done_shards(directory)
+    requeued = []
+    for name in _listdir(directory, CLAIMED):
+        path = os.path.join(directory, CLAIMED, name)
+        try:
+            if name in done:
+                os.unlink(path)
+            elif now - os.stat(path).st_mtime > lease:
+                os.rename(path, os.path.join(directory, PENDING, name))
+                requeued.append(name)
+        except FileNotFoundError:
+            pass   # another worker got there first
+    return requeued
+
+
+def claim(directory):
+    """Claims the lowest pending shard. Returns its name, or None when nothing is pending."""
+    for name in _listdir(directory, PENDING):
+        path = os.path.join(directory, CLAIMED, name)
+        try:
+            os.rename(os.path.join(directory, PENDING, name), path)
+        except FileNotFoundError:
+            continue   # claimed by another worker between the listing and the rename
+        # rename keeps the old mtime; the lease starts now
+        os.utime(path)
+        return name
+    return None
+
+
+def work(directory, lease=LEASE_SECONDS, max_shards=None, worker_id=None):
+    """
+    Claims and plays shards until nothing is pending and no claim has expired
+    (or max_shards were played), writing each shard's StatsAggregator to
+    results/. Returns the number of shards this worker played.
+    """
+    config = load_config(directory)
+    worker_id = worker_id or f'{socket.gethostname()}-{os.getpid()}'
+    played = 0
+    while max_shards is None or played < max_shards:
+        name = claim(directory)
+        if name is None:
+            if not requeue_expired(directory, lease):
+                break
+            continue
+        start, size = _parse_shard(name)
+        stats = play_stats(size, config['max_moves'], start)
+        write_checkpoint(os.path.join(directory, RESULTS, name + '.json'),
+                         {'version': VERSION, 'worker': worker_id, 'stats': stats.as_dict()})
+        try:
+            os.unlink(os.path.join(directory, CLAIMED, name))
+        except FileNotFoundError:
+            pass   # our lease expired and someone else requeued or replayed the shard
+        played += 1
+    return played
+
+
+def collect(directory, checkpoint=None):
+    """
+    Merges the results of every finished shard, once each. With checkpoint, also
+    writes a campaign checkpoint there that campaign.run_campaign can resume.
+    Returns (StatsAggregator, True if every shard is finished).
+    """
+    config = load_config(directory)
+    stats = StatsAggregator(config['max_moves'])
+    completed = []
+    done = _done_shards(directory)
+    for start, size in shards(config):
+        name = _shard_name(start, size)
+        if name not in done:
+            continue
+        with open(os.path.join(directory, RESULTS, name + '.json')) as f:
+            stats.merge(StatsAggregator.from_dict(json.load(f)['stats']))
+        _add_range(completed, start, start + size)
+    if checkpoint is not None:
+        write_checkpoint(checkpoint, {'version': VERSION, 'config': config, 'completed': completed,
+                                      'stats': stats.as_dict()})
+    finished = len(completed) == 1 and completed[0] == [config['first_deal'],
+                                                        config['first_deal'] + config['num_games']]
+    return stats, finished
+
+
+def status(directory):
+    """Shard counts: {'pending': n, 'claimed': n, 'done': n}."""
+    return {'pending': len(_listdir(directory, PENDING)), 'claimed': len(_listdir(directory, CLAIMED)),
+            'done': len(_done_shards(directory))}
+
+
+if __name__ == "__main__":
+    usage = ("usage: cluster.py init DIR NUM_GAMES [FIRST_DEAL] [SHARD_SIZE]\n"
+             "       cluster.py work DIR [LEASE_SECONDS]\n"
+             "       cluster.py collect DIR [CHECKPOINT]")
+    if len(sys.argv) < 3:
+        sys.exit(usage)
+    command, directory = sys.argv[1], sys.argv[2]
+    if command == 'init':
+        num_games = int(sys.argv[3]) if len(sys.argv) > 3 else 100000
+        first_deal = int(sys.argv[4]) if len(sys.argv) > 4 else 0
+        shard_size = int(sys.argv[5]) if len(sys.argv) > 5 else 1000
+        init_queue(directory, num_games, first_deal=first_deal, shard_size=shard_size)
+        print(status(directory))
+    elif command == 'work':
+        lease = float(sys.argv[3]) if len(sys.argv) > 3 else LEASE_SECONDS
+        print(f"Played {work(directory, lease=lease)} shard(s).")
+    elif command == 'collect':
+        stats, finished = collect(directory, sys.argv[3] if len(sys.argv) > 3 else None)
+        print(stats.report())
+        print("Campaign complete." if finished else f"Campaign incomplete: {status(directory)}")
+    else:
+        sys.exit(usage)
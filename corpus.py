@@ -0,0 +1,179 @@
+# Deal corpus → a flat binary file of fixed 64-byte records, one per deal: the
+# 52 card codes in deal order followed by that deal's result. Workers mmap the
+# file and read deals / write results in place by record index, so nothing is
+# pickled through the pool and no results are held in memory.
+
+import mmap
+import os
+import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from batch import split
+from deck import Deck
+from game import SolitaireGame
+from simulator import SolitaireSimulator, MAX_MOVES, OUTCOMES
+
+# Record layout (little-endian):
+#   0..51  deal: card codes in deck order (first code is dealt first)
+#   52     outcome: 0 = not played yet, else OUTCOMES index + 1
+#   53     score: cards on the foundations (SolitaireSimulator.get_score)
+#   54     stock passes
+#   55     reserved
+#   56..59 moves made (uint32)
+#   60..63 padding
+DEAL_SIZE = 52
+RESULT = struct.Struct('<BBBxI4x')
+RECORD_SIZE = DEAL_SIZE + RESULT.size  # 64
+
+
+def record_dtype():
+    """numpy dtype of one record, for numpy.memmap(path, dtype=record_dtype())."""
+    import numpy as np  # optional: only needed for array access
+    return np.dtype([('deal', 'u1', DEAL_SIZE), ('outcome', 'u1'), ('score', 'u1'),
+                     ('stock_passes', 'u1'), ('reserved', 'u1'), ('moves', '<u4'),
+                     ('padding', 'V4')])
+
+
+class Corpus:
+    """
+    A memory-mapped corpus file. deal(i) is a zero-copy view of record i's cards;
+    write_result/result pack and unpack the result fields in place.
+    """
+
+    # Initialize Corpus (writable unless readonly)
+    def __init__(self, path, readonly=False):
+        self.path = path
+        self.file = open(path, 'rb' if readonly else 'r+b')
+        size = os.fstat(self.file.fileno()).st_size
+        if size % RECORD_SIZE:
+            self.file.close()
+            raise ValueError(f"{path} is {size} bytes, not a whole number of {RECORD_SIZE}-byte records")
+        self.count = size // RECORD_SIZE
+        if self.count:
+            access = mmap.ACCESS_READ if readonly else mmap.ACCESS_WRITE
+            self.map = mmap.mmap(self.file.fileno(), 0, access=access)
+            self.view = memoryview(self.map)
+        else:
+            self.map = None
+            self.view = memoryview(b'')
+
+    @classmethod
+    def create(cls, path, num_deals, first_deal=0):
+        """Writes a corpus of deal numbers first_deal .. first_deal + num_deals - 1 and opens it."""
+        record = bytearray(RECORD_SIZE)
+        with open(path, 'wb') as f:
+            for deal in range(first_deal, first_deal + num_deals):
+                record[:DEAL_SIZE] = bytes(card.code for card in Deck(deal).cards)
+                f.write(record)
+        return cls(path)
+
+    def __len__(self):
+        return self.count
+
+    def deal(self, i):
+        """
+        Card codes of deal i in deck order, as a memoryview into the map.
+        Drop or release() it before closing the corpus.
+        """
+        if not 0 <= i < self.count:
+            raise IndexError(f"record {i} out of range")
+        base = i * RECORD_SIZE
+        return self.view[base:base + DEAL_SIZE]
+
+    def game(self, i):
+        """A fresh SolitaireGame dealt from record i."""
+        return SolitaireGame(deck=Deck.from_codes(self.deal(i)))
+
+    def write_result(self, i, outcome, moves, score, stock_passes):
+        if not 0 <= i < self.count:
+            raise IndexError(f"record {i} out of range")
+        RESULT.pack_into(self.map, i * RECORD_SIZE + DEAL_SIZE,
+                         OUTCOMES.index(outcome) + 1, score, stock_passes, moves)
+
+    def result(self, i):
+        """Result dict of record i (same keys as SolitaireSimulator.get_result), or None if unplayed."""
+        if not 0 <= i < self.count:
+            raise IndexError(f"record {i} out of range")
+        outcome, score, stock_passes, moves = RESULT.unpack_from(self.view, i * RECORD_SIZE + DEAL_SIZE)
+        if outcome == 0:
+            return None
+        return {'outcome': OUTCOMES[outcome - 1], 'moves': moves, 'score': score, 'stock_passes': stock_passes}
+
+    def flush(self):
+        if self.map is not None and not self.map.closed:
+            self.map.flush()
+
+    def close(self):
+        if self.map is not None and not self.map.closed:
+            self.view.release()
+            self.map.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def play_range(path, start, stop, max_moves=MAX_MOVES):
+    """Plays records start .. stop - 1 of a corpus and stores their results. Returns the count."""
+    with Corpus(path) as corpus:
+        for i in range(start, stop):
+            simulator = SolitaireSimulator(verbose=False, max_moves=max_moves, game=corpus.game(i))
+            simulator.run_simulation()
+            corpus.write_result(i, simulator.outcome, simulator.moves_made,
+                                simulator.get_score(), simulator.game.stock_passes)
+        corpus.flush()
+    return stop - start
+
+
+def run_corpus(path, workers=None, chunk_size=None, max_moves=MAX_MOVES):
+    """
+    Plays every deal of a corpus file across a process pool. Workers get only
+    (path, start, stop) and write results straight into the file.
+    Returns (games, elapsed).
+    """
+    with Corpus(path, readonly=True) as corpus:
+        total = len(corpus)
+    if total == 0:
+        return 0, 0.0
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, total // (workers * 4))
+
+    starts = list(range(0, total, chunk_size))
+    stops = [start + size for start, size in zip(starts, split(total, chunk_size))]
+    begin = time.perf_counter()
+    if workers == 1:
+        games = sum(play_range(path, start, stop, max_moves) for start, stop in zip(starts, stops))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            games = sum(pool.map(play_range, [path] * len(starts), starts, stops,
+                                 [max_moves] * len(starts)))
+    return games, time.perf_counter() - begin
+
+
+def summarize(path):
+    """Outcome counts over the played records of a corpus, read straight from the file."""
+    counts = dict.fromkeys(OUTCOMES, 0)
+    with Corpus(path, readonly=True) as corpus:
+        for i in range(len(corpus)):
+            result = corpus.result(i)
+            if result is not None:
+                counts[result['outcome']] += 1
+    return counts
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else 'deals.bin'
+    num_deals = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    if not os.path.exists(path):
+        Corpus.create(path, num_deals).close()
+    games, elapsed = run_corpus(path, workers=workers)
+    print(f"--- Played {games} deals from {path} in {elapsed:.2f}s ---")
+    for outcome, count in summarize(path).items():
+        print(f"  {outcome:<11} {count}")
@@ -1,35 +1,56 @@
 
-# Holds the Deck class → creates 52 Card objects, shuffles, 
+# Holds the Deck class → shuffles the 52 shared Card objects, 
 # or sets up a special test order. Exposes draw() to pull cards.
 
 import random
-from card import Card
+from card import CARDS
 
 class Deck:
-    # Initialize Deck
-    def __init__(self):
-        suits = ['hearts', 'diamonds', 'clubs', 'spades']
-        ranks = ['ace','2','3','4','5','6','7','8','9','10','jack','queen','king']
-        self.cards = [Card(rank, suit) for suit in suits for rank in ranks]
+    cursor = 0  # index of the next card to deal; cards before it are gone
+
+    # Initialize Deck. The shuffle uses a private generator seeded with seed (e.g. a
+    # deal number), so the same seed always gives the same deal in any process.
+    # Without a seed one is drawn from the global random module and kept in self.seed.
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.cards = list(CARDS)
+        self.cursor = 0
         self.shuffle()
 
+    # Build an already-shuffled deck from card codes in deal order (e.g. a corpus record).
+    # It has no seed; a later shuffle() draws from an unseeded generator.
+    @classmethod
+    def from_codes(cls, codes):
+        deck = cls.__new__(cls)
+        deck.seed = None
+        deck.rng = random.Random()
+        deck.cards = [CARDS[code] for code in codes]
+        deck.cursor = 0
+        return deck
+
     # Shuffle Cards according to algorithm assigned
     def shuffle(self):
         n = len(self.cards)
         for i in range(n - 1, 0, -1):
-            j = random.randint(0, i)
+            j = self.rng.randint(0, i)
             self.cards[i], self.cards[j] = self.cards[j], self.cards[i]
 
     # Reset cards for new game
     def reset(self):
-        suits = ['hearts', 'diamonds', 'clubs', 'spades']
-        ranks = ['ace','2','3','4','5','6','7','8','9','10','jack','queen','king']
-        self.cards = [Card(rank, suit) for suit in suits for rank in ranks]
+        self.cards = list(CARDS)
+        self.cursor = 0
 
-    # Draw next card
+    # Draw next n cards by advancing the cursor (the rest of the list is not copied)
     def draw(self, n=1):
-        drawn_cards = self.cards[:n]
-        self.cards = self.cards[n:]
+        drawn_cards = self.cards[self.cursor:self.cursor + n]
+        self.cursor += len(drawn_cards)
         return drawn_cards
 
+    # Cards not dealt yet, in deal order
+    def remaining(self):
+        return self.cards[self.cursor:]
+
 
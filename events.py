@@ -0,0 +1,110 @@
+# Event sinks → where SolitaireSimulator reports its moves. Every report is an
+# event name plus plain fields (ints and strings); NullSink drops them, ConsoleSink
+# prints the classic one-line messages and JsonlSink writes JSON lines in blocks.
+
+import json
+
+from card import RANKS, RANK_OF
+
+
+class NullSink:
+    """Discards every event. Used for benchmarks and batch runs."""
+
+    def emit(self, event, **fields):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class ConsoleSink:
+    """Prints each event as a human-readable line."""
+
+    # Message templates; card fields are codes and are shown by rank name
+    FORMATS = {
+        'start': "--- Starting Solitaire Simulation ---",
+        'draw': "[{move:03d}] Stock Draw.",
+        'draw_pass': "[{move:03d}] Stock Draw (Pass {passes})",
+        'waste_to_foundation': "[{move:03d}] Waste ({rank}) -> Foundation {foundation}",
+        'tableau_to_foundation': "[{move:03d}] Tableau {tableau} ({rank}) -> Foundation {foundation}",
+        'tableau_to_tableau': "[{move:03d}] Tableau {src} -> Tableau {dest} (Sequence of {count})",
+        'waste_to_tableau': "[{move:03d}] Waste ({rank}) -> Tableau {tableau}",
+        'blocked': "[BLOCKED] Tableau {src} -> Tableau {dest}: Preventing direct cycle reversal.",
+        'cycle': "[CYCLE] Tableau {src} -> Tableau {dest}: Position already seen.",
+        'win': "\n✨ WIN! Game completed in {moves} moves.",
+        'max_passes': "\n❌ LOSS: Max passes (3) reached. Game ended after {moves} moves.",
+        'move_limit': "\n❌ LOSS: Move limit ({max_moves}) reached. Game stopped after {moves} moves.",
+        'blocked_end': "\n❌ LOSS: Game blocked. No moves possible. Ended after {moves} moves.",
+    }
+
+    # Initialize ConsoleSink
+    def __init__(self, stream=None):
+        self.stream = stream  # None means sys.stdout at the time of printing
+
+    def format(self, event, fields):
+        if event == 'end':
+            outcome = fields['outcome']
+            event = 'blocked_end' if outcome == 'blocked' else outcome
+        elif event == 'draw' and fields.get('new_pass'):
+            event = 'draw_pass'
+        if 'card' in fields:
+            fields = dict(fields, rank=RANKS[RANK_OF[fields['card']]])
+        return self.FORMATS[event].format(**fields)
+
+    def emit(self, event, **fields):
+        print(self.format(event, fields), file=self.stream)
+
+    def flush(self):
+        if self.stream is not None:
+            self.stream.flush()
+
+    def close(self):
+        self.flush()
+
+
+class JsonlSink:
+    """
+    Writes one JSON object per event ({"event": name, **fields}), buffering
+    block_size lines between writes. Accepts a path or an open text file;
+    a path is opened for appending and closed by close().
+    """
+
+    # Initialize JsonlSink
+    def __init__(self, target, block_size=1000, **context):
+        if isinstance(target, str):
+            self.file = open(target, 'a', encoding='utf-8')
+            self.owns_file = True
+        else:
+            self.file = target
+            self.owns_file = False
+        self.block_size = block_size
+        self.context = context  # extra fields added to every record, e.g. game=17
+        self.lines = []
+
+    def emit(self, event, **fields):
+        record = {'event': event}
+        record.update(self.context)
+        record.update(fields)
+        self.lines.append(json.dumps(record))
+        if len(self.lines) >= self.block_size:
+            self.flush()
+
+    def flush(self):
+        if self.lines:
+            self.file.write('\n'.join(self.lines) + '\n')
+            self.lines = []
+        self.file.flush()
+
+    def close(self):
+        self.flush()
+        if self.owns_file:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -1,89 +1,363 @@
 # The SolitaireGame engine. Deals the initial layout, enforces rules for moving cards, 
 # manages passes through the stock, checks for win/loss.
 
+from card import RANK_OF, SUIT_OF, COLOR_OF
 from deck import Deck
-from pile import Pile  # optional if Pile is in a separate file
+from pile import Pile, MAX_PILE, MAX_STOCK  # optional if Pile is in a separate file
+import zobrist
+from zobrist import TABLEAU, FACE_UP, STOCK, WASTE, FOUNDATION, PASSES
+
+# Move records. Every mutator returns a tuple (kind, args..., hash before the move),
+# or None when it changed nothing; SolitaireGame.undo(record) reverses it.
+#   (DRAW, recycled, hash)              a card went from stock to waste
+#   (PASS_LIMIT, hash)                  no card drawn: the pass limit ended the game
+#   (TABLEAU_TO_TABLEAU, src, dest, n, hash)
+#   (TABLEAU_TO_FOUNDATION, tableau, foundation, hash)
+#   (WASTE_TO_TABLEAU, tableau, hash)
+#   (WASTE_TO_FOUNDATION, foundation, hash)
+#   (FLIP, tableau, hash)
+DRAW, PASS_LIMIT, TABLEAU_TO_TABLEAU, TABLEAU_TO_FOUNDATION, WASTE_TO_TABLEAU, WASTE_TO_FOUNDATION, FLIP = range(7)
+
+# Card locations kept in SolitaireGame.location: tableau piles are 0..6, then
+IN_TALON = 7         # stock or waste (draws move cards between them without relocating)
+IN_FOUNDATION = 8
+# SAFE_NEEDS[code]: bitmask of the opposite-color cards one rank lower. Once they
+# are all home nothing can be placed on code any more, so playing it home is safe.
+SAFE_NEEDS = tuple(
+    0 if RANK_OF[code] <= 1 else
+    sum(1 << other for other in range(52)
+        if RANK_OF[other] == RANK_OF[code] - 1 and COLOR_OF[other] != COLOR_OF[code])
+    for code in range(52))
+
+# Move kinds, named after the SolitaireGame method that plays them, in greedy priority order
+MOVE_ORDER = ('move_waste_to_foundation', 'move_tableau_to_foundation', 'move_tableau_to_tableau',
+              'move_waste_to_tableau', 'draw_from_stock')
+
+
+class Move(tuple):
+    """
+    A legal move: the (method name, *args) tuple that strategies and
+    solver.apply_move use, so it compares equal to the plain tuple.
+    """
+    __slots__ = ()
+    recycle = False
+
+    def __new__(cls, name, *args):
+        return tuple.__new__(cls, (name,) + args)
+
+    def __getnewargs__(self):
+        return tuple(self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}{tuple.__repr__(self)}"
+
+    @property
+    def name(self):
+        return self[0]
+
+    @property
+    def args(self):
+        return self[1:]
+
+
+class Recycle(Move):
+    """The stock draw when the stock is empty: the waste is turned over first."""
+    __slots__ = ()
+    recycle = True
+
 
 class SolitaireGame:
-    # Initialize SolitaireGame
-    def __init__(self):
+    # Initialize SolitaireGame (seed picks the deal, see Deck; or deal a given Deck)
+    def __init__(self, seed=None, deck=None):
         # Shuffle Deck
-        self.deck = Deck()
-        self.deck.shuffle()
+        self.deck = deck if deck is not None else Deck(seed)
+        self.seed = self.deck.seed
 
         # Add cards to all 7 tableau piles
         self.tableau = [Pile() for _ in range(7)]
         for i, pile in enumerate(self.tableau):
-            cards_to_add = self.deck.draw(i + 1)
-            for card in cards_to_add[:-1]:
-                card.face_up = False
-            cards_to_add[-1].face_up = True
-            pile.add_multiple(cards_to_add)
+            pile.add_multiple(self.deck.draw(i + 1))
+            pile.face_down = i  # only the top card is dealt face up
 
         # Initialize foundations piles
         self.foundations = [Pile() for _ in range(4)]
 
-        # Initialize stock pile
-        self.stock = Pile(self.deck.cards)
-        for card in self.stock.cards:
-            card.face_up = False
+        # Initialize stock pile. The top of a pile is the end of its list, so the
+        # rest of the deck goes in reversed to be drawn in deal order. Stock
+        # cards are always face down and waste cards face up.
+        self.stock = Pile(self.deck.remaining()[::-1])
         self.waste = Pile()
 
         # Initialize pass counter and loss flag
         self.stock_passes = 0
         self.max_passes_reached = False
 
-    # Drawing from stock pile
+        self._build_index()
+        # 64-bit Zobrist hash of the position, updated by every move method
+        self.hash = zobrist.hash_game(self)
+
+    # Build a game from existing piles instead of dealing a fresh deck
+    @classmethod
+    def from_piles(cls, tableau, foundations, stock, waste, stock_passes=0, max_passes_reached=False):
+        game = cls.__new__(cls)
+        game.deck = None
+        game.seed = None
+        game.tableau = tableau
+        game.foundations = foundations
+        game.stock = stock
+        game.waste = waste
+        game.stock_passes = stock_passes
+        game.max_passes_reached = max_passes_reached
+        game._build_index()
+        game.hash = zobrist.hash_game(game)
+        return game
+
+    # Drawing from stock pile. Returns a DRAW record when a card was drawn.
     def draw_from_stock(self):
+        old_hash = self.hash
+        recycled = 0
         # If stock is empty
         if len(self.stock.cards) == 0:
             
             # Check if the maximum number of passes (3) has been reached
             if self.stock_passes >= 3:
+                if self.max_passes_reached:
+                    return None # Already lost, nothing changes
+                self.hash ^= zobrist.LOST
                 self.max_passes_reached = True
-                return False # Cannot draw anymore
+                return (PASS_LIMIT, old_hash) # Cannot draw anymore
 
             if len(self.waste.cards) > 0:
-                self.stock.cards = self.waste.cards.copy()
-                for card in self.stock.cards:
-                    card.face_up = False
+                # Turn the waste over: its first card becomes the top of the stock
+                for i, card in enumerate(self.waste.cards):
+                    self.hash ^= WASTE[card.code * MAX_STOCK + i]
+                self.stock.cards = self.waste.cards[::-1]
+                for i, card in enumerate(self.stock.cards):
+                    self.hash ^= STOCK[card.code * MAX_STOCK + i]
                 self.waste.cards = []
                 # Increment the pass counter when recycling
+                self.hash ^= PASSES[self.stock_passes] ^ PASSES[self.stock_passes + 1]
                 self.stock_passes += 1
+                recycled = 1
             else:
                 # Stock and Waste are both empty - nothing to do
-                return False # Changed from 'return' to 'return False' for clarity
+                return None
 
         if len(self.stock.cards) > 0:
-            # card = self.stock.draw()[0] # Old line
-            # card.flip()                  # Old line
-            # self.waste.add(card)        # Old line
-            card = self.stock.draw()[0] 
-            card.flip()
+            card = self.stock.pop()
+            self.hash ^= STOCK[card.code * MAX_STOCK + len(self.stock.cards)] \
+                ^ WASTE[card.code * MAX_STOCK + len(self.waste.cards)]
             self.waste.add(card)
-            return True # Indicate a successful draw
+            return (DRAW, recycled, old_hash) # Indicate a successful draw
         
-        # Return False if we reached max passes and failed to draw
-        return False
+        # Return None if we reached max passes and failed to draw
+        return None
 
 
+    # Every move below keeps the move index and the position hash in step
+    # with the piles it touches, and returns its move record.
     def move_tableau_to_tableau(self, src_index, dest_index, num_cards):
-        moving_cards = self.tableau[src_index].draw(num_cards)
+        record = (TABLEAU_TO_TABLEAU, src_index, dest_index, num_cards, self.hash)
+        self.hash = self.tableau_move_hash(src_index, dest_index, num_cards, flip=False)
+        moving_cards = self.tableau[src_index].take_top(num_cards)
         self.tableau[dest_index].add_multiple(moving_cards)
+        location = self.location
+        for card in moving_cards:
+            location[card.code] = dest_index
+        self._index_pile(src_index)
+        self._index_pile(dest_index)
+        return record
 
     def move_tableau_to_foundation(self, tableau_index, foundation_index):
-        card = self.tableau[tableau_index].draw()[0]
+        record = (TABLEAU_TO_FOUNDATION, tableau_index, foundation_index, self.hash)
+        pile = self.tableau[tableau_index]
+        if pile.face_down < len(pile.cards):
+            self.hash ^= FACE_UP[pile.cards[-1].code]
+        card = pile.pop()
+        self.hash ^= TABLEAU[(card.code * 7 + tableau_index) * MAX_PILE + len(pile.cards)] \
+            ^ FOUNDATION[card.code]
         self.foundations[foundation_index].add(card)
+        self._play_home(card.code)
+        self._index_pile(tableau_index)
+        self._index_foundation(foundation_index)
+        return record
 
     def move_waste_to_tableau(self, tableau_index):
         if len(self.waste.cards) > 0:
-            card = self.waste.draw()[0]
+            record = (WASTE_TO_TABLEAU, tableau_index, self.hash)
+            card = self.waste.pop()
+            self.hash ^= WASTE[card.code * MAX_STOCK + len(self.waste.cards)] \
+                ^ TABLEAU[(card.code * 7 + tableau_index) * MAX_PILE + len(self.tableau[tableau_index].cards)] \
+                ^ FACE_UP[card.code]
             self.tableau[tableau_index].add(card)
+            self.location[card.code] = tableau_index
+            self.talon_mask &= ~(1 << card.code)
+            self._index_pile(tableau_index)
+            return record
+        return None
 
     def move_waste_to_foundation(self, foundation_index):
         if len(self.waste.cards) > 0:
-            card = self.waste.draw()[0]
+            record = (WASTE_TO_FOUNDATION, foundation_index, self.hash)
+            card = self.waste.pop()
+            self.hash ^= WASTE[card.code * MAX_STOCK + len(self.waste.cards)] ^ FOUNDATION[card.code]
             self.foundations[foundation_index].add(card)
+            self.talon_mask &= ~(1 << card.code)
+            self._play_home(card.code)
+            self._index_foundation(foundation_index)
+            return record
+        return None
+
+    def flip_top_tableau_card(self, pile_index):
+        """Flip the top card of a tableau pile if it exists and is face down. Returns a FLIP record, or None."""
+        pile = self.tableau[pile_index]
+        if pile.cards and pile.face_down == len(pile.cards):
+            record = (FLIP, pile_index, self.hash)
+            pile.face_down -= 1
+            self.hash ^= FACE_UP[pile.cards[-1].code]
+            return record
+        return None
+
+    def undo(self, record):
+        """
+        Reverses the move that returned record, restoring piles, face-down counts,
+        stock_passes, max_passes_reached, the move index and the hash. Records
+        must be undone newest first.
+        """
+        kind = record[0]
+        if kind == DRAW:
+            self.stock.add(self.waste.pop())
+            if record[1]:
+                # Put the recycled waste back in its old order
+                self.waste.cards = self.stock.cards[::-1]
+                self.stock.cards = []
+                self.stock_passes -= 1
+        elif kind == PASS_LIMIT:
+            self.max_passes_reached = False
+        elif kind == TABLEAU_TO_TABLEAU:
+            _, src_index, dest_index, num_cards, _ = record
+            moving_cards = self.tableau[dest_index].take_top(num_cards)
+            self.tableau[src_index].add_multiple(moving_cards)
+            for card in moving_cards:
+                self.location[card.code] = src_index
+            self._index_pile(src_index)
+            self._index_pile(dest_index)
+        elif kind == TABLEAU_TO_FOUNDATION:
+            _, tableau_index, foundation_index, _ = record
+            card = self.foundations[foundation_index].pop()
+            self.tableau[tableau_index].add(card)
+            self._unplay_home(card.code, tableau_index)
+            self._index_pile(tableau_index)
+            self._index_foundation(foundation_index)
+        elif kind == WASTE_TO_TABLEAU:
+            card = self.tableau[record[1]].pop()
+            self.waste.add(card)
+            self.location[card.code] = IN_TALON
+            self.talon_mask |= 1 << card.code
+            self._index_pile(record[1])
+        elif kind == WASTE_TO_FOUNDATION:
+            card = self.foundations[record[1]].pop()
+            self.waste.add(card)
+            self._unplay_home(card.code, IN_TALON)
+            self.talon_mask |= 1 << card.code
+            self._index_foundation(record[1])
+        elif kind == FLIP:
+            self.tableau[record[1]].face_down += 1
+        else:
+            raise ValueError(f"Unknown move record {record!r}")
+        self.hash = record[-1]
+
+    def tableau_move_hash(self, src_index, dest_index, num_cards, flip=True):
+        """
+        Hash the position would have after moving the top num_cards of one tableau
+        pile onto another (and, with flip=True, turning up the exposed card),
+        without making the move.
+        """
+        h = self.hash
+        src_pile = self.tableau[src_index]
+        src = src_pile.cards
+        start = len(src) - num_cards
+        dest_len = len(self.tableau[dest_index].cards)
+        for offset in range(num_cards):
+            code = src[start + offset].code
+            h ^= TABLEAU[(code * 7 + src_index) * MAX_PILE + start + offset] \
+                ^ TABLEAU[(code * 7 + dest_index) * MAX_PILE + dest_len + offset]
+        if flip and start > 0 and src_pile.face_down >= start:
+            h ^= FACE_UP[src[start - 1].code]
+        return h
+
+    def iter_legal_moves(self, order=MOVE_ORDER):
+        """
+        Lazily yields every move the rules allow as Move tuples, grouped by kind in
+        the given order (a sequence of MOVE_ORDER names; default: the greedy
+        priority). Within a kind: foundation moves by pile, tableau to tableau by
+        source, longest run first, then destination, waste to tableau by
+        destination. Aces are offered only the first empty foundation. The draw is
+        a Recycle when it turns the waste over first; it is offered while the stock
+        or waste has cards, and always once three passes are used up, since it then
+        ends the game as draw_from_stock does. Stop iterating at any point: nothing
+        past the moves taken is examined.
+        """
+        generators = []
+        for name in order:
+            if name not in MOVE_ORDER:
+                raise ValueError(f"Unknown move kind {name!r}")
+            generators.append(getattr(self, '_moves_' + name.removeprefix('move_')))
+        return (move for generate in generators for move in generate())
+
+    def legal_moves(self):
+        """Every legal move, as a list in the default iter_legal_moves order."""
+        return list(self.iter_legal_moves())
+
+    def is_legal(self, move):
+        """True if the (method name, *args) tuple is a legal move right now."""
+        return move[0] in MOVE_ORDER and move in self.iter_legal_moves((move[0],))
+
+    def _moves_waste_to_foundation(self):
+        waste = self.waste.cards
+        if waste:
+            i = self.foundation_destination(waste[-1])
+            if i is not None:
+                yield Move('move_waste_to_foundation', i)
+
+    def _moves_tableau_to_foundation(self):
+        for i, pile in enumerate(self.tableau):
+            if pile.face_down < len(pile.cards):
+                j = self.foundation_destination(pile.cards[-1])
+                if j is not None:
+                    yield Move('move_tableau_to_foundation', i, j)
+
+    def _moves_tableau_to_tableau(self):
+        for src, pile in enumerate(self.tableau):
+            cards = pile.cards
+            for start in range(pile.face_down, len(cards)):
+                dests = self.tableau_destinations(cards[start]) & ~(1 << src)
+                while dests:
+                    dest = lowest_bit(dests)
+                    dests &= dests - 1
+                    yield Move('move_tableau_to_tableau', src, dest, len(cards) - start)
+
+    def _moves_waste_to_tableau(self):
+        waste = self.waste.cards
+        if waste:
+            dests = self.tableau_destinations(waste[-1])
+            while dests:
+                dest = lowest_bit(dests)
+                dests &= dests - 1
+                yield Move('move_waste_to_tableau', dest)
+
+    def _moves_draw_from_stock(self):
+        """
+        A draw, a recycle of the waste, or, once the passes are used up, the one
+        terminating draw that records the pass limit (is_lost() turns True, so
+        strategies end on 'max_passes' like the greedy loop). Nothing after that.
+        """
+        if self.stock.cards:
+            yield Move('draw_from_stock')
+        elif self.waste.cards and self.stock_passes < 3:
+            yield Recycle('draw_from_stock')
+        elif self.stock_passes >= 3 and not self.max_passes_reached:
+            yield Move('draw_from_stock')
 
     def is_won(self):
         return all(len(f.cards) == 13 for f in self.foundations)
@@ -116,11 +390,164 @@ class SolitaireGame:
         return self.can_place_tableau(cards[0], dest_pile)
 
     def is_alternate_color(self, card1, card2):
-        red = {'hearts', 'diamonds'}
-        black = {'clubs', 'spades'}
-        return (card1.suit in red and card2.suit in black) or \
-            (card1.suit in black and card2.suit in red)
+        return COLOR_OF[card1.code] != COLOR_OF[card2.code]
 
     def is_one_rank_lower(self, card1, card2):
-        order = ['ace','2','3','4','5','6','7','8','9','10','jack','queen','king']
-        return order.index(card1.rank) == order.index(card2.rank) - 1
+        return RANK_OF[card1.code] == RANK_OF[card2.code] - 1
+
+    # --- Move index ---
+    # Maps the card a destination needs to the piles that take it, so finding a
+    # legal move for a card is a lookup instead of a scan over all piles.
+
+    def _build_index(self):
+        # _accepting[rank * 2 + color] is a bitmask of tableau piles whose top card takes that card
+        self._accepting = [0] * 26
+        self._pile_need = [None] * 7
+        self._empty_piles = 0
+        # Foundation holding each suit, and a bitmask of empty foundations (for aces)
+        self._suit_slot = [None] * 4
+        self._empty_foundations = 0
+        for i in range(len(self.tableau)):
+            self._index_pile(i)
+        for i in range(len(self.foundations)):
+            self._index_foundation(i)
+
+        # Card tracking: cards home per suit, a 52-bit mask of the cards home
+        # (bit = card code), the cards still in stock or waste, and each card's location
+        self.heights = [0] * 4
+        self.played = 0
+        self.talon_mask = 0
+        self.location = bytearray(52)
+        for i, pile in enumerate(self.tableau):
+            for card in pile.cards:
+                self.location[card.code] = i
+        for pile in (self.stock, self.waste):
+            for card in pile.cards:
+                self.location[card.code] = IN_TALON
+                self.talon_mask |= 1 << card.code
+        for foundation in self.foundations:
+            for card in foundation.cards:
+                self._play_home(card.code)
+
+    def _play_home(self, code):
+        self.heights[SUIT_OF[code]] += 1
+        self.played |= 1 << code
+        self.location[code] = IN_FOUNDATION
+
+    def _unplay_home(self, code, location):
+        self.heights[SUIT_OF[code]] -= 1
+        self.played &= ~(1 << code)
+        self.location[code] = location
+
+    def _index_pile(self, i):
+        need = self._pile_need[i]
+        if need is not None:
+            self._accepting[need] &= ~(1 << i)
+        cards = self.tableau[i].cards
+        if not cards:
+            self._pile_need[i] = None
+            self._empty_piles |= 1 << i
+            return
+        self._empty_piles &= ~(1 << i)
+        top = cards[-1].code
+        if RANK_OF[top] == 0:
+            need = None  # nothing goes on an ace
+        else:
+            need = (RANK_OF[top] - 1) * 2 + 1 - COLOR_OF[top]
+            self._accepting[need] |= 1 << i
+        self._pile_need[i] = need
+
+    def _index_foundation(self, i):
+        cards = self.foundations[i].cards
+        if cards:
+            self._suit_slot[SUIT_OF[cards[-1].code]] = i
+            self._empty_foundations &= ~(1 << i)
+        else:
+            self._empty_foundations |= 1 << i
+
+    def tableau_destinations(self, card):
+        """Bitmask of the tableau piles card can be placed on (bit i is pile i)."""
+        code = card.code
+        return self._accepting[RANK_OF[code] * 2 + COLOR_OF[code]] | self._empty_piles
+
+    def foundation_destination(self, card):
+        """Index of the first foundation that accepts card, or None."""
+        code = card.code
+        rank = RANK_OF[code]
+        if rank == 0:
+            empty = self._empty_foundations
+            return lowest_bit(empty) if empty else None
+        if self.heights[SUIT_OF[code]] == rank:
+            return self._suit_slot[SUIT_OF[code]]
+        return None
+
+    def can_place_foundation(self, card, foundation_index):
+        """True if card can go on foundation foundation_index (aces on any empty one)."""
+        code = card.code
+        if RANK_OF[code] == 0:
+            return not self.foundations[foundation_index].cards
+        return self.heights[SUIT_OF[code]] == RANK_OF[code] and self._suit_slot[SUIT_OF[code]] == foundation_index
+
+    def is_home(self, code):
+        """True if the card is on a foundation."""
+        return self.played >> code & 1 == 1
+
+    def is_safe_foundation(self, code):
+        """
+        True if playing code home can never cost a move: it is an ace or a two,
+        or both opposite-color cards one rank lower are home already.
+        """
+        return self.played & SAFE_NEEDS[code] == SAFE_NEEDS[code]
+
+
+def lowest_bit(mask):
+    """Index of the lowest set bit of a non-zero pile bitmask."""
+    return (mask & -mask).bit_length() - 1
+
+
+class GameView:
+    """Read-only view of a SolitaireGame in card codes. Stays current as the game changes."""
+    __slots__ = ('_game',)
+
+    # Initialize GameView
+    def __init__(self, game):
+        self._game = game
+
+    def tableau_pile(self, i):
+        """Card codes of tableau pile i, bottom first."""
+        return tuple(card.code for card in self._game.tableau[i].cards)
+
+    def tableau_len(self, i):
+        return len(self._game.tableau[i].cards)
+
+    def face_down(self, i):
+        """Number of face-down cards at the bottom of tableau pile i."""
+        return self._game.tableau[i].face_down
+
+    def tableau_top(self, i):
+        cards = self._game.tableau[i].cards
+        return cards[-1].code if cards else None
+
+    def foundation_top(self, i):
+        cards = self._game.foundations[i].cards
+        return cards[-1].code if cards else None
+
+    def foundation_len(self, i):
+        return len(self._game.foundations[i].cards)
+
+    def waste_top(self):
+        cards = self._game.waste.cards
+        return cards[-1].code if cards else None
+
+    def waste_len(self):
+        return len(self._game.waste.cards)
+
+    def stock_len(self):
+        return len(self._game.stock.cards)
+
+    @property
+    def stock_passes(self):
+        return self._game.stock_passes
+
+    def score(self):
+        return sum(len(f.cards) for f in self._game.foundations)
@@ -1,8 +1,12 @@
+import time
 import tkinter as tk
 from game import SolitaireGame  # only import the game class
-from card import Card            # if you need to reference Card directly
+from card import Card  # if you need to reference Card directly
 from pile import Pile            # import Pile for validation
-from PIL import Image, ImageTk  # put this at the top of your file with other imports
+from PIL import ImageTk  # put this at the top of your file with other imports
+from sprites import load_atlas, BACK
+from solver import apply_move
+from worker import EngineWorker, MOVE, HINT, DONE, ERROR
 
 CARD_WIDTH = 80
 CARD_HEIGHT = 120
@@ -10,30 +14,24 @@ PADDING = 20
 CANVAS_WIDTH = 1000
 CANVAS_HEIGHT = 700
 CARD_SPACING = 25
+POLL_MS = 30          # how often the Tk loop drains the engine worker's queue
+MOVES_PER_POLL = 5    # autoplay moves applied per poll, so the board visibly animates
 
 class SolitaireGUI:
     # Initialize GUI
     def __init__(self, root):
+        start = time.perf_counter()
         self.root = root
         self.root.title("Solitaire Simulator")
 
         self.game = SolitaireGame()
 
-        # Load card images
+        # Load card images: one read of the pre-resized atlas (rebuilt from the
+        # PNGs only when they or the card size change). PhotoImages are made the
+        # first time a card is shown face up.
+        self.atlas, self.atlas_cold = load_atlas(CARD_WIDTH, CARD_HEIGHT)
         self.card_images = {}
-        suits = ['hearts', 'diamonds', 'clubs', 'spades']
-        ranks = ['ace','2','3','4','5','6','7','8','9','10','jack','queen','king']
-
-        # Assign images to cards
-        for suit in suits:
-            for rank in ranks:
-                filename = f'images/{rank}_of_{suit}.png'
-                img = Image.open(filename).resize((CARD_WIDTH, CARD_HEIGHT))
-                self.card_images[f'{rank}_{suit}'] = ImageTk.PhotoImage(img)
-
-        # Card back
-        img_back = Image.open('images/back_of_card.png').resize((CARD_WIDTH, CARD_HEIGHT))
-        self.card_back = ImageTk.PhotoImage(img_back)
+        self.card_back = ImageTk.PhotoImage(self.atlas.tile(BACK))
 
         # Create main frame
         self.main_frame = tk.Frame(root)
@@ -49,6 +47,22 @@ class SolitaireGUI:
                                        command=self.restart_game, 
                                        bg="lightblue", font=("Arial", 12, "bold"))
         self.restart_button.pack(side="left", padx=10, pady=5)
+
+        # Autoplay and hint buttons: the engine runs on a snapshot in a worker
+        # thread and its moves are applied here by poll_worker
+        self.autoplay_button = tk.Button(self.control_frame, text="Autoplay",
+                                        command=self.toggle_autoplay,
+                                        bg="lightblue", font=("Arial", 12, "bold"))
+        self.autoplay_button.pack(side="left", padx=10, pady=5)
+        self.hint_button = tk.Button(self.control_frame, text="Hint",
+                                    command=self.request_hint,
+                                    bg="lightblue", font=("Arial", 12, "bold"))
+        self.hint_button.pack(side="left", padx=10, pady=5)
+        self.status_label = tk.Label(self.control_frame, text="",
+                                    bg="darkgreen", fg="white", font=("Arial", 10, "bold"))
+        self.status_label.pack(side="left", padx=10, pady=5)
+        self.worker = EngineWorker()
+        self.worker_job = None  # 'autoplay' or 'hint' while a job runs
         
         # Add counters frame
         self.counters_frame = tk.Frame(self.control_frame, bg="darkgreen")
@@ -68,6 +82,13 @@ class SolitaireGUI:
         self.canvas = tk.Canvas(self.main_frame, width=CANVAS_WIDTH, height=CANVAS_HEIGHT, bg="darkgreen")
         self.canvas.pack(fill="both", expand=True)
 
+        # Retained canvas items: the slot outlines are drawn once and every card
+        # keeps one image item (keyed by card code) that is only moved or
+        # re-skinned when its place or face changes.
+        self.card_items = {}
+        self.item_state = {}  # card code -> (x, y, face_up) currently shown
+        self.create_items()
+
         self.draw_board()
         self.update_counters()
         
@@ -83,9 +104,15 @@ class SolitaireGUI:
         self.canvas.bind("<Button-1>", self.on_mouse_press)
         self.canvas.bind("<B1-Motion>", self.on_mouse_drag)
         self.canvas.bind("<ButtonRelease-1>", self.on_mouse_release)
+        self.root.after(POLL_MS, self.poll_worker)
+
+        # Startup cost up to the first drawn board (cold = atlas rebuilt)
+        self.startup_seconds = time.perf_counter() - start
 
     def on_mouse_press(self, event):
         x, y = event.x, event.y
+        # Any manual play takes over from the engine
+        self.stop_worker()
         
         # --- Stock click (draw a card) ---
         stock_x, stock_y = PADDING, PADDING
@@ -112,7 +139,7 @@ class SolitaireGUI:
             # Check all cards in the pile (from top to bottom)
             for j in range(len(pile.cards) - 1, -1, -1):
                 card = pile.cards[j]
-                if card.face_up:  # Only allow dragging face-up cards
+                if pile.is_face_up(j):  # Only allow dragging face-up cards
                     card_x = pile_x
                     card_y = pile_y + j * CARD_SPACING
                     if card_x <= x <= card_x + CARD_WIDTH and card_y <= y <= card_y + CARD_HEIGHT:
@@ -124,7 +151,6 @@ class SolitaireGUI:
     def on_mouse_drag(self, event):
         if self.dragging:
             # Update the visual position of the dragged card
-            self.draw_board()
             self.draw_dragged_card(event.x, event.y)
 
     def on_mouse_release(self, event):
@@ -153,36 +179,39 @@ class SolitaireGUI:
             self.drag_offset_x = x - pile_x
             self.drag_offset_y = y - card_y
 
+        # Tag the dragged cards so motion moves them as one group, above the rest
+        for card in self.dragged_cards():
+            self.canvas.addtag_withtag('drag', self.card_items[card.code])
+        self.canvas.tag_raise('drag')
+
+    def dragged_cards(self):
+        """The cards being dragged, bottom first."""
+        source_type, source_data = self.drag_card
+        if source_type == 'waste':
+            return [source_data]
+        pile_index, bottom_index = source_data
+        return self.game.tableau[pile_index].cards[bottom_index:]
+
     def draw_dragged_card(self, x, y):
         if not self.dragging or not self.drag_card:
             return
-            
-        source_type, source_data = self.drag_card
-        
-        if source_type == 'waste':
-            card = source_data
-            img = self.card_images[f'{card.rank}_{card.suit}']
-            # Draw the card at the mouse position with offset
-            card_x = x - self.drag_offset_x
-            card_y = y - self.drag_offset_y
-            self.canvas.create_image(card_x, card_y, image=img, anchor='nw')
-        elif source_type == 'tableau':
-            pile_index, bottom_index = source_data
-            pile = self.game.tableau[pile_index]
-            
-            # Draw all cards in the sequence from bottom to top
-            for i in range(bottom_index, len(pile.cards)):
-                card = pile.cards[i]
-                img = self.card_images[f'{card.rank}_{card.suit}']
-                card_x = x - self.drag_offset_x
-                card_y = y - self.drag_offset_y + (i - bottom_index) * CARD_SPACING
-                self.canvas.create_image(card_x, card_y, image=img, anchor='nw')
+
+        # Move the tagged group so its bottom card sits at the mouse position with offset
+        bottom = self.card_items[self.dragged_cards()[0].code]
+        card_x, card_y = self.canvas.coords(bottom)
+        self.canvas.move('drag', x - self.drag_offset_x - card_x, y - self.drag_offset_y - card_y)
 
     def end_drag(self, x, y):
         if not self.drag_card:
             return
             
         source_type, source_data = self.drag_card
+
+        # The dragged items are wherever the mouse left them: forget their
+        # recorded places so draw_board puts them back or onto the target
+        for card in self.dragged_cards():
+            self.item_state.pop(card.code, None)
+        self.canvas.dtag('drag', 'drag')
         
         # Check if dropping on a valid target
         target = self.get_drop_target(x, y)
@@ -215,13 +244,11 @@ class SolitaireGUI:
         if source_type == 'waste':
             card = source_data
             if target_type == 'foundation':
-                if self.can_place_foundation(card, self.game.foundations[target_index]):
-                    self.game.waste.cards.pop()
-                    self.game.foundations[target_index].add(card)
+                if self.can_place_foundation(card, target_index):
+                    self.game.move_waste_to_foundation(target_index)
             elif target_type == 'tableau':
-                if self.can_place_tableau(card, self.game.tableau[target_index]):
-                    self.game.waste.cards.pop()
-                    self.game.tableau[target_index].add(card)
+                if self.game.is_legal(('move_waste_to_tableau', target_index)):
+                    self.game.move_waste_to_tableau(target_index)
         
         elif source_type == 'tableau':
             pile_index, bottom_index = source_data
@@ -229,73 +256,162 @@ class SolitaireGUI:
                 # Only move the top card to foundation
                 top_card_index = len(self.game.tableau[pile_index].cards) - 1
                 card = self.game.tableau[pile_index].cards[top_card_index]
-                if self.can_place_foundation(card, self.game.foundations[target_index]):
-                    self.game.tableau[pile_index].cards.pop(top_card_index)
-                    self.game.foundations[target_index].add(card)
+                if self.can_place_foundation(card, target_index):
+                    self.game.move_tableau_to_foundation(pile_index, target_index)
                     # Flip the new top card if it exists and is face down
                     self.flip_top_tableau_card(pile_index)
             elif target_type == 'tableau' and target_index != pile_index:
-                cards_to_move = self.game.tableau[pile_index].cards[bottom_index:]
-                if self.game.can_place_tableau_sequence(cards_to_move, self.game.tableau[target_index]):
-                    self.game.tableau[pile_index].cards = self.game.tableau[pile_index].cards[:bottom_index]
-                    self.game.tableau[target_index].add_multiple(cards_to_move)
+                num_cards = len(self.game.tableau[pile_index].cards) - bottom_index
+                if self.game.is_legal(('move_tableau_to_tableau', pile_index, target_index, num_cards)):
+                    self.game.move_tableau_to_tableau(pile_index, target_index, num_cards)
                     # Flip the new top card if it exists and is face down
                     self.flip_top_tableau_card(pile_index)
 
 
-    # Draw board function
-    def draw_board(self):
-        self.canvas.delete("all")
-
-        # Draw foundations (top right)
+    # Where each pile is drawn: (pile, x, y, vertical spacing between its cards)
+    def pile_layout(self):
+        layout = []
+        # Foundations (top right)
         for i, foundation in enumerate(self.game.foundations):
-            x = 600 + i * (CARD_WIDTH + PADDING)
-            y = PADDING
-            self.draw_slot(x, y, pile=foundation)
-
-        # Draw stock and waste (top left)
-        self.draw_slot(PADDING, PADDING, pile=self.game.stock)
-        self.draw_slot(PADDING + CARD_WIDTH + PADDING, PADDING, pile=self.game.waste)
-
-        # Draw tableau piles
+            layout.append((foundation, 600 + i * (CARD_WIDTH + PADDING), PADDING, 0))
+        # Stock and waste (top left)
+        layout.append((self.game.stock, PADDING, PADDING, 0))
+        layout.append((self.game.waste, PADDING + CARD_WIDTH + PADDING, PADDING, 0))
+        # Tableau piles
         for i, tableau_pile in enumerate(self.game.tableau):
-            x = PADDING + i * (CARD_WIDTH + PADDING)
-            y = 2*PADDING + CARD_HEIGHT
-            self.draw_slot(x, y, pile=tableau_pile, vertical_spacing=20)
-
-    # Draw top left pile (slot)
-    def draw_slot(self, x, y, pile=None, vertical_spacing=0):
-        # Draw empty rectangle if pile is empty
-        self.canvas.create_rectangle(x, y, x + CARD_WIDTH, y + CARD_HEIGHT, outline="white", width=2, dash=(4,2))
-        if pile:
+            layout.append((tableau_pile, PADDING + i * (CARD_WIDTH + PADDING), 2*PADDING + CARD_HEIGHT, 20))
+        return layout
+
+    # Create the slot outlines and one image item per card, once
+    def create_items(self):
+        for pile, x, y, _ in self.pile_layout():
+            self.draw_slot(x, y)
+        for code in range(52):
+            self.card_items[code] = self.canvas.create_image(0, 0, image=self.card_back, anchor='nw',
+                                                            tags=('card',))
+
+    # Draw board function: only items whose place or face changed are touched
+    def draw_board(self):
+        for pile, x, y, spacing in self.pile_layout():
+            changed = False
+            # The stock is always face down; other piles hide their first face_down cards
+            face_down = len(pile.cards) if pile is self.game.stock else pile.face_down
             for i, card in enumerate(pile.cards):
-                img = self.card_images[f'{card.rank}_{card.suit}'] if card.face_up else self.card_back
-                self.canvas.create_image(x, y + i*vertical_spacing, image=img, anchor='nw')
-
-    def can_place_foundation(self, card, pile):
-        ranks = ['ace','2','3','4','5','6','7','8','9','10','jack','queen','king']
-        if len(pile.cards) == 0:
-            return card.rank == 'ace'
-        top_card = pile.cards[-1]
-        return card.suit == top_card.suit and ranks.index(card.rank) == ranks.index(top_card.rank) + 1
+                face_up = i >= face_down
+                state = (x, y + i*spacing, face_up)
+                shown = self.item_state.get(card.code)
+                if shown == state:
+                    continue
+                item = self.card_items[card.code]
+                if shown is None or shown[:2] != state[:2]:
+                    self.canvas.coords(item, state[0], state[1])
+                if shown is None or shown[2] != face_up:
+                    self.canvas.itemconfig(item, image=self.card_image(card) if face_up else self.card_back)
+                self.item_state[card.code] = state
+                changed = True
+            if changed:
+                # Restack the pile bottom to top
+                for card in pile.cards:
+                    self.canvas.tag_raise(self.card_items[card.code])
+
+    # Draw an empty pile outline (slot)
+    def draw_slot(self, x, y):
+        self.canvas.create_rectangle(x, y, x + CARD_WIDTH, y + CARD_HEIGHT, outline="white", width=2, dash=(4,2),
+                                     tags=('slot',))
+
+    def card_image(self, card):
+        """PhotoImage of a card's face, created from the atlas on first use."""
+        img = self.card_images.get(card.code)
+        if img is None:
+            img = ImageTk.PhotoImage(self.atlas.tile(card.code))
+            self.card_images[card.code] = img
+        return img
+
+    def can_place_foundation(self, card, foundation_index):
+        return self.game.can_place_foundation(card, foundation_index)
 
     def can_place_tableau(self, card, pile):
         return self.game.can_place_tableau(card, pile)
 
     def flip_top_tableau_card(self, pile_index):
         """Flip the top card of a tableau pile if it exists and is face down"""
-        pile = self.game.tableau[pile_index]
-        if pile.cards and not pile.cards[-1].face_up:
-            pile.cards[-1].flip()
+        self.game.flip_top_tableau_card(pile_index)
 
     def restart_game(self):
         """Restart the game with a new deck"""
+        self.stop_worker()
         self.game = SolitaireGame()
         self.dragging = False
         self.drag_card = None
+        self.canvas.dtag('drag', 'drag')
         self.draw_board()
         self.update_counters()
 
+    def toggle_autoplay(self):
+        """Start the greedy simulator on a snapshot of the game, or stop it."""
+        if self.worker_job == 'autoplay':
+            self.stop_worker()
+            return
+        self.worker.start_autoplay(self.game)
+        self.worker_job = 'autoplay'
+        self.autoplay_button.config(text="Stop")
+        self.status_label.config(text="Autoplay...")
+
+    def request_hint(self):
+        """Search for a winning line in the background and show its first move."""
+        self.stop_worker()
+        self.worker.start_hint(self.game)
+        self.worker_job = 'hint'
+        self.status_label.config(text="Thinking...")
+
+    def stop_worker(self):
+        """Cancel the running engine job; its late messages are ignored."""
+        if self.worker_job is not None:
+            self.worker.cancel()
+            self.worker_job = None
+            self.status_label.config(text="")
+        self.autoplay_button.config(text="Autoplay")
+
+    def poll_worker(self):
+        """Apply what the engine worker produced since the last poll, then poll again."""
+        if self.worker_job is not None and not self.dragging:
+            limit = MOVES_PER_POLL if self.worker_job == 'autoplay' else None
+            played = False
+            for kind, payload in self.worker.poll(limit):
+                if kind == MOVE:
+                    apply_move(self.game, payload)
+                    played = True
+                elif kind == HINT:
+                    move, status = payload
+                    self.status_label.config(text=f"Hint: {self.describe_move(move)}" if move
+                                             else f"No hint ({status})")
+                elif kind == DONE:
+                    if self.worker_job == 'autoplay':
+                        self.status_label.config(text=f"Autoplay: {payload}")
+                    self.worker_job = None
+                    self.autoplay_button.config(text="Autoplay")
+                elif kind == ERROR:
+                    self.status_label.config(text=f"Engine error: {payload}")
+                    self.worker_job = None
+                    self.autoplay_button.config(text="Autoplay")
+            if played:
+                self.draw_board()
+                self.update_counters()
+        self.root.after(POLL_MS, self.poll_worker)
+
+    def describe_move(self, move):
+        """Short text for a solver move tuple."""
+        kind = move[0]
+        if kind == 'draw_from_stock':
+            return "draw from the stock"
+        if kind == 'move_waste_to_foundation':
+            return f"waste to foundation {move[1] + 1}"
+        if kind == 'move_waste_to_tableau':
+            return f"waste to pile {move[1] + 1}"
+        if kind == 'move_tableau_to_foundation':
+            return f"pile {move[1] + 1} to foundation {move[2] + 1}"
+        return f"{move[3]} card(s) from pile {move[1] + 1} to pile {move[2] + 1}"
+
     def update_counters(self):
         """Update the stock and waste pile counters"""
         stock_count = len(self.game.stock.cards)
@@ -310,7 +426,7 @@ class SolitaireGUI:
         
         # Walk down the pile to find the bottom of the valid sequence
         for i in range(start_index + 1, len(pile.cards)):
-            if not pile.cards[i].face_up:
+            if not pile.is_face_up(i):
                 break
             # Check if the previous card can be placed on this card (moving down the sequence)
             # This validates that cards[i-1] can be placed on cards[i]
@@ -324,4 +440,5 @@ class SolitaireGUI:
 if __name__ == "__main__":
     root = tk.Tk()
     gui = SolitaireGUI(root)
+    print(f"Startup: {gui.startup_seconds:.3f}s ({'cold, atlas rebuilt' if gui.atlas_cold else 'warm'})")
     root.mainloop()
@@ -5,10 +5,15 @@
 # Foundation (4 suit piles, Ace → King).
 # Stock & Waste (cards drawn and recycled).
 
+MAX_PILE = 19   # largest tableau pile: 6 face-down cards + a full King..Ace run
+MAX_STOCK = 24  # cards left for the stock after the deal
+
 class Pile:
-    # Initialize Pile
-    def __init__(self, cards=None):
+    # Initialize Pile. Its first face_down cards are face down: in a tableau pile
+    # the hidden cards are always the bottom of the pile.
+    def __init__(self, cards=None, face_down=0):
         self.cards = cards if cards else []
+        self.face_down = face_down
     
     # Add card to pile
     def add(self, card):
@@ -18,11 +23,36 @@ class Pile:
     def add_multiple(self, cards):
         self.cards.extend(cards)
 
-    # Draw card from pile
-    def draw(self, n=1):
-        drawn = self.cards[:n]
-        self.cards = self.cards[n:]
+    # Take the top n cards off the pile (kept in bottom-to-top order).
+    # Truncates the list in place instead of copying what is left.
+    def take_top(self, n=1):
+        drawn = self.cards[-n:] if n else []
+        del self.cards[len(self.cards) - len(drawn):]
+        if self.face_down > len(self.cards):
+            self.face_down = len(self.cards)
         return drawn
+
+    # Remove and return the top card
+    def pop(self):
+        card = self.cards.pop()
+        if self.face_down > len(self.cards):
+            self.face_down = len(self.cards)
+        return card
+
+    # Is the card at index i (0 = bottom) face up?
+    def is_face_up(self, i):
+        return i >= self.face_down
+
+    # Turn the top card face up if it is the last hidden one. Returns True if it flipped.
+    def flip_top(self):
+        if self.cards and self.face_down == len(self.cards):
+            self.face_down -= 1
+            return True
+        return False
+
+    # Draw card from pile (same as take_top; the top of a pile is the end of the list)
+    def draw(self, n=1):
+        return self.take_top(n)
     
     # Peek at next card
     def peek(self):
@@ -33,4 +63,6 @@ class Pile:
         return len(self.cards)
 
     def __repr__(self):
+        if self.face_down:
+            return f"Pile({self.cards}, face_down={self.face_down})"
         return f"Pile({self.cards})"
\ No newline at end of file
@@ -0,0 +1,175 @@
+# Dead-deal pre-check → static tests on a position that prove it lost (or won)
+# without playing it. The solver runs them before searching. survey() measures
+# how often they fire on fresh deals (almost never).
+# Every rule is sound: UNKNOWN is returned whenever a rule does not apply.
+
+import sys
+import time
+
+from card import RANK_OF, COLOR_OF
+
+LOST = 'lost'
+WON = 'won'
+UNKNOWN = 'unknown'
+
+# Reasons reported with a verdict
+NO_MOVES = 'no_moves'          # no card that ever surfaces can go anywhere
+FROZEN = 'frozen'              # cards in every pile that can never move
+ALL_FACE_UP = 'all_face_up'    # nothing hidden and the stock is used up
+
+# The two cards a card can be placed on in the tableau: one rank higher, opposite color
+PARENTS = tuple(
+    tuple(other for other in range(52)
+          if RANK_OF[other] == RANK_OF[code] + 1 and COLOR_OF[other] != COLOR_OF[code])
+    for code in range(52))
+# The foundation predecessor of each card (None for aces)
+PREDECESSOR = tuple(code - 1 if RANK_OF[code] > 0 else None for code in range(52))
+
+
+def _fits_tableau(code, top):
+    return RANK_OF[top] == RANK_OF[code] + 1 and COLOR_OF[top] != COLOR_OF[code]
+
+
+def _no_moves(game):
+    """
+    True when no move is ever possible from a fresh deal: no ace and no card
+    that fits a tableau top is among the tops and the stock, and no tableau pile
+    is empty. Drawing then never changes anything else, so the game ends
+    on the pass limit with nothing played.
+    """
+    tops = []
+    for pile in game.tableau:
+        cards = pile.cards
+        if not cards:
+            return False
+        # A fresh deal shows one face-up card per pile; longer runs may move
+        if pile.face_down < len(cards) - 1:
+            return False
+        tops.append(cards[-1].code)
+    available = tops + [card.code for card in game.stock.cards] + [card.code for card in game.waste.cards]
+    for code in available:
+        if RANK_OF[code] == 0:
+            return False
+        for top in tops:
+            if top != code and _fits_tableau(code, top):
+                return False
+    for foundation in game.foundations:
+        if foundation.cards:
+            return False
+    return True
+
+
+def _frozen(game):
+    """
+    True when some tableau cards can provably never move. Any card (with the
+    cards on it) may go to an empty tableau pile, so this only holds while no
+    pile can empty: take the largest set of non-ace cards where each card's
+    predecessor is in the set or buried under a member, and the parents of each
+    card and of every face-up card under it (a run based there carries the card
+    along) are buried under a member. Until one of them moves, none is exposed
+    on a parent or has its predecessor home; if the set also has a card in every
+    pile, no pile empties either, so none of them ever moves and the deal is lost.
+    """
+    for pile in game.tableau:
+        if not pile.cards:
+            return False
+    # Quick exit: the card of a one-card pile must be in the set, so its parents must be buried
+    first = game.tableau[0]
+    if len(first.cards) == 1:
+        code = first.cards[0].code
+        if RANK_OF[code] == 0:
+            return False
+        tops = {pile.cards[-1].code for pile in game.tableau}
+        for parent in PARENTS[code]:
+            if parent in tops or all(card.code != parent for pile in game.tableau for card in pile.cards):
+                return False
+
+    where = {}
+    frozen = set()
+    # Cards whose parents must stay buried for each card: itself and the face-up cards under it
+    bases = {}
+    for i, pile in enumerate(game.tableau):
+        for depth, card in enumerate(pile.cards):
+            where[card.code] = (i, depth)
+            if RANK_OF[card.code] > 0:
+                frozen.add(card.code)
+            bases[card.code] = [under.code for under in pile.cards[pile.face_down:depth]] + [card.code]
+    changed = True
+    while changed:
+        changed = False
+        # Depth of the highest card of each pile still in the set
+        highest = [-1] * len(game.tableau)
+        for code in frozen:
+            i, depth = where[code]
+            if depth > highest[i]:
+                highest[i] = depth
+        if min(highest) < 0:
+            return False
+        for code in list(frozen):
+            releasers = [parent for base in bases[code] for parent in PARENTS[base]]
+            if PREDECESSOR[code] not in frozen:
+                releasers.append(PREDECESSOR[code])
+            for releaser in releasers:
+                place = where.get(releaser)
+                if place is None or place[1] >= highest[place[0]]:
+                    frozen.discard(code)
+                    changed = True
+                    break
+    return True
+
+
+def analyze(game):
+    """
+    Classifies a SolitaireGame position without playing it.
+    Returns (verdict, reason): (LOST, reason), (WON, reason) or (UNKNOWN, None).
+    """
+    if not game.stock.cards and not game.waste.cards \
+            and all(pile.face_down == 0 for pile in game.tableau):
+        # Face-up tableau cards always form valid runs in play, so the lowest
+        # card not yet home is on top of its run and can always be played
+        return WON, ALL_FACE_UP
+    if _frozen(game):
+        return LOST, FROZEN
+    if _no_moves(game):
+        return LOST, NO_MOVES
+    return UNKNOWN, None
+
+
+def survey(seeds, max_moves=None):
+    """
+    Runs the pre-check on the deals in seeds. Returns a dict with the hit count
+    per reason, the seconds spent checking, and the seconds the greedy simulator
+    took on the deals that were flagged.
+    """
+    from game import SolitaireGame
+    from simulator import SolitaireSimulator, MAX_MOVES
+
+    max_moves = MAX_MOVES if max_moves is None else max_moves
+    hits = {NO_MOVES: 0, FROZEN: 0, ALL_FACE_UP: 0}
+    check_seconds = flagged_seconds = 0.0
+    deals = 0
+    for seed in seeds:
+        deals += 1
+        game = SolitaireGame(seed)
+        start = time.perf_counter()
+        verdict, reason = analyze(game)
+        check_seconds += time.perf_counter() - start
+        if verdict == UNKNOWN:
+            continue
+        hits[reason] += 1
+        start = time.perf_counter()
+        SolitaireSimulator(verbose=False, max_moves=max_moves, game=game).run_simulation()
+        flagged_seconds += time.perf_counter() - start
+    return {'deals': deals, 'hits': hits, 'check_seconds': check_seconds, 'flagged_seconds': flagged_seconds}
+
+
+if __name__ == "__main__":
+    num_deals = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    report = survey(range(num_deals))
+    flagged = sum(report['hits'].values())
+    print(f"--- Pre-check over {report['deals']} deals ---")
+    print(f"Flagged:        {flagged} ({flagged / report['deals']:.2%})")
+    for reason, count in report['hits'].items():
+        print(f"  {reason:<13} {count}")
+    print(f"Check time:     {report['check_seconds'] / report['deals'] * 1e6:.1f} us/deal")
+    print(f"Simulation of flagged deals: {report['flagged_seconds']:.2f}s")
@@ -0,0 +1,127 @@
+# Simulator profiling → opt-in counters and perf_counter_ns timers per greedy
+# tier and per stock draw. instrument() wraps the bound tier methods of one
+# SolitaireSimulator instance, so simulators created without profile=True run
+# the plain methods and pay nothing. The game itself is never touched.
+
+from time import perf_counter_ns
+
+TIERS = ('waste_to_foundation', 'tableau_to_foundation', 'tableau_sequence', 'waste_to_tableau')
+PHASES = TIERS + ('stock_draw',)
+# The phase a strategy's move belongs to (draws are counted by the wrapped try_stock_draw)
+MOVE_PHASES = {'move_waste_to_foundation': 'waste_to_foundation',
+               'move_tableau_to_foundation': 'tableau_to_foundation',
+               'move_tableau_to_tableau': 'tableau_sequence',
+               'move_waste_to_tableau': 'waste_to_tableau'}
+
+
+class SimulatorProfile:
+    """
+    Counters for one game or, after merge(), a whole batch. For each phase:
+    how often it was evaluated, how often it moved, and total nanoseconds spent.
+    """
+
+    # Initialize SimulatorProfile
+    def __init__(self):
+        self.games = 0
+        self.evaluated = dict.fromkeys(PHASES, 0)
+        self.fired = dict.fromkeys(PHASES, 0)
+        self.ns = dict.fromkeys(PHASES, 0)
+        self.candidates = 0  # face-up cards examined as sequence starts in tier 3
+        self.blocked = 0     # [BLOCKED] direct-reversal rejections
+        self.cycles = 0      # [CYCLE] repeated-position rejections (detect_cycles)
+
+    def record_choice(self, moves, move):
+        """
+        Counts one strategy decision: each phase with a legal move among moves
+        was evaluated, and the phase of the chosen move fired.
+        """
+        for phase in {MOVE_PHASES[legal[0]] for legal in moves if legal[0] in MOVE_PHASES}:
+            self.evaluated[phase] += 1
+        if move is not None and move[0] in MOVE_PHASES:
+            self.fired[MOVE_PHASES[move[0]]] += 1
+
+    def merge(self, other):
+        """Adds another profile's counts into this one. Returns self."""
+        self.games += other.games
+        for phase in PHASES:
+            self.evaluated[phase] += other.evaluated[phase]
+            self.fired[phase] += other.fired[phase]
+            self.ns[phase] += other.ns[phase]
+        self.candidates += other.candidates
+        self.blocked += other.blocked
+        self.cycles += other.cycles
+        return self
+
+    def as_dict(self):
+        return {
+            'games': self.games,
+            'phases': {phase: {'evaluated': self.evaluated[phase], 'fired': self.fired[phase],
+                               'ns': self.ns[phase]} for phase in PHASES},
+            'candidates': self.candidates,
+            'blocked': self.blocked,
+            'cycles': self.cycles,
+        }
+
+    def report(self):
+        """Human-readable table of the counters."""
+        total_ns = sum(self.ns.values()) or 1
+        lines = [f"--- Profile over {self.games} game(s) ---",
+                 f"{'phase':<22} {'evaluated':>10} {'fired':>8} {'ms':>10} {'share':>7}"]
+        for phase in PHASES:
+            lines.append(f"{phase:<22} {self.evaluated[phase]:>10} {self.fired[phase]:>8} "
+                         f"{self.ns[phase] / 1e6:>10.2f} {self.ns[phase] / total_ns:>7.1%}")
+        lines.append(f"sequence candidates {self.candidates}, blocked reversals {self.blocked}, "
+                     f"repeated positions {self.cycles}")
+        return '\n'.join(lines)
+
+
+class _CountingSink:
+    """Forwards events to the real sink and counts the rejection reports."""
+
+    # Initialize _CountingSink
+    def __init__(self, sink, profile):
+        self.sink = sink
+        self.profile = profile
+
+    def emit(self, event, **fields):
+        if event == 'blocked':
+            self.profile.blocked += 1
+        elif event == 'cycle':
+            self.profile.cycles += 1
+        self.sink.emit(event, **fields)
+
+    def flush(self):
+        self.sink.flush()
+
+    def close(self):
+        self.sink.close()
+
+
+def _timed(phase, method, profile):
+    evaluated, fired, ns = profile.evaluated, profile.fired, profile.ns
+
+    def wrapper():
+        evaluated[phase] += 1
+        start = perf_counter_ns()
+        moved = method()
+        ns[phase] += perf_counter_ns() - start
+        if moved:
+            fired[phase] += 1
+        return moved
+    return wrapper
+
+
+def instrument(simulator, profile=None):
+    """
+    Attaches a SimulatorProfile to simulator by shadowing its tier methods,
+    try_stock_draw and its sink. The tableau-sequence tier counts its
+    candidates and make_best_move records strategy choices into
+    simulator.profile themselves. Returns the profile.
+    """
+    profile = profile or SimulatorProfile()
+    profile.games += 1
+    simulator.profile = profile
+    simulator.tiers = tuple(_timed(phase, tier, profile) for phase, tier in zip(TIERS, simulator.tiers))
+    simulator.try_stock_draw = _timed('stock_draw', simulator.try_stock_draw, profile)
+    simulator.sink = _CountingSink(simulator.sink, profile)
+    return profile
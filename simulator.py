@@ -1,14 +1,48 @@
 # The “main” script → sets up a game, runs it (either automatically or step by step), 
 # prints moves or a simple UI.
 
-from game import SolitaireGame
+from game import SolitaireGame, GameView, lowest_bit, DRAW
 from pile import Pile
-from card import Card
+from card import Card, RANK_OF, SUIT_OF
+from events import NullSink, ConsoleSink
+from profiling import instrument
+
+# Hard stop for a single game. Tableau sequences can be shuffled between three
+# or more piles forever (only direct reversals are blocked), so without a cap
+# run_simulation never returns on most deals. Finished games need < 200 moves.
+MAX_MOVES = 1000
+
+# Every way a game can end; stats, batch, corpus and vector_sim index by this order
+OUTCOMES = ('win', 'max_passes', 'blocked', 'move_limit')
 
 class SolitaireSimulator:
-    def __init__(self):
-        self.game = SolitaireGame()
+    def __init__(self, verbose=True, max_moves=MAX_MOVES, detect_cycles=False, sink=None, seed=None, game=None,
+                 strategy=None, profile=False):
+        self.game = game if game is not None else SolitaireGame(seed)
         self.moves_made = 0
+        # A strategy.Strategy picks every move through make_best_move; without
+        # one the built-in greedy order below is used.
+        self.strategy = strategy
+        self.decisions = 0  # times the strategy was asked for a move
+        self.view = GameView(self.game) if strategy is not None else None
+
+        # Greedy priority tiers in the order make_best_non_draw_move tries them
+        self.tiers = (self._tier_waste_to_foundation, self._tier_tableau_to_foundation,
+                      self._tier_tableau_sequence, self._tier_waste_to_tableau)
+
+        self.verbose = verbose
+        # Move reports go to the sink: console output when verbose, otherwise
+        # dropped, unless an explicit sink (e.g. events.JsonlSink) is given.
+        if sink is None:
+            sink = ConsoleSink() if verbose else NullSink()
+        self.sink = sink
+        self.max_moves = max_moves
+        self.outcome = None  # 'win', 'max_passes', 'blocked' or 'move_limit' once finished ('cancelled' if stopped)
+
+        # With detect_cycles, the Zobrist hash of every position reached is kept
+        # and tableau moves that lead back to one of them are skipped. Off by
+        # default so results match the vectorized simulator.
+        self.seen_positions = {self.game.hash} if detect_cycles else None
         
         # START OF CHANGES (REMOVING PROGRESS TRACKING)
         # self.previous_state = None
@@ -19,14 +53,15 @@ class SolitaireSimulator:
         self.last_tableau_move = None  # Stores (src_index, dest_index) of the last Tableau-to-Tableau move
         # END OF NEW CHANGE
 
+        # Opt-in counters and timers (profiling.SimulatorProfile); instrument()
+        # wraps the tiers of this instance only, so unprofiled games pay nothing.
+        self.profile = None
+        if profile:
+            instrument(self)
+
     def _get_face_up_count(self):
         """Returns the total number of face-up cards in the tableau."""
-        count = 0
-        for pile in self.game.tableau:
-            for card in pile.cards:
-                if card.face_up:
-                    count += 1
-        return count
+        return sum(len(pile.cards) - pile.face_down for pile in self.game.tableau)
 
     def _get_current_state(self):
         """Returns a tuple representing the current board state for progress tracking."""
@@ -40,40 +75,50 @@ class SolitaireSimulator:
         Returns True if successful, False if blocked or max passes reached.
         """
         # We rely on game.draw_from_stock to handle the 3-pass check internally.
-        if self.game.draw_from_stock():
+        record = self.game.draw_from_stock()
+        if record is not None and record[0] == DRAW:
             self.moves_made += 1
             
             # START OF CHANGE: Reset last tableau move on draw (since it's a new state)
             self.last_tableau_move = None
             # END OF CHANGE
             
-            # The stock_passes check assumes game.py exposes this attribute.
-            try:
-                if self.game.stock_passes > 0 and len(self.game.stock.cards) == 23 and self.moves_made > 28:
-                    print(f"[{self.moves_made:03d}] Stock Draw (Pass {self.game.stock_passes})") 
-                else:
-                    print(f"[{self.moves_made:03d}] Stock Draw.")
-            except AttributeError:
-                # Fallback if stock_passes isn't explicitly exposed on game.py
-                 print(f"[{self.moves_made:03d}] Stock Draw.")
-            
+            # First draw of a new pass through the stock
+            new_pass = self.game.stock_passes > 0 and len(self.game.stock.cards) == 23 and self.moves_made > 28
+            self.sink.emit('draw', move=self.moves_made, passes=self.game.stock_passes, new_pass=new_pass)
             return True
         return False
     # END OF NEW METHOD
         
-    def run_simulation(self):
-        """Runs the game using a greedy strategy until win, loss, or no moves."""
-        print("--- Starting Solitaire Simulation ---")
+    def run_simulation(self, cancel=None):
+        """
+        Runs the game using a greedy strategy until win, loss, or no moves.
+        cancel (e.g. a threading.Event) is checked before every move; once it
+        is set the game stops where it is with outcome 'cancelled'.
+        """
+        self.sink.emit('start')
         
         # START OF CHANGES: Simplifying the loop structure
         while not self.game.is_won() and not self.game.is_lost():
+            if self.max_moves is not None and self.moves_made >= self.max_moves:
+                break
+            if cancel is not None and cancel.is_set():
+                break
             
             non_draw_move_made = False
             
+            # A pluggable strategy chooses every move itself, draws included
+            if self.strategy is not None:
+                if self.make_best_move():
+                    self._remember_position()
+                    continue
+                break
+
             # Attempt to make a high-priority non-Draw move
             # We use make_best_non_draw_move (Priority 1-4)
             if self.make_best_non_draw_move():
                 non_draw_move_made = True
+                self._remember_position()
             
             # If a non-Draw move was made, the loop restarts immediately 
             # (continue) to search for new moves unlocked by the previous one.
@@ -83,6 +128,7 @@ class SolitaireSimulator:
             # If no non-Draw move was possible, try to draw a card (Priority 5).
             if self.try_stock_draw():
                 # If draw was successful, restart loop to check for newly unlocked moves.
+                self._remember_position()
                 continue
             
             # If neither a non-Draw move nor a Draw was possible, we are blocked.
@@ -91,136 +137,221 @@ class SolitaireSimulator:
         # END OF CHANGES
         
         # FINAL OUTCOME CHECK
-        if self.game.is_won():
-             print(f"\n✨ WIN! Game completed in {self.moves_made} moves.")
-             return True
+        if cancel is not None and cancel.is_set():
+             self.outcome = 'cancelled'
+        elif self.game.is_won():
+             self.outcome = 'win'
         # Use the is_lost() method to check for the 3-pass rule violation
         elif self.game.is_lost():
-             print(f"\n❌ LOSS: Max passes (3) reached. Game ended after {self.moves_made} moves.")
-             return False
+             self.outcome = 'max_passes'
+        # Still had moves left but ran into the move cap (tableau cycle).
+        elif self.max_moves is not None and self.moves_made >= self.max_moves:
+             self.outcome = 'move_limit'
         # The game is blocked if it didn't win and wasn't lost by passes.
         else:
-             print(f"\n❌ LOSS: Game blocked. No moves possible. Ended after {self.moves_made} moves.")
-             return False
+             self.outcome = 'blocked'
+        self.sink.emit('end', outcome=self.outcome, moves=self.moves_made, max_moves=self.max_moves)
+        return self.outcome == 'win'
+
+    def _remember_position(self):
+        """Adds the current position hash to the seen set when cycle detection is on."""
+        if self.seen_positions is not None:
+            self.seen_positions.add(self.game.hash)
+
+    def _skip_seen_destinations(self, src_index, num_cards, dests):
+        """Drops destinations whose move (and flip) would recreate a seen position."""
+        remaining = dests
+        while remaining:
+            dest_index = lowest_bit(remaining)
+            remaining &= remaining - 1
+            if self.game.tableau_move_hash(src_index, dest_index, num_cards) in self.seen_positions:
+                dests &= ~(1 << dest_index)
+                self.sink.emit('cycle', src=src_index, dest=dest_index)
+        return dests
 
     def get_score(self):
         """Returns the total number of cards in the foundations."""
         return sum(len(f.cards) for f in self.game.foundations)
 
+    def get_result(self):
+        """Returns a picklable summary of a finished game for batch runs."""
+        return {
+            'outcome': self.outcome,
+            'moves': self.moves_made,
+            'score': self.get_score(),
+            'stock_passes': self.game.stock_passes,
+        }
+
     # START OF NEW METHOD
     def make_best_non_draw_move(self):
         """
         Implements the greedy move strategy without drawing.
         Priority: Foundation > Tableau Sequence > Waste to Tableau
+        Each priority tier is its own method; the first one that moves wins.
         """
-        
-        # --- 1. Move from Waste to Foundation ---
-        if self.game.waste.cards:
-            card = self.game.waste.cards[-1]
-            for i, foundation in enumerate(self.game.foundations):
-                if self._can_place_foundation_rule(card, foundation):
-                    self.game.waste.cards.pop()
-                    foundation.add(card)
+        for tier in self.tiers:
+            if tier():
+                return True
+        return False # No non-Draw moves were possible
+    # END OF NEW METHOD
+
+    # --- 1. Move from Waste to Foundation ---
+    def _tier_waste_to_foundation(self):
+        game = self.game
+        if game.waste.cards:
+            card = game.waste.cards[-1]
+            i = game.foundation_destination(card)
+            if i is not None:
+                game.move_waste_to_foundation(i)
+                self.moves_made += 1
+                self.sink.emit('waste_to_foundation', move=self.moves_made, card=card.code, foundation=i)
+                # START OF CHANGE: Reset tableau history on non-tableau move
+                self.last_tableau_move = None
+                # END OF CHANGE
+                return True
+        return False
+
+    # --- 2. Move Tableau Top Card to Foundation ---
+    def _tier_tableau_to_foundation(self):
+        game = self.game
+        for i, tableau_pile in enumerate(game.tableau):
+            if tableau_pile.face_down < len(tableau_pile.cards):
+                card = tableau_pile.cards[-1]
+                j = game.foundation_destination(card)
+                if j is not None:
+                    game.move_tableau_to_foundation(i, j)
+                    self.flip_top_tableau_card(i)
                     self.moves_made += 1
-                    print(f"[{self.moves_made:03d}] Waste ({card.rank}) -> Foundation {i}")
+                    self.sink.emit('tableau_to_foundation', move=self.moves_made, tableau=i, card=card.code, foundation=j)
                     # START OF CHANGE: Reset tableau history on non-tableau move
                     self.last_tableau_move = None
                     # END OF CHANGE
                     return True
-        
-        # --- 2. Move Tableau Top Card to Foundation ---
-        for i, tableau_pile in enumerate(self.game.tableau):
-            if tableau_pile.cards and tableau_pile.cards[-1].face_up:
-                card = tableau_pile.cards[-1]
-                for j, foundation in enumerate(self.game.foundations):
-                    if self._can_place_foundation_rule(card, foundation):
-                        tableau_pile.cards.pop()
-                        foundation.add(card)
-                        self.flip_top_tableau_card(i)
+        return False
+
+    # --- 3. Move Tableau Sequence to Tableau (Includes King to Empty) ---
+    def _tier_tableau_sequence(self):
+        # Only the face-up cards of each source are candidates; the move index
+        # gives the piles that take each one, in the same order as a full scan.
+        game = self.game
+        profile = self.profile
+        for src_index, src_pile in enumerate(game.tableau):
+            cards = src_pile.cards
+            if len(cards) > 1:
+                first_up = src_pile.face_down
+
+                # START OF CRITICAL CHANGE: Cycle Detection
+                # Prevent moving sequence back to the source of the previous move
+                blocked = None
+                if self.last_tableau_move is not None and self.last_tableau_move[1] == src_index:
+                    blocked = self.last_tableau_move[0]
+                # END OF CRITICAL CHANGE
+
+                for start_index in range(first_up, len(cards)):
+                    dests = game.tableau_destinations(cards[start_index]) & ~(1 << src_index)
+                    if blocked is not None:
+                        dests &= ~(1 << blocked)
+                        # Report the reversal when a full scan would have reached it first
+                        if not dests or blocked < lowest_bit(dests):
+                            self.sink.emit('blocked', src=src_index, dest=blocked)
+                    num_cards = len(cards) - start_index
+                    if dests and self.seen_positions is not None:
+                        dests = self._skip_seen_destinations(src_index, num_cards, dests)
+                    if dests:
+                        if profile is not None:
+                            profile.candidates += start_index - first_up + 1
+                        # Perform the move
+                        dest_index = lowest_bit(dests)
+                        game.move_tableau_to_tableau(src_index, dest_index, num_cards)
+                        self.flip_top_tableau_card(src_index)
                         self.moves_made += 1
-                        print(f"[{self.moves_made:03d}] Tableau {i} ({card.rank}) -> Foundation {j}")
-                        # START OF CHANGE: Reset tableau history on non-tableau move
-                        self.last_tableau_move = None
+                        self.sink.emit('tableau_to_tableau', move=self.moves_made, src=src_index, dest=dest_index, count=num_cards)
+                        
+                        # START OF CHANGE: Record this move
+                        self.last_tableau_move = (src_index, dest_index)
                         # END OF CHANGE
-                        return True
-        
-        # --- 3. Move Tableau Sequence to Tableau (Includes King to Empty) ---
-        for src_index, src_pile in enumerate(self.game.tableau):
-            if len(src_pile.cards) > 1:
-                # Find all possible face-up sequences to move (starting from top to bottom)
-                for start_index in range(len(src_pile.cards)):
-                    if src_pile.cards[start_index].face_up:
-                        sequence = src_pile.cards[start_index:]
                         
-                        # Check destination piles
-                        for dest_index, dest_pile in enumerate(self.game.tableau):
-                            if src_index == dest_index:
-                                continue
-
-                            # START OF CRITICAL CHANGE: Cycle Detection
-                            # Prevent moving sequence back to the source of the previous move
-                            if self.last_tableau_move == (dest_index, src_index):
-                                print(f"[BLOCKED] Tableau {src_index} -> Tableau {dest_index}: Preventing direct cycle reversal.")
-                                continue
-                            # END OF CRITICAL CHANGE
-
-                            if self.game.can_place_tableau_sequence(sequence, dest_pile):
-                                # Perform the move
-                                src_pile.cards = src_pile.cards[:start_index]
-                                dest_pile.add_multiple(sequence)
-                                self.flip_top_tableau_card(src_index)
-                                self.moves_made += 1
-                                print(f"[{self.moves_made:03d}] Tableau {src_index} -> Tableau {dest_index} (Sequence of {len(sequence)})")
-                                
-                                # START OF CHANGE: Record this move
-                                self.last_tableau_move = (src_index, dest_index)
-                                # END OF CHANGE
-                                
-                                return True
-        
-        # --- 4. Move Waste to Tableau ---
-        if self.game.waste.cards:
-            card = self.game.waste.cards[-1]
-            for i, tableau_pile in enumerate(self.game.tableau):
-                if self.game.can_place_tableau(card, tableau_pile):
-                    self.game.waste.cards.pop()
-                    tableau_pile.add(card)
-                    self.moves_made += 1
-                    print(f"[{self.moves_made:03d}] Waste ({card.rank}) -> Tableau {i}")
-                    # START OF CHANGE: Reset tableau history on non-tableau move
-                    self.last_tableau_move = None
-                    # END OF CHANGE
-                    return True
-        
-        return False # No non-Draw moves were possible
-    # END OF NEW METHOD
+                        return True
+                if profile is not None:
+                    profile.candidates += len(cards) - first_up
+        return False
+
+    # --- 4. Move Waste to Tableau ---
+    def _tier_waste_to_tableau(self):
+        game = self.game
+        if game.waste.cards:
+            card = game.waste.cards[-1]
+            dests = game.tableau_destinations(card)
+            if dests:
+                i = lowest_bit(dests)
+                game.move_waste_to_tableau(i)
+                self.moves_made += 1
+                self.sink.emit('waste_to_tableau', move=self.moves_made, card=card.code, tableau=i)
+                # START OF CHANGE: Reset tableau history on non-tableau move
+                self.last_tableau_move = None
+                # END OF CHANGE
+                return True
+        return False
 
     def make_best_move(self):
         """
-        DEPRECATED: Now replaced by run_simulation's loop structure and 
-        make_best_non_draw_move/try_stock_draw
+        Asks self.strategy for one move among the game's legal moves and plays it.
+        Returns True if a move was made (without a strategy, the built-in greedy
+        order of make_best_non_draw_move and try_stock_draw is used instead).
         """
-        # This method is now unused, but kept for context.
-        pass
+        if self.strategy is None:
+            return self.make_best_non_draw_move() or self.try_stock_draw()
+        game = self.game
+        moves = game.legal_moves()
+        if not moves:
+            return False
+        self.decisions += 1
+        move = self.strategy.choose(self.view, moves)
+        if self.profile is not None:
+            self.profile.record_choice(moves, move)
+        if move is None:
+            return False
+        if move not in moves:
+            raise ValueError(f"Strategy chose a move that is not legal: {move!r}")
+        kind = move[0]
+        if kind == 'draw_from_stock':
+            return self.try_stock_draw()
+
+        self.moves_made += 1
+        if kind == 'move_waste_to_foundation':
+            card = game.waste.cards[-1]
+            game.move_waste_to_foundation(move[1])
+            self.sink.emit('waste_to_foundation', move=self.moves_made, card=card.code, foundation=move[1])
+        elif kind == 'move_tableau_to_foundation':
+            card = game.tableau[move[1]].cards[-1]
+            game.move_tableau_to_foundation(move[1], move[2])
+            self.flip_top_tableau_card(move[1])
+            self.sink.emit('tableau_to_foundation', move=self.moves_made, tableau=move[1], card=card.code,
+                           foundation=move[2])
+        elif kind == 'move_tableau_to_tableau':
+            game.move_tableau_to_tableau(move[1], move[2], move[3])
+            self.flip_top_tableau_card(move[1])
+            self.sink.emit('tableau_to_tableau', move=self.moves_made, src=move[1], dest=move[2], count=move[3])
+        elif kind == 'move_waste_to_tableau':
+            card = game.waste.cards[-1]
+            game.move_waste_to_tableau(move[1])
+            self.sink.emit('waste_to_tableau', move=self.moves_made, card=card.code, tableau=move[1])
+        return True
 
     # --- Helper methods (Copied from GUI/Game for Simulator context) ---
 
     def _can_place_foundation_rule(self, card, pile):
         """Re-implements the foundation rule check that was only in the GUI."""
-        ranks = ['ace','2','3','4','5','6','7','8','9','10','jack','queen','king']
-        
         if len(pile.cards) == 0:
-            return card.rank == 'ace'
+            return RANK_OF[card.code] == 0
         
-        top_card = pile.cards[-1]
+        top_code = pile.cards[-1].code
         
-        return card.suit == top_card.suit and ranks.index(card.rank) == ranks.index(top_card.rank) + 1
+        return SUIT_OF[card.code] == SUIT_OF[top_code] and RANK_OF[card.code] == RANK_OF[top_code] + 1
 
     def flip_top_tableau_card(self, pile_index):
         """Flip the top card of a tableau pile if it exists and is face down"""
-        pile = self.game.tableau[pile_index]
-        if pile.cards and not pile.cards[-1].face_up:
-            pile.cards[-1].flip()
+        self.game.flip_top_tableau_card(pile_index)
 
 
 if __name__ == "__main__":
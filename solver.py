@@ -0,0 +1,229 @@
+# Exhaustive solver → depth-first search over packed GameStates with a
+# transposition table, safe foundation autoplay and a node/time budget.
+# Classifies a deal as solvable (with the winning move list), unsolvable or unknown.
+
+import sys
+import time
+
+from card import RANK_OF, SUIT_OF, COLOR_OF
+import precheck
+from state import GameState
+
+SOLVABLE = 'solvable'
+UNSOLVABLE = 'unsolvable'
+UNKNOWN = 'unknown'
+
+# Moves are tuples naming the SolitaireGame/GameState method and its arguments,
+# e.g. ('move_tableau_to_tableau', 2, 5, 3) or ('draw_from_stock',).
+FLIPS_SOURCE = ('move_tableau_to_tableau', 'move_tableau_to_foundation')
+
+
+class SolveResult:
+    # Initialize SolveResult
+    def __init__(self, status, moves=None, nodes=0, elapsed=0.0):
+        self.status = status
+        self.moves = moves if moves is not None else []
+        self.nodes = nodes
+        self.elapsed = elapsed
+
+    def __repr__(self):
+        return f"SolveResult({self.status}, {len(self.moves)} moves, {self.nodes} nodes, {self.elapsed:.3f}s)"
+
+
+def apply_move(target, move):
+    """Plays a move tuple on a SolitaireGame or GameState, flipping the exposed card."""
+    getattr(target, move[0])(*move[1:])
+    if move[0] in FLIPS_SOURCE:
+        target.flip_top_tableau_card(move[1])
+
+
+def replay(game, moves):
+    """Plays a solver move list on a SolitaireGame. Returns True if the game is won."""
+    for move in moves:
+        apply_move(game, move)
+    return game.is_won()
+
+
+def _foundation_slot(state, code):
+    """First foundation that accepts code, or None."""
+    for i in range(4):
+        if state.can_place_foundation(code, i):
+            return i
+    return None
+
+
+def _is_safe(state, code):
+    """
+    A foundation play is safe when nothing could ever need the card on the
+    tableau: aces and twos, or both opposite-color cards one rank lower are home.
+    """
+    rank = RANK_OF[code]
+    if rank <= 1:
+        return True
+    needed = 0
+    for i in range(4):
+        top = state.foundation_top(i)
+        if top is not None and COLOR_OF[top] != COLOR_OF[code] and RANK_OF[top] >= rank - 1:
+            needed += 1
+    return needed == 2
+
+
+def _autoplay(state, path):
+    """Plays safe foundation moves until none are left, appending them to path."""
+    played = True
+    while played:
+        played = False
+        top = state.waste_top()
+        if top is not None and _is_safe(state, top):
+            slot = _foundation_slot(state, top)
+            if slot is not None:
+                move = ('move_waste_to_foundation', slot)
+                apply_move(state, move)
+                path.append(move)
+                played = True
+        for i in range(7):
+            top = state.tableau_top(i)
+            if top is not None and _is_safe(state, top):
+                slot = _foundation_slot(state, top)
+                if slot is not None:
+                    move = ('move_tableau_to_foundation', i, slot)
+                    apply_move(state, move)
+                    path.append(move)
+                    played = True
+
+
+def _canonical_key(state):
+    """
+    Transposition key. Tableau piles are sorted and foundations reduced to
+    per-suit heights, so positions that differ only by pile order share an entry.
+    """
+    piles = sorted(bytes([state.face_down(i)]) + bytes(state.tableau_pile(i)) for i in range(7))
+    heights = [0] * 4
+    for i in range(4):
+        top = state.foundation_top(i)
+        if top is not None:
+            heights[SUIT_OF[top]] = RANK_OF[top] + 1
+    return (b'|'.join(piles), bytes(heights), bytes(state.stock_cards()),
+            bytes(state.waste_cards()), state.stock_passes)
+
+
+def legal_moves(state):
+    """
+    Legal moves in search order: foundation plays, tableau moves that turn a card
+    over or empty a pile, waste to tableau, a stock draw, then the remaining
+    tableau moves. Moves that only swap a whole pile into an empty one are left
+    out, and of several empty piles only the first is tried.
+    """
+    foundation, revealing, from_waste, other = [], [], [], []
+    empty = [i for i in range(7) if state.tableau_len(i) == 0]
+    first_empty = empty[0] if empty else None
+
+    waste_top = state.waste_top()
+    if waste_top is not None:
+        slot = _foundation_slot(state, waste_top)
+        if slot is not None:
+            foundation.append(('move_waste_to_foundation', slot))
+        for dest in range(7):
+            if state.tableau_len(dest) == 0:
+                if dest == first_empty:
+                    from_waste.append(('move_waste_to_tableau', dest))
+            elif state.can_place_tableau(waste_top, dest):
+                from_waste.append(('move_waste_to_tableau', dest))
+
+    for src in range(7):
+        length = state.tableau_len(src)
+        if length == 0:
+            continue
+        face_down = state.face_down(src)
+        cards = state.tableau_pile(src)
+        slot = _foundation_slot(state, cards[-1])
+        if slot is not None:
+            foundation.append(('move_tableau_to_foundation', src, slot))
+        for start in range(face_down, length):
+            count = length - start
+            for dest in range(7):
+                if dest == src:
+                    continue
+                if state.tableau_len(dest) == 0:
+                    if dest != first_empty or start == 0:
+                        continue
+                elif not state.can_place_tableau(cards[start], dest):
+                    continue
+                move = ('move_tableau_to_tableau', src, dest, count)
+                if start == face_down:
+                    revealing.append(move)
+                else:
+                    other.append(move)
+
+    moves = foundation + revealing + from_waste
+    if state.stock_cards() or (state.waste_cards() and state.stock_passes < 3):
+        moves.append(('draw_from_stock',))
+    return moves + other
+
+
+def solve(game, max_nodes=200000, max_seconds=None, cancel=None):
+    """
+    Searches for a win from the current position of a SolitaireGame.
+    Returns a SolveResult: SOLVABLE with the winning moves, UNSOLVABLE when the
+    whole reachable space was exhausted (or the pre-check proved the deal dead), or UNKNOWN when the budget ran out or
+    cancel (a threading.Event) was set.
+    """
+    start_time = time.perf_counter()
+    deadline = start_time + max_seconds if max_seconds is not None else None
+    if precheck.analyze(game)[0] == precheck.LOST:
+        return SolveResult(UNSOLVABLE, [], 0, time.perf_counter() - start_time)
+
+    root = GameState.from_game(game)
+    path = []
+    _autoplay(root, path)
+    if root.is_won():
+        return SolveResult(SOLVABLE, path, 0, time.perf_counter() - start_time)
+
+    seen = {_canonical_key(root)}
+    # Each frame: (state, moves still to try, length of path when the frame was entered)
+    stack = [(root, legal_moves(root)[::-1], len(path))]
+    nodes = 0
+    while stack:
+        state, pending, depth = stack[-1]
+        if not pending:
+            stack.pop()
+            continue
+        if nodes >= max_nodes or (deadline is not None and time.perf_counter() > deadline) \
+                or (cancel is not None and cancel.is_set()):
+            return SolveResult(UNKNOWN, [], nodes, time.perf_counter() - start_time)
+
+        del path[depth:]
+        move = pending.pop()
+        child = state.clone()
+        apply_move(child, move)
+        path.append(move)
+        _autoplay(child, path)
+        nodes += 1
+        if child.is_won():
+            return SolveResult(SOLVABLE, list(path), nodes, time.perf_counter() - start_time)
+        key = _canonical_key(child)
+        if key in seen:
+            continue
+        seen.add(key)
+        stack.append((child, legal_moves(child)[::-1], len(path)))
+
+    return SolveResult(UNSOLVABLE, [], nodes, time.perf_counter() - start_time)
+
+
+if __name__ == "__main__":
+    from simulator import SolitaireSimulator
+
+    num_deals = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    max_nodes = int(sys.argv[2]) if len(sys.argv) > 2 else 200000
+    counts = {SOLVABLE: 0, UNSOLVABLE: 0, UNKNOWN: 0}
+    greedy_wins = 0
+    for seed in range(num_deals):
+        simulator = SolitaireSimulator(verbose=False, seed=seed)
+        result = solve(simulator.game, max_nodes=max_nodes)
+        greedy_wins += simulator.run_simulation()
+        counts[result.status] += 1
+        print(f"Deal {seed:4d}: {result}")
+    print(f"--- {num_deals} deals ---")
+    for status, count in counts.items():
+        print(f"  {status:<11} {count}")
+    print(f"  greedy wins {greedy_wins}")
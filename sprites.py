@@ -0,0 +1,121 @@
+# Sprite atlas → the 52 card faces and the card back, pre-resized to one card
+# size and packed into a single raw RGBA file. The cache is keyed by the size and
+# the source files' mtimes and sizes, rebuilt when any of them changes, and
+# loaded with one read; tiles are sliced out only when first asked for.
+
+import hashlib
+import os
+import struct
+import sys
+import time
+import uuid
+
+from PIL import Image
+
+from card import RANKS, SUITS
+
+IMAGE_DIR = 'images'
+BACK = 52  # tile index of the card back; card tiles are indexed by card code
+MAGIC = b'SOLATLS1'
+HEADER = struct.Struct('<8s32sHHH')  # magic, source digest, width, height, tile count
+
+
+def source_files(image_dir=IMAGE_DIR):
+    """PNG paths in tile order: card codes 0..51, then the back."""
+    files = [os.path.join(image_dir, f'{rank}_of_{suit}.png') for suit in SUITS for rank in RANKS]
+    files.append(os.path.join(image_dir, 'back_of_card.png'))
+    return files
+
+
+def source_digest(files, width, height):
+    """Digest of the tile size and every source file's name, mtime and size."""
+    digest = hashlib.sha256(f'{width}x{height}'.encode())
+    for path in files:
+        info = os.stat(path)
+        digest.update(f'{os.path.basename(path)}:{info.st_mtime_ns}:{info.st_size}'.encode())
+    return digest.digest()
+
+
+def cache_path(width, height, image_dir=IMAGE_DIR):
+    return os.path.join(image_dir, '.cache', f'atlas_{width}x{height}.rgba')
+
+
+class SpriteAtlas:
+    """Card tiles of one size backed by a single RGBA buffer."""
+
+    # Initialize SpriteAtlas
+    def __init__(self, width, height, data):
+        self.width = width
+        self.height = height
+        self.data = memoryview(data)
+        self.tile_bytes = width * height * 4
+        self.tiles = {}
+
+    def __len__(self):
+        return len(self.data) // self.tile_bytes
+
+    def tile(self, index):
+        """PIL image of tile index (a card code, or BACK), made on first use."""
+        image = self.tiles.get(index)
+        if image is None:
+            start = index * self.tile_bytes
+            image = Image.frombuffer('RGBA', (self.width, self.height),
+                                     self.data[start:start + self.tile_bytes], 'raw', 'RGBA', 0, 1)
+            self.tiles[index] = image
+        return image
+
+
+def build_atlas(files, width, height):
+    """Decodes and resizes every source image. Returns the packed RGBA bytes."""
+    data = bytearray()
+    for path in files:
+        with Image.open(path) as image:
+            data += image.convert('RGBA').resize((width, height)).tobytes()
+    return bytes(data)
+
+
+def load_atlas(width, height, image_dir=IMAGE_DIR):
+    """
+    Returns (SpriteAtlas, cold). Reads the cached atlas in one go when its
+    digest matches the sources; otherwise rebuilds it from the PNGs and rewrites
+    the cache (cold is then True).
+    """
+    files = source_files(image_dir)
+    digest = source_digest(files, width, height)
+    path = cache_path(width, height, image_dir)
+    try:
+        with open(path, 'rb') as f:
+            blob = f.read()
+        magic, cached_digest, w, h, count = HEADER.unpack_from(blob)
+        if (magic, cached_digest, w, h, count) == (MAGIC, digest, width, height, len(files)) \
+                and len(blob) == HEADER.size + count * width * height * 4:
+            return SpriteAtlas(width, height, memoryview(blob)[HEADER.size:]), False
+    except (OSError, struct.error):
+        pass
+
+    data = build_atlas(files, width, height)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Unique across hosts and containers sharing the cache directory
+        tmp = f'{path}.{uuid.uuid4().hex}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, digest, width, height, len(files)))
+            f.write(data)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # read-only image directory: run without a cache
+    return SpriteAtlas(width, height, data), True
+
+
+if __name__ == "__main__":
+    width = int(sys.argv[1]) if len(sys.argv) > 1 else 80
+    height = int(sys.argv[2]) if len(sys.argv) > 2 else 120
+    path = cache_path(width, height)
+    if os.path.exists(path):
+        os.remove(path)
+    for label in ('cold', 'warm'):
+        start = time.perf_counter()
+        atlas, cold = load_atlas(width, height)
+        for index in range(len(atlas)):
+            atlas.tile(index)
+        print(f"{label} load ({'rebuilt' if cold else 'cached'}): {time.perf_counter() - start:.3f}s")
@@ -0,0 +1,215 @@
+# Compact GameState → the whole layout packed into one flat bytearray of card
+# codes, so a position clones with a single buffer copy. Converts to and from
+# the SolitaireGame object model and mirrors its move methods for search code.
+
+from card import CARDS, RANK_OF, SUIT_OF, COLOR_OF
+from game import SolitaireGame
+from pile import Pile, MAX_PILE, MAX_STOCK
+
+EMPTY = 255           # foundation slot with no cards
+
+# Byte layout of the buffer
+TABLEAU_LEN = 0       # 7 bytes: cards in each tableau pile
+FACE_DOWN = 7         # 7 bytes: face-down prefix length of each tableau pile
+FOUNDATION_TOP = 14   # 4 bytes: top card code of each foundation (EMPTY if none)
+STOCK_LEN = 18
+WASTE_LEN = 19
+PASSES = 20
+MAX_PASSES_FLAG = 21
+TABLEAU = 22          # 7 * MAX_PILE bytes, bottom card first
+STOCK = TABLEAU + 7 * MAX_PILE   # stock as a stack, next card to draw last
+WASTE = STOCK + MAX_STOCK        # waste, top card last
+SIZE = WASTE + MAX_STOCK
+
+
+class GameState:
+    __slots__ = ('buf',)
+
+    # Initialize GameState (an empty board unless a buffer is given)
+    def __init__(self, buf=None):
+        if buf is None:
+            buf = bytearray(SIZE)
+            buf[FOUNDATION_TOP:FOUNDATION_TOP + 4] = bytes([EMPTY] * 4)
+        self.buf = buf
+
+    # Single buffer copy
+    def clone(self):
+        return GameState(self.buf[:])
+
+    def key(self):
+        """Returns an immutable copy of the buffer, usable as a dict/set key."""
+        return bytes(self.buf)
+
+    def __eq__(self, other):
+        return isinstance(other, GameState) and self.buf == other.buf
+
+    def __hash__(self):
+        return hash(bytes(self.buf))
+
+    # --- Conversion to and from SolitaireGame ---
+
+    @classmethod
+    def from_game(cls, game):
+        """Packs a SolitaireGame."""
+        state = cls()
+        buf = state.buf
+        for i, pile in enumerate(game.tableau):
+            if len(pile.cards) > MAX_PILE:
+                raise ValueError(f"Tableau {i} holds {len(pile.cards)} cards, more than {MAX_PILE}")
+            base = TABLEAU + i * MAX_PILE
+            buf[base:base + len(pile.cards)] = bytes(card.code for card in pile.cards)
+            buf[TABLEAU_LEN + i] = len(pile.cards)
+            buf[FACE_DOWN + i] = pile.face_down
+        for i, foundation in enumerate(game.foundations):
+            if foundation.cards:
+                buf[FOUNDATION_TOP + i] = foundation.cards[-1].code
+        stock = [card.code for card in game.stock.cards]
+        waste = [card.code for card in game.waste.cards]
+        for name, cards in (('Stock', stock), ('Waste', waste)):
+            if len(cards) > MAX_STOCK:
+                raise ValueError(f"{name} holds {len(cards)} cards, more than {MAX_STOCK}")
+        buf[STOCK:STOCK + len(stock)] = bytes(stock)
+        buf[WASTE:WASTE + len(waste)] = bytes(waste)
+        buf[STOCK_LEN] = len(stock)
+        buf[WASTE_LEN] = len(waste)
+        buf[PASSES] = game.stock_passes
+        buf[MAX_PASSES_FLAG] = 1 if game.max_passes_reached else 0
+        return state
+
+    def to_game(self):
+        """Unpacks into a new SolitaireGame (new piles holding the shared cards)."""
+        tableau = [Pile([CARDS[code] for code in self.tableau_pile(i)], self.buf[FACE_DOWN + i])
+                   for i in range(7)]
+        foundations = []
+        for i in range(4):
+            top = self.buf[FOUNDATION_TOP + i]
+            foundations.append(Pile([] if top == EMPTY else list(CARDS[top - RANK_OF[top]:top + 1])))
+        stock = Pile([CARDS[code] for code in self.stock_cards()])
+        waste = Pile([CARDS[code] for code in self.waste_cards()])
+        return SolitaireGame.from_piles(tableau, foundations, stock, waste,
+                                        stock_passes=self.stock_passes,
+                                        max_passes_reached=self.max_passes_reached)
+
+    # --- Read access ---
+
+    def tableau_pile(self, i):
+        """Card codes of tableau pile i, bottom first."""
+        base = TABLEAU + i * MAX_PILE
+        return self.buf[base:base + self.buf[TABLEAU_LEN + i]]
+
+    def tableau_len(self, i):
+        return self.buf[TABLEAU_LEN + i]
+
+    def face_down(self, i):
+        return self.buf[FACE_DOWN + i]
+
+    def tableau_top(self, i):
+        """Code of the top card of tableau pile i, or None if the pile is empty."""
+        n = self.buf[TABLEAU_LEN + i]
+        return self.buf[TABLEAU + i * MAX_PILE + n - 1] if n else None
+
+    def foundation_top(self, i):
+        top = self.buf[FOUNDATION_TOP + i]
+        return None if top == EMPTY else top
+
+    def foundation_len(self, i):
+        top = self.buf[FOUNDATION_TOP + i]
+        return 0 if top == EMPTY else RANK_OF[top] + 1
+
+    def stock_cards(self):
+        """Stock codes as a stack: the next card to be drawn is last."""
+        return self.buf[STOCK:STOCK + self.buf[STOCK_LEN]]
+
+    def waste_cards(self):
+        return self.buf[WASTE:WASTE + self.buf[WASTE_LEN]]
+
+    def waste_top(self):
+        n = self.buf[WASTE_LEN]
+        return self.buf[WASTE + n - 1] if n else None
+
+    @property
+    def stock_passes(self):
+        return self.buf[PASSES]
+
+    @property
+    def max_passes_reached(self):
+        return self.buf[MAX_PASSES_FLAG] == 1
+
+    def is_won(self):
+        return all(self.foundation_len(i) == 13 for i in range(4))
+
+    def is_lost(self):
+        return self.max_passes_reached
+
+    # --- Rules (on card codes) ---
+
+    def can_place_tableau(self, code, dest_index):
+        top = self.tableau_top(dest_index)
+        if top is None:
+            return True  # Allow any card on empty tableau piles
+        return COLOR_OF[code] != COLOR_OF[top] and RANK_OF[code] == RANK_OF[top] - 1
+
+    def can_place_foundation(self, code, foundation_index):
+        top = self.buf[FOUNDATION_TOP + foundation_index]
+        if top == EMPTY:
+            return RANK_OF[code] == 0
+        return SUIT_OF[code] == SUIT_OF[top] and RANK_OF[code] == RANK_OF[top] + 1
+
+    # --- Moves (same semantics as SolitaireGame, no legality checks) ---
+
+    def draw_from_stock(self):
+        buf = self.buf
+        if buf[STOCK_LEN] == 0:
+            if buf[PASSES] >= 3:
+                buf[MAX_PASSES_FLAG] = 1
+                return False
+            n = buf[WASTE_LEN]
+            if n == 0:
+                return False
+            # Recycle: the first card drawn onto the waste is drawn again first
+            buf[STOCK:STOCK + n] = buf[WASTE:WASTE + n][::-1]
+            buf[STOCK_LEN] = n
+            buf[WASTE_LEN] = 0
+            buf[PASSES] += 1
+        n = buf[STOCK_LEN] - 1
+        buf[WASTE + buf[WASTE_LEN]] = buf[STOCK + n]
+        buf[STOCK_LEN] = n
+        buf[WASTE_LEN] += 1
+        return True
+
+    def move_tableau_to_tableau(self, src_index, dest_index, num_cards):
+        buf = self.buf
+        src_len = buf[TABLEAU_LEN + src_index]
+        dest_len = buf[TABLEAU_LEN + dest_index]
+        src = TABLEAU + src_index * MAX_PILE
+        dest = TABLEAU + dest_index * MAX_PILE
+        buf[dest + dest_len:dest + dest_len + num_cards] = buf[src + src_len - num_cards:src + src_len]
+        buf[TABLEAU_LEN + src_index] = src_len - num_cards
+        buf[TABLEAU_LEN + dest_index] = dest_len + num_cards
+
+    def move_tableau_to_foundation(self, tableau_index, foundation_index):
+        n = self.buf[TABLEAU_LEN + tableau_index] - 1
+        self.buf[FOUNDATION_TOP + foundation_index] = self.buf[TABLEAU + tableau_index * MAX_PILE + n]
+        self.buf[TABLEAU_LEN + tableau_index] = n
+
+    def move_waste_to_tableau(self, tableau_index):
+        n = self.buf[WASTE_LEN]
+        if n > 0:
+            dest_len = self.buf[TABLEAU_LEN + tableau_index]
+            self.buf[TABLEAU + tableau_index * MAX_PILE + dest_len] = self.buf[WASTE + n - 1]
+            self.buf[TABLEAU_LEN + tableau_index] = dest_len + 1
+            self.buf[WASTE_LEN] = n - 1
+
+    def move_waste_to_foundation(self, foundation_index):
+        n = self.buf[WASTE_LEN]
+        if n > 0:
+            self.buf[FOUNDATION_TOP + foundation_index] = self.buf[WASTE + n - 1]
+            self.buf[WASTE_LEN] = n - 1
+
+    def flip_top_tableau_card(self, pile_index):
+        """Turns the top card face up if it is face down. Returns True if it flipped."""
+        n = self.buf[TABLEAU_LEN + pile_index]
+        if n and self.buf[FACE_DOWN + pile_index] == n:
+            self.buf[FACE_DOWN + pile_index] = n - 1
+            return True
+        return False
@@ -0,0 +1,142 @@
+# Streaming statistics → a constant-memory aggregate of finished games: outcome
+# counts, fixed-bin histograms of moves, foundation score and stock passes, and
+# integer sums for the moves mean. Aggregates from different workers merge
+# exactly, and the Wilson interval on the win rate tells a campaign when to stop.
+
+import math
+
+from simulator import MAX_MOVES, OUTCOMES
+
+LOSSES = ('max_passes', 'blocked', 'move_limit')
+MOVE_BUCKET = 10   # width of a moves histogram bin
+MAX_SCORE = 52
+MAX_PASSES = 3     # stock_passes never exceeds the 3-pass limit
+
+
+def wilson_interval(successes, trials, z=1.96):
+    """Wilson score interval (low, high) for a binomial proportion; (0, 1) with no trials."""
+    if trials == 0:
+        return 0.0, 1.0
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    center = (p + z * z / (2 * trials)) / denominator
+    half = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+class StatsAggregator:
+    """
+    Running totals over any number of games in O(1) memory. Feed it with add()
+    (a SolitaireSimulator.get_result() dict) or add_simulator(); combine the
+    aggregators of parallel workers with merge().
+    """
+
+    # Initialize StatsAggregator
+    def __init__(self, max_moves=MAX_MOVES):
+        self.max_moves = max_moves
+        self.games = 0
+        self.outcomes = dict.fromkeys(OUTCOMES, 0)
+        self.total_moves = 0
+        self.total_moves_squared = 0
+        # Last moves bin also collects anything past max_moves (or every long game when uncapped)
+        cap = max_moves if max_moves is not None else MAX_MOVES
+        self.move_bins = [0] * (cap // MOVE_BUCKET + 1)
+        self.score_bins = [0] * (MAX_SCORE + 1)
+        self.pass_bins = [0] * (MAX_PASSES + 1)
+
+    def add(self, result):
+        """Counts one finished game given as {'outcome', 'moves', 'score', 'stock_passes'}."""
+        moves = result['moves']
+        self.games += 1
+        self.outcomes[result['outcome']] += 1
+        self.total_moves += moves
+        self.total_moves_squared += moves * moves
+        self.move_bins[min(moves // MOVE_BUCKET, len(self.move_bins) - 1)] += 1
+        self.score_bins[result['score']] += 1
+        self.pass_bins[min(result['stock_passes'], MAX_PASSES)] += 1
+
+    def add_simulator(self, simulator):
+        self.add(simulator.get_result())
+
+    def merge(self, other):
+        """Adds another aggregator's counts into this one. Returns self."""
+        if len(other.move_bins) != len(self.move_bins):
+            raise ValueError("cannot merge aggregators with different move caps")
+        self.games += other.games
+        for outcome in OUTCOMES:
+            self.outcomes[outcome] += other.outcomes[outcome]
+        self.total_moves += other.total_moves
+        self.total_moves_squared += other.total_moves_squared
+        for bins, more in ((self.move_bins, other.move_bins), (self.score_bins, other.score_bins),
+                           (self.pass_bins, other.pass_bins)):
+            for i, count in enumerate(more):
+                bins[i] += count
+        return self
+
+    @property
+    def wins(self):
+        return self.outcomes['win']
+
+    def win_rate(self):
+        return self.wins / self.games if self.games else 0.0
+
+    def win_interval(self, z=1.96):
+        """Wilson confidence interval on the win rate (95% by default)."""
+        return wilson_interval(self.wins, self.games, z)
+
+    def converged(self, half_width, min_games=100, z=1.96):
+        """True once at least min_games were played and the win-rate interval is within ±half_width."""
+        if self.games < min_games:
+            return False
+        low, high = self.win_interval(z)
+        return (high - low) / 2 <= half_width
+
+    def mean_moves(self):
+        return self.total_moves / self.games if self.games else 0.0
+
+    def stdev_moves(self):
+        if self.games < 2:
+            return 0.0
+        variance = (self.total_moves_squared - self.total_moves * self.total_moves / self.games) / (self.games - 1)
+        return math.sqrt(max(0.0, variance))
+
+    def loss_reasons(self):
+        """Share of each loss reason among the games that were not won."""
+        losses = self.games - self.wins
+        return {reason: self.outcomes[reason] / losses if losses else 0.0 for reason in LOSSES}
+
+    def as_dict(self):
+        """JSON-ready copy of every counter; from_dict() rebuilds the aggregator."""
+        return {
+            'max_moves': self.max_moves,
+            'games': self.games,
+            'outcomes': dict(self.outcomes),
+            'total_moves': self.total_moves,
+            'total_moves_squared': self.total_moves_squared,
+            'move_bins': list(self.move_bins),
+            'score_bins': list(self.score_bins),
+            'pass_bins': list(self.pass_bins),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls(data['max_moves'])
+        stats.games = data['games']
+        stats.outcomes.update(data['outcomes'])
+        stats.total_moves = data['total_moves']
+        stats.total_moves_squared = data['total_moves_squared']
+        stats.move_bins = list(data['move_bins'])
+        stats.score_bins = list(data['score_bins'])
+        stats.pass_bins = list(data['pass_bins'])
+        return stats
+
+    def report(self):
+        """Human-readable summary."""
+        low, high = self.win_interval()
+        lines = [f"--- {self.games} game(s) ---",
+                 f"Win rate:       {self.win_rate():.2%}  (95% CI {low:.2%} .. {high:.2%})",
+                 f"Moves per game: {self.mean_moves():.1f} ± {self.stdev_moves():.1f}"]
+        for reason, share in self.loss_reasons().items():
+            lines.append(f"  {reason:<11} {self.outcomes[reason]:>8}  {share:.1%} of losses")
+        lines.append("Stock passes:   " + "  ".join(f"{p}: {n}" for p, n in enumerate(self.pass_bins)))
+        return '\n'.join(lines)
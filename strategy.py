@@ -0,0 +1,135 @@
+# Strategies → pluggable move policies for SolitaireSimulator. A strategy gets a
+# read-only GameView and the list of legal moves and returns the one to play.
+# Moves are the solver's tuples, e.g. ('move_tableau_to_tableau', 2, 5, 3), as
+# listed by SolitaireGame.legal_moves.
+# compare_strategies plays several policies on the same numbered deals.
+
+import os
+import random
+import sys
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+
+from simulator import SolitaireSimulator, MAX_MOVES
+
+
+class Strategy(ABC):
+    """Base class: override choose. Return None to stop (the game counts as blocked)."""
+
+    @abstractmethod
+    def choose(self, view, moves):
+        """The move to play from moves, given a GameView of the position."""
+
+
+class GreedyStrategy(Strategy):
+    """
+    The simulator's built-in policy: waste to foundation, tableau to foundation,
+    tableau runs (never straight back to the pile they came from), waste to
+    tableau, then draw. Plays the same games as SolitaireSimulator without a strategy.
+    """
+
+    # Initialize GreedyStrategy
+    def __init__(self):
+        self.last_tableau_move = None
+
+    def choose(self, view, moves):
+        # SolitaireGame.legal_moves already lists the move kinds in greedy priority order
+        for move in moves:
+            if move[0] == 'move_tableau_to_tableau':
+                src, dest = move[1], move[2]
+                # Single cards are not moved, nor a run straight back where it came from
+                if view.tableau_len(src) < 2 or self.last_tableau_move == (dest, src):
+                    continue
+                self.last_tableau_move = (src, dest)
+            else:
+                self.last_tableau_move = None
+            return move
+        return None
+
+
+class RandomStrategy(Strategy):
+    """Baseline: foundation plays when offered, otherwise any legal move at random."""
+
+    # Initialize RandomStrategy
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+
+    def choose(self, view, moves):
+        for move in moves:
+            if move[0] in ('move_waste_to_foundation', 'move_tableau_to_foundation'):
+                return move
+        return self.rng.choice(moves) if moves else None
+
+
+# Strategies the comparison harness can build by name in a worker process
+STRATEGIES = {
+    'greedy': GreedyStrategy,
+    'random': RandomStrategy,
+}
+
+
+def play_deals(name, first_deal, num_games, max_moves=MAX_MOVES):
+    """
+    Plays deal numbers first_deal .. first_deal + num_games - 1 with a named strategy.
+    Returns (wins, total_moves, decisions, seconds).
+    """
+    wins = total_moves = decisions = 0
+    start = time.perf_counter()
+    for deal in range(first_deal, first_deal + num_games):
+        simulator = SolitaireSimulator(verbose=False, max_moves=max_moves, seed=deal,
+                                       strategy=STRATEGIES[name]())
+        wins += simulator.run_simulation()
+        total_moves += simulator.moves_made
+        decisions += simulator.decisions
+    return wins, total_moves, decisions, time.perf_counter() - start
+
+
+def compare_strategies(names, num_games, first_deal=0, workers=None, chunk_size=None, max_moves=MAX_MOVES):
+    """
+    Plays the same numbered deals with each named strategy across a process pool.
+    Returns {name: {'games', 'wins', 'win_rate', 'moves_per_game', 'decisions_per_sec'}};
+    decisions_per_sec is measured on worker time, so it does not depend on the pool size.
+    """
+    if num_games <= 0:
+        raise ValueError("num_games must be positive")
+    for name in names:
+        if name not in STRATEGIES:
+            raise ValueError(f"Unknown strategy {name!r}")
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, num_games * len(names) // (workers * 4))
+
+    tasks = [(name, first_deal + offset, min(chunk_size, num_games - offset))
+             for name in names for offset in range(0, num_games, chunk_size)]
+    columns = [list(column) for column in zip(*tasks)]
+    if workers == 1:
+        results = list(map(play_deals, *columns, [max_moves] * len(tasks)))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(play_deals, *columns, [max_moves] * len(tasks)))
+
+    totals = {name: [0, 0, 0, 0.0] for name in names}
+    for (name, _, _), result in zip(tasks, results):
+        for k, value in enumerate(result):
+            totals[name][k] += value
+    report = {}
+    for name, (wins, total_moves, decisions, seconds) in totals.items():
+        report[name] = {
+            'games': num_games,
+            'wins': wins,
+            'win_rate': wins / num_games,
+            'moves_per_game': total_moves / num_games,
+            'decisions_per_sec': decisions / seconds if seconds > 0 else float('inf'),
+        }
+    return report
+
+
+if __name__ == "__main__":
+    num_games = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    names = sys.argv[2].split(',') if len(sys.argv) > 2 else list(STRATEGIES)
+    report = compare_strategies(names, num_games)
+    print(f"--- {num_games} deals per strategy ---")
+    print(f"{'strategy':<10} {'win rate':>9} {'moves':>8} {'decisions/s':>12}")
+    for name, row in report.items():
+        print(f"{name:<10} {row['win_rate']:>9.2%} {row['moves_per_game']:>8.1f} {row['decisions_per_sec']:>12.0f}")
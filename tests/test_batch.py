@@ -0,0 +1,54 @@
+import io
+import random
+import unittest
+from contextlib import redirect_stdout
+
+from batch import run_batch, play_games
+from simulator import SolitaireSimulator
+
+
+class TestBatchRunner(unittest.TestCase):
+    """Tests for the quiet simulator mode and the batch runner."""
+
+    def test_quiet_simulation_prints_nothing(self):
+        """A simulator created with verbose=False should not write to stdout."""
+        random.seed(1)
+        out = io.StringIO()
+        with redirect_stdout(out):
+            SolitaireSimulator(verbose=False).run_simulation()
+        self.assertEqual(out.getvalue(), "")
+
+    def test_move_limit_stops_simulation(self):
+        """Games always end, at the latest when the move cap is hit."""
+        random.seed(0)
+        simulator = SolitaireSimulator(verbose=False, max_moves=50)
+        simulator.run_simulation()
+        self.assertLessEqual(simulator.moves_made, 50)
+        self.assertIn(simulator.outcome, ('win', 'max_passes', 'blocked', 'move_limit'))
+
+    def test_play_games_counts(self):
+        """Every game played is counted in exactly one outcome."""
+        games, total_moves, outcomes = play_games(5, max_moves=200)
+        self.assertEqual(games, 5)
+        self.assertEqual(sum(outcomes.values()), 5)
+        self.assertGreater(total_moves, 0)
+
+    def test_run_batch_in_pool(self):
+        """The pool aggregates all chunks into one summary."""
+        summary = run_batch(6, workers=2, chunk_size=2, max_moves=200)
+        self.assertEqual(summary['games'], 6)
+        self.assertEqual(sum(summary['outcomes'].values()), 6)
+        self.assertTrue(0.0 <= summary['win_rate'] <= 1.0)
+        self.assertGreater(summary['games_per_sec'], 0)
+
+
+    def test_numbered_deals_independent_of_workers(self):
+        """A campaign over fixed deal numbers gives the same totals however it is split."""
+        inline = run_batch(6, workers=1, chunk_size=6, max_moves=150, first_deal=100)
+        pooled = run_batch(6, workers=2, chunk_size=2, max_moves=150, first_deal=100)
+        self.assertEqual(inline['outcomes'], pooled['outcomes'])
+        self.assertEqual(inline['moves_per_game'], pooled['moves_per_game'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+import json
+import unittest
+
+from bench import BENCHMARKS, compare, run_benchmarks
+
+
+class TestBenchmarks(unittest.TestCase):
+    """Tests for the benchmark report format (not for speed)."""
+
+    def test_report_is_json_with_machine_info(self):
+        report = run_benchmarks(['deck_shuffle', 'is_one_rank_lower'])
+        report = json.loads(json.dumps(report))
+        self.assertIn('python', report['machine'])
+        self.assertEqual(set(report['benchmarks']), {'deck_shuffle', 'is_one_rank_lower'})
+        for result in report['benchmarks'].values():
+            self.assertGreater(result['seconds_per_op'], 0)
+
+    def test_compare_gives_percent_delta(self):
+        """A run twice as slow as the baseline shows as +100%."""
+        baseline = {'benchmarks': {'full_game': {'seconds_per_op': 0.01}}}
+        current = {'benchmarks': {'full_game': {'seconds_per_op': 0.02},
+                                  'deck_init': {'seconds_per_op': 1e-5}}}
+        self.assertAlmostEqual(compare(baseline, current)['full_game'], 100.0)
+        self.assertNotIn('deck_init', compare(baseline, current))
+
+    def test_requested_hot_paths_are_covered(self):
+        for name in ('deck_init', 'deck_shuffle', 'game_deal', 'can_place_tableau',
+                     'is_one_rank_lower', 'best_non_draw_move', 'full_game'):
+            self.assertIn(name, BENCHMARKS)
+
+
+if __name__ == '__main__':
+    unittest.main()
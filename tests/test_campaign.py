@@ -0,0 +1,54 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from campaign import run_campaign, _add_range
+
+
+class TestCampaign(unittest.TestCase):
+    """Tests for checkpointed, resumable campaigns."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def test_resume_matches_uninterrupted_run(self):
+        whole, done = run_campaign(self.path('whole.json'), 25, shard_size=4, workers=1, max_moves=150)
+        self.assertTrue(done)
+        self.assertEqual(whole.games, 25)
+
+        path = self.path('resumed.json')
+        partial, done = run_campaign(path, 25, shard_size=4, workers=1, max_moves=150, max_shards=3)
+        self.assertFalse(done)
+        self.assertEqual(partial.games, 12)
+        with open(path) as f:
+            self.assertEqual(json.load(f)['completed'], [[0, 12]])
+        resumed, done = run_campaign(path, 25, shard_size=4, workers=2, max_moves=150)
+        self.assertTrue(done)
+        self.assertEqual(resumed.as_dict(), whole.as_dict())
+        # A finished campaign plays nothing more
+        again, done = run_campaign(path, 25, shard_size=4, workers=1, max_moves=150)
+        self.assertEqual(again.as_dict(), whole.as_dict())
+
+    def test_other_campaign_checkpoint_is_refused(self):
+        path = self.path('c.json')
+        run_campaign(path, 4, shard_size=2, workers=1, max_moves=50)
+        with self.assertRaises(ValueError):
+            run_campaign(path, 8, shard_size=2, workers=1, max_moves=50)
+
+    def test_add_range_coalesces(self):
+        ranges = []
+        for start, stop in ((10, 20), (0, 5), (5, 10), (30, 40)):
+            _add_range(ranges, start, stop)
+        self.assertEqual(ranges, [[0, 20], [30, 40]])
+
+
+if __name__ == '__main__':
+    unittest.main()
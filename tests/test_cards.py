@@ -1,5 +1,7 @@
+import pickle
 import unittest
-from card import Card
+from pile import Pile
+from card import Card, CARDS, RANK_OF, SUIT_OF, COLOR_OF, RED, BLACK, card_code
 
 class TestCard(unittest.TestCase):
     """Tests for the Card class."""
@@ -9,22 +11,52 @@ class TestCard(unittest.TestCase):
         return Card(rank, suit, face_up=face_up)
 
     def test_initialization(self):
-        """Test card initialization of rank, suit, and face_up state."""
+        """Test card initialization of rank and suit."""
         card1 = self.make_card('ace', 'spades', face_up=True)
         self.assertEqual(card1.rank, 'ace')
         self.assertEqual(card1.suit, 'spades')
-        self.assertTrue(card1.face_up)
-        
+        self.assertEqual(repr(card1), 'ace of spades')
+
     def test_flip_method(self):
-        """Test that the flip method correctly toggles the face_up state."""
+        """Flipping is done by the pile: the top card turns face up, the card object stays the same."""
         card = self.make_card('2', 'hearts', face_up=False)
-        self.assertFalse(card.face_up)
-        
-        card.flip()
-        self.assertTrue(card.face_up)
-        
-        card.flip()
-        self.assertFalse(card.face_up)
+        pile = Pile([card], face_down=1)
+        self.assertFalse(pile.is_face_up(0))
+
+        pile.flip_top()
+        self.assertTrue(pile.is_face_up(0))
+        self.assertIs(pile.cards[0], card)
+
+    def test_face_up_argument_is_ignored(self):
+        self.assertIs(self.make_card('king', 'clubs', face_up=True), self.make_card('king', 'clubs'))
+        self.assertIs(Card.from_code(25, face_up=True), CARDS[25])
+
+    def test_cards_are_shared_and_immutable(self):
+        """Every way of naming a card gives the one shared object, which cannot change."""
+        card = self.make_card('2', 'hearts')
+        self.assertIs(card, Card.from_code(card.code))
+        self.assertIs(card, CARDS[1])
+        self.assertIs(pickle.loads(pickle.dumps(card)), card)
+        with self.assertRaises(AttributeError):
+            card.code = 5
+        with self.assertRaises(AttributeError):
+            card.face_up = True
+
+    def test_int_code_round_trip(self):
+        """Rank and suit strings are views over the int code."""
+        for code in range(52):
+            card = Card.from_code(code)
+            self.assertEqual(card_code(card.rank, card.suit), code)
+            self.assertEqual(Card(card.rank, card.suit).code, code)
+
+    def test_lookup_tables(self):
+        """Rank, suit and color tables agree with the string names."""
+        queen = self.make_card('queen', 'diamonds')
+        self.assertEqual(RANK_OF[queen.code], 11)
+        self.assertEqual(SUIT_OF[queen.code], 1)
+        self.assertEqual(COLOR_OF[queen.code], RED)
+        self.assertEqual(COLOR_OF[self.make_card('2', 'clubs').code], BLACK)
+        self.assertEqual(queen.color, 'red')
 
 
 if __name__ == '__main__':
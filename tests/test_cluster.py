@@ -0,0 +1,102 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import cluster
+from batch import play_stats
+import campaign
+from campaign import run_campaign, write_checkpoint
+from cluster import init_queue, claim, work, collect, requeue_expired, status
+
+
+class TestCluster(unittest.TestCase):
+    """Tests for the shared-directory shard queue."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_worker_processes_match_single_process_run(self):
+        init_queue(self.directory, 30, first_deal=5, shard_size=4, max_moves=150)
+        script = os.path.abspath(cluster.__file__)
+        workers = [subprocess.Popen([sys.executable, script, 'work', self.directory],
+                                    cwd=os.path.dirname(script), stdout=subprocess.DEVNULL)
+                   for _ in range(3)]
+        for process in workers:
+            self.assertEqual(process.wait(60), 0)
+
+        stats, finished = collect(self.directory)
+        self.assertTrue(finished)
+        self.assertEqual(status(self.directory), {'pending': 0, 'claimed': 0, 'done': 8})
+        self.assertEqual(stats.as_dict(), play_stats(30, 150, 5).as_dict())
+
+    def test_expired_claim_is_replayed_once(self):
+        init_queue(self.directory, 12, shard_size=4, max_moves=100)
+        # A worker claims the first shard and dies before writing its result
+        name = claim(self.directory)
+        path = os.path.join(self.directory, cluster.CLAIMED, name)
+        old = time.time() - 60
+        os.utime(path, (old, old))
+
+        self.assertEqual(work(self.directory, lease=30), 3)
+        self.assertEqual(requeue_expired(self.directory, lease=30), [])
+        stats, finished = collect(self.directory)
+        self.assertTrue(finished)
+        self.assertEqual(stats.as_dict(), play_stats(12, 100, 0).as_dict())
+
+    def test_live_claim_is_left_alone(self):
+        init_queue(self.directory, 8, shard_size=4, max_moves=100)
+        claim(self.directory)
+        self.assertEqual(work(self.directory, lease=30), 1)
+        stats, finished = collect(self.directory)
+        self.assertFalse(finished)
+        self.assertEqual(stats.games, 4)
+        self.assertEqual(status(self.directory), {'pending': 0, 'claimed': 1, 'done': 1})
+
+    def test_partial_results_resume_as_a_campaign(self):
+        init_queue(self.directory, 10, shard_size=4, max_moves=100)
+        work(self.directory, max_shards=1)
+        checkpoint = os.path.join(self.directory, 'campaign.json')
+        stats, finished = collect(self.directory, checkpoint)
+        self.assertFalse(finished)
+        with open(checkpoint) as f:
+            self.assertEqual(json.load(f)['completed'], [[0, 4]])
+        resumed, done = run_campaign(checkpoint, 10, shard_size=4, workers=1, max_moves=100)
+        self.assertTrue(done)
+        self.assertEqual(resumed.as_dict(), play_stats(10, 100, 0).as_dict())
+
+    def test_temporary_names_do_not_depend_on_the_pid(self):
+        """Workers with the same pid on two hosts must not share a temporary file."""
+        path = os.path.join(self.directory, 'result.json')
+        temporaries = []
+        replace = os.replace
+
+        def record(src, dst):
+            temporaries.append(src)
+            replace(src, dst)
+        with mock.patch.object(campaign.os, 'getpid', return_value=42), \
+                mock.patch.object(campaign.os, 'replace', side_effect=record):
+            write_checkpoint(path, {'n': 1})
+            write_checkpoint(path, {'n': 2})
+        self.assertNotEqual(temporaries[0], temporaries[1])
+        self.assertEqual(os.listdir(self.directory), ['result.json'])
+
+    def test_init_tops_up_and_refuses_other_campaigns(self):
+        init_queue(self.directory, 8, shard_size=4, max_moves=100)
+        work(self.directory, max_shards=1)
+        init_queue(self.directory, 8, shard_size=4, max_moves=100)
+        self.assertEqual(status(self.directory), {'pending': 1, 'claimed': 0, 'done': 1})
+        with self.assertRaises(ValueError):
+            init_queue(self.directory, 16, shard_size=4, max_moves=100)
+
+
+if __name__ == '__main__':
+    unittest.main()
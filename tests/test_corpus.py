@@ -0,0 +1,49 @@
+import os
+import tempfile
+import unittest
+
+from corpus import Corpus, RECORD_SIZE, run_corpus, summarize
+from simulator import SolitaireSimulator
+
+
+class TestCorpus(unittest.TestCase):
+    """Tests for the memory-mapped deal corpus."""
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix='.bin')
+        os.close(handle)
+        Corpus.create(self.path, 8, first_deal=40).close()
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_records_are_fixed_width(self):
+        """Each deal takes one fixed-size record holding a permutation of the deck."""
+        self.assertEqual(os.path.getsize(self.path), 8 * RECORD_SIZE)
+        with Corpus(self.path, readonly=True) as corpus:
+            self.assertEqual(len(corpus), 8)
+            self.assertEqual(sorted(corpus.deal(2)), list(range(52)))
+            self.assertIsNone(corpus.result(2))
+
+    def test_stored_deal_matches_seeded_game(self):
+        """Record i deals the same game as deal number first_deal + i."""
+        with Corpus(self.path, readonly=True) as corpus:
+            game = corpus.game(3)
+        seeded = SolitaireSimulator(verbose=False, seed=43).game
+        self.assertEqual([c.code for p in game.tableau for c in p.cards],
+                         [c.code for p in seeded.tableau for c in p.cards])
+        self.assertEqual([c.code for c in game.stock.cards], [c.code for c in seeded.stock.cards])
+
+    def test_pool_writes_results_in_place(self):
+        """Workers write each result next to its deal; they match a direct run."""
+        games, _ = run_corpus(self.path, workers=2, chunk_size=3, max_moves=150)
+        self.assertEqual(games, 8)
+        self.assertEqual(sum(summarize(self.path).values()), 8)
+        simulator = SolitaireSimulator(verbose=False, max_moves=150, seed=45)
+        simulator.run_simulation()
+        with Corpus(self.path, readonly=True) as corpus:
+            self.assertEqual(corpus.result(5), simulator.get_result())
+
+
+if __name__ == '__main__':
+    unittest.main()
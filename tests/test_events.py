@@ -0,0 +1,57 @@
+import io
+import json
+import random
+import unittest
+
+from events import ConsoleSink, JsonlSink
+from simulator import SolitaireSimulator
+
+MOVE_EVENTS = ('draw', 'waste_to_foundation', 'tableau_to_foundation',
+               'tableau_to_tableau', 'waste_to_tableau')
+
+
+class TestEventSinks(unittest.TestCase):
+    """Tests for the simulator's move reporting sinks."""
+
+    def test_console_sink_formats_moves(self):
+        """ConsoleSink prints the classic move lines."""
+        out = io.StringIO()
+        sink = ConsoleSink(out)
+        sink.emit('waste_to_foundation', move=5, card=0, foundation=2)
+        sink.emit('draw', move=31, passes=1, new_pass=True)
+        sink.emit('end', outcome='blocked', moves=40, max_moves=1000)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(lines[0], "[005] Waste (ace) -> Foundation 2")
+        self.assertEqual(lines[1], "[031] Stock Draw (Pass 1)")
+        self.assertIn("Game blocked", lines[-1])
+
+    def test_jsonl_sink_writes_in_blocks(self):
+        """Lines reach the file only once a block fills up or on flush."""
+        out = io.StringIO()
+        sink = JsonlSink(out, block_size=3, game=7)
+        sink.emit('draw', move=1, passes=0, new_pass=False)
+        sink.emit('draw', move=2, passes=0, new_pass=False)
+        self.assertEqual(out.getvalue(), "")
+        sink.emit('draw', move=3, passes=0, new_pass=False)
+        sink.emit('start')
+        self.assertEqual(len(out.getvalue().splitlines()), 3)
+        sink.close()
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(len(records), 4)
+        self.assertEqual(records[0], {'event': 'draw', 'game': 7, 'move': 1, 'passes': 0, 'new_pass': False})
+
+    def test_simulator_reports_every_move(self):
+        """A JSONL log of a game has one move event per move made."""
+        random.seed(2)
+        out = io.StringIO()
+        simulator = SolitaireSimulator(max_moves=200, sink=JsonlSink(out))
+        simulator.run_simulation()
+        simulator.sink.flush()
+        events = [json.loads(line)['event'] for line in out.getvalue().splitlines()]
+        self.assertEqual(events[0], 'start')
+        self.assertEqual(events[-1], 'end')
+        self.assertEqual(sum(e in MOVE_EVENTS for e in events), simulator.moves_made)
+
+
+if __name__ == '__main__':
+    unittest.main()
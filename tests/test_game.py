@@ -1,8 +1,10 @@
 import unittest
 import random
-from game import SolitaireGame
+from game import SolitaireGame, Move, MOVE_ORDER, PASS_LIMIT
 from pile import Pile
-from card import Card
+from card import Card, RANK_OF, COLOR_OF
+from simulator import SolitaireSimulator
+import zobrist
 
 def make_card(rank, suit, face_up=False):
     """Utility to quickly create a Card object."""
@@ -22,13 +24,27 @@ class TestSolitaireGame(unittest.TestCase):
         total_tableau_cards = 0
         for i, pile in enumerate(self.game.tableau):
             self.assertEqual(len(pile.cards), i + 1)
-            self.assertTrue(pile.cards[-1].face_up)
+            self.assertEqual(pile.face_down, i)  # only the top card is face up
             total_tableau_cards += len(pile.cards)
             
         self.assertEqual(total_tableau_cards, 28)
         self.assertEqual(len(self.game.stock.cards), 24)
         self.assertEqual(len(self.game.waste.cards), 0)
 
+    def test_seeded_deals_are_reproducible(self):
+        """The same deal number gives the same layout, regardless of global random state."""
+        def codes(game):
+            return [card.code for pile in game.tableau + [game.stock] for card in pile.cards]
+        random.seed(1)
+        first = SolitaireGame(seed=1234)
+        random.seed(2)
+        second = SolitaireGame(seed=1234)
+        self.assertEqual(codes(first), codes(second))
+        self.assertEqual(first.seed, 1234)
+        self.assertNotEqual(codes(first), codes(SolitaireGame(seed=1235)))
+        # Unseeded games record the seed they were dealt from
+        self.assertEqual(codes(SolitaireGame(seed=self.game.seed)), codes(self.game))
+
     def test_draw_from_stock_and_recycle(self):
         """Test drawing one card at a time and recycling the waste."""
         
@@ -77,6 +93,114 @@ class TestSolitaireGame(unittest.TestCase):
                 
         self.assertTrue(self.game.is_won())
 
+    def assert_index_consistent(self, game):
+        """The move index must agree with a brute-force scan of the rules."""
+        rules = SolitaireSimulator(verbose=False)
+        for code in range(52):
+            card = Card.from_code(code)
+            expected = sum(1 << i for i, pile in enumerate(game.tableau)
+                           if game.can_place_tableau(card, pile))
+            self.assertEqual(game.tableau_destinations(card), expected, card)
+            foundation = next((i for i, pile in enumerate(game.foundations)
+                               if rules._can_place_foundation_rule(card, pile)), None)
+            self.assertEqual(game.foundation_destination(card), foundation, card)
+
+    def assert_tracking_consistent(self, game):
+        """Foundation heights, played/talon masks and locations must match the piles."""
+        fresh = SolitaireGame.from_piles(game.tableau, game.foundations, game.stock, game.waste)
+        self.assertEqual(game.heights, fresh.heights)
+        self.assertEqual(game.played, fresh.played)
+        self.assertEqual(game.talon_mask, fresh.talon_mask)
+        self.assertEqual(game.location, fresh.location)
+        for code in range(52):
+            lower = [f.cards[-1].code for f in game.foundations if f.cards]
+            needed = sum(1 for top in lower
+                         if COLOR_OF[top] != COLOR_OF[code] and RANK_OF[top] >= RANK_OF[code] - 1)
+            self.assertEqual(game.is_safe_foundation(code), RANK_OF[code] <= 1 or needed == 2, code)
+
+    def test_move_index_tracks_moves(self):
+        """The index is updated by every game move, not rebuilt."""
+        self.assert_index_consistent(self.game)
+        for seed in range(5):
+            random.seed(seed)
+            simulator = SolitaireSimulator(verbose=False, max_moves=80)
+            simulator.run_simulation()
+            self.assert_index_consistent(simulator.game)
+            self.assert_tracking_consistent(simulator.game)
+
+
+    def test_undo_restores_every_move(self):
+        """Undoing a random playout newest first gives back the exact start position."""
+        def snapshot(game):
+            def cards(pile):
+                return [card.code for card in pile.cards], pile.face_down
+            return ([cards(p) for p in game.tableau], [cards(p) for p in game.foundations],
+                    cards(game.stock), cards(game.waste), game.stock_passes,
+                    game.max_passes_reached, game.hash)
+
+        rng = random.Random(9)
+        game = self.game
+        start = snapshot(game)
+        journal = []
+        while len(journal) < 400 and not game.is_lost():
+            move = rng.choice(game.legal_moves())
+            journal.append(getattr(game, move[0])(*move[1:]))
+            if move[0] in ('move_tableau_to_tableau', 'move_tableau_to_foundation'):
+                flip = game.flip_top_tableau_card(move[1])
+                if flip is not None:
+                    journal.append(flip)
+        self.assertTrue(all(record is not None for record in journal))
+        self.assertEqual(game.hash, zobrist.hash_game(game))
+        self.assert_tracking_consistent(game)
+        while journal:
+            game.undo(journal.pop())
+            if len(journal) % 50 == 0:
+                self.assert_tracking_consistent(game)
+        self.assertEqual(snapshot(game), start)
+        self.assert_index_consistent(game)
+        self.assertEqual(game.hash, zobrist.hash_game(game))
+
+    def test_no_draw_after_pass_limit(self):
+        """The terminating draw is offered once; after it records the pass limit nothing is left to draw."""
+        tableau = [Pile([make_card('king', 'spades')])] + [Pile([make_card('king', 'hearts')])] + \
+            [Pile() for _ in range(5)]
+        game = SolitaireGame.from_piles(tableau, [Pile() for _ in range(4)], Pile(), Pile(), stock_passes=3)
+        self.assertTrue(game.is_legal(('draw_from_stock',)))
+        self.assertEqual(game.draw_from_stock()[0], PASS_LIMIT)
+        self.assertTrue(game.is_lost())
+        self.assertFalse(game.is_legal(('draw_from_stock',)))
+        self.assertNotIn('draw_from_stock', [move.name for move in game.legal_moves()])
+
+    def test_iter_legal_moves(self):
+        """The generator is lazy, follows the requested order and marks recycles."""
+        rng = random.Random(4)
+        game = self.game
+        for _ in range(300):
+            moves = game.legal_moves()
+            self.assertEqual(moves, list(game.iter_legal_moves(MOVE_ORDER)))
+            reverse = list(game.iter_legal_moves(MOVE_ORDER[::-1]))
+            self.assertEqual(sorted(reverse), sorted(moves))
+            for move in moves:
+                self.assertTrue(game.is_legal(tuple(move)))
+                if move.name == 'draw_from_stock':
+                    self.assertEqual(move.recycle, not game.stock.cards and game.stock_passes < 3)
+            if game.is_lost():
+                break
+            move = rng.choice(moves)
+            getattr(game, move.name)(*move.args)
+            if move.name in ('move_tableau_to_tableau', 'move_tableau_to_foundation'):
+                game.flip_top_tableau_card(move.args[0])
+        self.assertFalse(game.is_legal(('move_tableau_to_tableau', 0, 0, 1)))
+        with self.assertRaises(ValueError):
+            game.iter_legal_moves(('shuffle',))
+
+        # Stopping at the first draw never looks at the tableau
+        def fail(card):
+            raise AssertionError("tableau scanned")
+        game = SolitaireGame(1)
+        game.tableau_destinations = fail
+        self.assertIsInstance(next(game.iter_legal_moves(('draw_from_stock', 'move_tableau_to_tableau'))), Move)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
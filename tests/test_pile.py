@@ -0,0 +1,73 @@
+import unittest
+from card import Card
+from deck import Deck
+from pile import Pile
+
+
+class TestPile(unittest.TestCase):
+    """Tests for the stack operations on Pile and the Deck cursor."""
+
+    def make_pile(self, n):
+        """Utility to build a pile of n distinct cards, bottom first."""
+        return Pile([Card.from_code(code) for code in range(n)])
+
+    def test_take_top_pops_from_the_end(self):
+        """take_top(n) removes the top n cards and keeps their order."""
+        pile = self.make_pile(5)
+        cards = pile.cards
+        moved = pile.take_top(2)
+        self.assertEqual([card.code for card in moved], [3, 4])
+        self.assertEqual([card.code for card in pile.cards], [0, 1, 2])
+        self.assertIs(pile.cards, cards)  # truncated in place, not reallocated
+
+    def test_take_top_whole_pile_and_none(self):
+        pile = self.make_pile(3)
+        self.assertEqual(pile.take_top(0), [])
+        self.assertEqual(len(pile.take_top(3)), 3)
+        self.assertEqual(len(pile), 0)
+
+    def test_pop_and_peek(self):
+        pile = self.make_pile(2)
+        self.assertIs(pile.peek(), pile.cards[-1])
+        self.assertEqual(pile.pop().code, 1)
+        self.assertEqual(pile.peek().code, 0)
+
+    def test_deck_draw_advances_cursor(self):
+        """Deck.draw deals in order through a cursor; remaining() is what is left."""
+        deck = Deck()
+        order = list(deck.cards)
+        self.assertEqual(deck.draw(3), order[:3])
+        self.assertEqual(deck.draw(), order[3:4])
+        self.assertEqual(deck.remaining(), order[4:])
+        deck.reset()
+        self.assertEqual(len(deck.remaining()), 52)
+
+
+    def test_face_down_prefix(self):
+        """Visibility is a face-down count: flipping and removing cards keep it in range."""
+        pile = Pile([Card.from_code(code) for code in range(3)], face_down=3)
+        self.assertFalse(pile.is_face_up(2))
+        self.assertTrue(pile.flip_top())
+        self.assertTrue(pile.is_face_up(2))
+        self.assertFalse(pile.flip_top())  # the top is already up
+        pile.take_top(2)
+        self.assertEqual(pile.face_down, 1)
+        self.assertTrue(pile.flip_top())
+        self.assertEqual(pile.face_down, 0)
+
+    def test_decks_share_cards(self):
+        """Decks shuffle the same 52 card objects instead of making new ones."""
+        first, second = Deck(1), Deck(2)
+        self.assertEqual({id(card) for card in first.cards}, {id(card) for card in second.cards})
+        first.reset()
+        self.assertIs(first.cards[0], Card.from_code(0))
+
+    def test_fixed_order_deck_can_shuffle(self):
+        deck = Deck.from_codes(range(52))
+        self.assertIs(deck.cards[5], Card.from_code(5))
+        deck.shuffle()
+        self.assertEqual(sorted(card.code for card in deck.cards), list(range(52)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import random
+import unittest
+from unittest import mock
+
+import precheck
+from deck import Deck
+from game import SolitaireGame
+from pile import Pile
+from card import Card
+from simulator import SolitaireSimulator
+from solver import solve, apply_move, SOLVABLE, UNSOLVABLE
+
+
+def no_moves_deal():
+    """A deal whose tops are all red and whose aces and black children are face down."""
+    tops = [12, 25, 11, 24, 10, 23, 9]
+    hidden = [37, 50, 36, 49, 35, 48, 34, 47, 0, 13, 26, 39, 1, 2, 3, 4, 5, 6, 7, 14, 15]
+    codes = []
+    for i, top in enumerate(tops):
+        codes += hidden[:i] + [top]
+        hidden = hidden[i:]
+    codes += [code for code in range(52) if code not in codes]
+    return SolitaireGame(deck=Deck.from_codes(codes))
+
+
+def cards(codes):
+    return [Card.from_code(code) for code in codes]
+
+
+def midgame_position():
+    """A mid-game position where runs rest on their parents; the solver wins it."""
+    layout = [(0, [24, 36, 22, 47, 7, 45]), (1, [49, 31, 17]), (2, [40, 14, 12, 37]),
+              (2, [28, 42, 44, 4, 29, 15]), (1, [13, 43, 16]),
+              (4, [38, 19, 5, 2, 25, 50, 10, 35, 8, 46, 6]), (0, [20, 32, 18, 30, 3, 41])]
+    tableau = [Pile(cards(codes), face_down) for face_down, codes in layout]
+    foundations = [Pile(cards(codes)) for codes in ([39], [0, 1], [26, 27], [])]
+    return SolitaireGame.from_piles(tableau, foundations, Pile(cards([21, 48, 9, 33, 23])),
+                                    Pile(cards([11, 51, 34])), stock_passes=3)
+
+
+def solve_unchecked(game, **budget):
+    """The solver's verdict with the pre-check bypassed."""
+    with mock.patch.object(precheck, 'analyze', return_value=(precheck.UNKNOWN, None)):
+        return solve(game, **budget)
+
+
+class TestPrecheck(unittest.TestCase):
+    """Tests for the static dead-deal analyzer."""
+
+    def test_no_moves_deal(self):
+        """The pre-check flags the deal, and greedy play indeed only draws until the pass limit."""
+        self.assertEqual(precheck.analyze(no_moves_deal()), (precheck.LOST, precheck.NO_MOVES))
+        simulator = SolitaireSimulator(verbose=False, game=no_moves_deal())
+        simulator.run_simulation()
+        self.assertEqual(simulator.get_result()['outcome'], 'max_passes')
+        self.assertEqual(simulator.get_score(), 0)
+
+    def test_frozen_deal(self):
+        game = SolitaireGame(7067)
+        self.assertEqual(precheck.analyze(game), (precheck.LOST, precheck.FROZEN))
+        self.assertEqual(solve(game).status, UNSOLVABLE)
+
+    def test_run_on_its_parent_is_not_frozen(self):
+        """A card resting on its parent still moves with the run based under it."""
+        game = midgame_position()
+        self.assertEqual(precheck.analyze(game), (precheck.UNKNOWN, None))
+        self.assertEqual(solve_unchecked(midgame_position()).status, SOLVABLE)
+
+    def test_midgame_verdicts_agree_with_solver(self):
+        for seed in range(10):
+            game = SolitaireGame(seed)
+            rng = random.Random(seed)
+            for _ in range(150):
+                moves = game.legal_moves()
+                if not moves:
+                    break
+                apply_move(game, rng.choice(moves))
+                if precheck.analyze(game)[0] == precheck.LOST:
+                    self.assertNotEqual(solve_unchecked(game, max_nodes=20000).status, SOLVABLE)
+                    break
+
+    def test_all_face_up_is_won(self):
+        tableau = [Pile([Card.from_code(12), Card.from_code(50)])] + [Pile() for _ in range(6)]
+        foundations = [Pile([Card.from_code(code) for code in range(suit * 13, suit * 13 + 13)])
+                       for suit in (1, 2)] + [Pile([Card.from_code(code) for code in range(12)]),
+                                              Pile([Card.from_code(code) for code in range(39, 50)])]
+        game = SolitaireGame.from_piles(tableau, foundations, Pile(), Pile())
+        self.assertEqual(precheck.analyze(game), (precheck.WON, precheck.ALL_FACE_UP))
+
+    def test_flagged_deals_are_never_won(self):
+        for seed in range(300):
+            game = SolitaireGame(seed)
+            if precheck.analyze(game)[0] == precheck.LOST:
+                self.assertFalse(SolitaireSimulator(verbose=False, game=game).run_simulation())
+
+
+if __name__ == '__main__':
+    unittest.main()
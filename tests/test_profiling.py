@@ -0,0 +1,59 @@
+import unittest
+
+from batch import run_batch
+from profiling import PHASES
+from simulator import SolitaireSimulator
+from strategy import GreedyStrategy
+
+
+class TestProfiling(unittest.TestCase):
+    """Tests for the opt-in simulator profile."""
+
+    def test_profile_counts_every_move(self):
+        """Each move made is exactly one fired phase; play is unchanged."""
+        plain = SolitaireSimulator(verbose=False, max_moves=300, seed=4)
+        plain.run_simulation()
+        profiled = SolitaireSimulator(verbose=False, max_moves=300, seed=4, profile=True)
+        profiled.run_simulation()
+        self.assertEqual(profiled.get_result(), plain.get_result())
+
+        profile = profiled.profile
+        self.assertEqual(sum(profile.fired.values()), profiled.moves_made)
+        # A tier is only evaluated when every tier before it did not move
+        evaluated = [profile.evaluated[phase] for phase in PHASES[:4]]
+        self.assertEqual(evaluated, sorted(evaluated, reverse=True))
+        self.assertGreaterEqual(profile.candidates, profile.fired['tableau_sequence'])
+        self.assertTrue(all(profile.ns[phase] >= 0 for phase in PHASES))
+
+    def test_disabled_profile_leaves_methods_alone(self):
+        simulator = SolitaireSimulator(verbose=False, seed=4)
+        self.assertIsNone(simulator.profile)
+        self.assertEqual(simulator.tiers[0], simulator._tier_waste_to_foundation)
+        self.assertNotIn('try_stock_draw', vars(simulator))
+
+    def test_profile_leaves_game_alone(self):
+        simulator = SolitaireSimulator(verbose=False, seed=4, profile=True)
+        self.assertNotIn('tableau_destinations', vars(simulator.game))
+
+    def test_strategy_run_records_phases(self):
+        """The greedy strategy fires the same phases as the built-in greedy tiers."""
+        greedy = SolitaireSimulator(verbose=False, max_moves=300, seed=4, profile=True)
+        greedy.run_simulation()
+        chosen = SolitaireSimulator(verbose=False, max_moves=300, seed=4, profile=True, strategy=GreedyStrategy())
+        chosen.run_simulation()
+        self.assertEqual(chosen.profile.fired, greedy.profile.fired)
+        self.assertEqual(sum(chosen.profile.fired.values()), chosen.moves_made)
+        for phase in PHASES:
+            self.assertGreaterEqual(chosen.profile.evaluated[phase], chosen.profile.fired[phase])
+
+    def test_batch_aggregates_profiles(self):
+        summary = run_batch(4, workers=2, chunk_size=2, max_moves=120, first_deal=0, profile=True)
+        profile = summary['profile']
+        self.assertEqual(profile.games, 4)
+        self.assertEqual(profile.as_dict()['games'], 4)
+        self.assertIn('tableau_sequence', profile.report())
+        self.assertNotIn('profile', run_batch(2, workers=1, max_moves=50))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import random
+import unittest
+from card import Card
+from game import SolitaireGame
+from pile import Pile
+from solver import solve, replay, SOLVABLE, UNSOLVABLE, UNKNOWN
+
+
+def stuck_game():
+    """Utility to build a position with no legal move: nines home, kings and jacks on top."""
+    tableau = [[Card('10', 'hearts'), Card('king', 'hearts')],
+               [Card('10', 'diamonds'), Card('king', 'diamonds')],
+               [Card('10', 'clubs'), Card('king', 'clubs')],
+               [Card('10', 'spades'), Card('king', 'spades')],
+               [Card('queen', 'hearts'), Card('queen', 'diamonds'), Card('jack', 'hearts')],
+               [Card('queen', 'clubs'), Card('queen', 'spades'), Card('jack', 'diamonds')],
+               [Card('jack', 'spades'), Card('jack', 'clubs')]]
+    foundations = [Pile([Card.from_code(code) for code in range(suit * 13, suit * 13 + 9)])
+                   for suit in range(4)]
+    return SolitaireGame.from_piles([Pile(cards, len(cards) - 1) for cards in tableau], foundations, Pile(), Pile())
+
+
+class TestSolver(unittest.TestCase):
+    """Tests for the depth-first solver."""
+
+    def test_solvable_deal_replays_to_a_win(self):
+        random.seed(1)
+        game = SolitaireGame()
+        result = solve(game, max_nodes=50000)
+        self.assertEqual(result.status, SOLVABLE)
+        self.assertFalse(game.is_won())  # solving does not touch the game
+        self.assertTrue(replay(game, result.moves))
+
+    def test_stuck_position_is_unsolvable(self):
+        result = solve(stuck_game())
+        self.assertEqual(result.status, UNSOLVABLE)
+        self.assertEqual(result.moves, [])
+
+    def test_budget_gives_unknown(self):
+        random.seed(1)
+        result = solve(SolitaireGame(), max_nodes=5)
+        self.assertEqual(result.status, UNKNOWN)
+        self.assertLessEqual(result.nodes, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
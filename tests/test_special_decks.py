@@ -41,17 +41,13 @@ class TestSolitaireGame(SolitaireGame):
             cards_to_add = self.deck.draw(i + 1)
             
             # The cards in the custom deck are in the EXACT order needed for the tableau.
-            # We explicitly set face_up status based on the deal structure (top card up, rest down)
-            for card in cards_to_add[:-1]:
-                card.face_up = False
-            cards_to_add[-1].face_up = True
+            # We explicitly set the face-down count based on the deal structure (top card up, rest down)
             pile.add_multiple(cards_to_add)
+            pile.face_down = len(cards_to_add) - 1
 
         # 3. Foundations and Stock/Waste setup
         self.foundations = [Pile() for _ in range(4)]
-        self.stock = Pile(self.deck.cards)
-        for card in self.stock.cards:
-            card.face_up = False # Stock cards must be face down
+        self.stock = Pile(self.deck.remaining()[::-1]) # Stock cards are always face down
         self.waste = Pile()
 
 # ---------------------------------------------
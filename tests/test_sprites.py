@@ -0,0 +1,52 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+try:
+    from PIL import Image
+    from sprites import BACK, cache_path, load_atlas, source_files
+except ImportError:  # Pillow is optional outside the GUI
+    Image = None
+
+
+@unittest.skipIf(Image is None, "Pillow is not installed")
+class TestSpriteAtlas(unittest.TestCase):
+    """Tests for the on-disk sprite atlas cache."""
+
+    def setUp(self):
+        self.image_dir = tempfile.mkdtemp()
+        for index, path in enumerate(source_files(self.image_dir)):
+            Image.new('RGBA', (50, 70), (index, 0, 255 - index, 255)).save(path)
+
+    def tearDown(self):
+        shutil.rmtree(self.image_dir)
+
+    def test_cold_then_warm(self):
+        """The first load builds the cache, the second reads it back."""
+        atlas, cold = load_atlas(10, 14, self.image_dir)
+        self.assertTrue(cold)
+        self.assertTrue(os.path.exists(cache_path(10, 14, self.image_dir)))
+        atlas, cold = load_atlas(10, 14, self.image_dir)
+        self.assertFalse(cold)
+        self.assertEqual(len(atlas), 53)
+        self.assertEqual(atlas.tile(5).size, (10, 14))
+        self.assertEqual(atlas.tile(5).getpixel((3, 3)), (5, 0, 250, 255))
+        self.assertEqual(atlas.tile(BACK).getpixel((0, 0)), (52, 0, 203, 255))
+
+    def test_cache_invalidated_by_source_change_and_size(self):
+        load_atlas(10, 14, self.image_dir)
+        path = source_files(self.image_dir)[7]
+        Image.new('RGBA', (50, 70), (1, 2, 3, 255)).save(path)
+        info = os.stat(path)
+        os.utime(path, ns=(info.st_atime_ns, info.st_mtime_ns + 10 ** 9))
+        atlas, cold = load_atlas(10, 14, self.image_dir)
+        self.assertTrue(cold)
+        self.assertEqual(atlas.tile(7).getpixel((0, 0)), (1, 2, 3, 255))
+        # A different card size is a separate cache entry
+        self.assertTrue(load_atlas(12, 16, self.image_dir)[1])
+        self.assertFalse(load_atlas(10, 14, self.image_dir)[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
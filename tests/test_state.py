@@ -0,0 +1,96 @@
+import random
+import unittest
+from card import Card
+from game import SolitaireGame, DRAW
+from pile import Pile, MAX_STOCK
+from state import GameState
+
+
+def layout(game):
+    """Utility to snapshot a game as plain (card codes, face-down count) tuples."""
+    def cards(pile):
+        return [card.code for card in pile.cards], pile.face_down
+    return ([cards(p) for p in game.tableau], [cards(p) for p in game.foundations],
+            cards(game.stock), cards(game.waste), game.stock_passes, game.max_passes_reached)
+
+
+class TestGameState(unittest.TestCase):
+    """Tests for the packed bytearray GameState."""
+
+    def setUp(self):
+        random.seed(7)
+        self.game = SolitaireGame()
+
+    def test_round_trip(self):
+        """Packing and unpacking a dealt game gives back the same layout."""
+        state = GameState.from_game(self.game)
+        self.assertEqual(layout(state.to_game()), layout(self.game))
+
+    def test_clone_is_independent(self):
+        """A clone shares no memory with the original."""
+        state = GameState.from_game(self.game)
+        copy = state.clone()
+        self.assertEqual(copy, state)
+        copy.draw_from_stock()
+        self.assertNotEqual(copy, state)
+        self.assertEqual(len(state.stock_cards()), 24)  # original stock untouched
+
+    def test_draw_and_recycle_match_game(self):
+        """Stock draws, recycles and the pass limit follow SolitaireGame exactly."""
+        state = GameState.from_game(self.game)
+        for _ in range(24 * 4 + 2):
+            record = self.game.draw_from_stock()
+            self.assertEqual(state.draw_from_stock(), record is not None and record[0] == DRAW)
+            self.assertEqual(layout(state.to_game()), layout(self.game))
+        self.assertTrue(state.is_lost())
+
+    def test_moves_and_flip(self):
+        """Legal foundation and tableau moves keep the face-down prefix and match SolitaireGame."""
+        # Pile 3 hides 5C, 7S and 9H under the ace of hearts; pile 0 shows the 10 of spades
+        tops = {0: 48, 1: 12, 2: 25, 4: 38, 5: 51, 6: 11}
+        tableau = [Pile([Card.from_code(tops[i])]) if i in tops else
+                   Pile([Card.from_code(code) for code in (30, 45, 8, 0)], face_down=3) for i in range(7)]
+        # Diamonds ace..9, clubs ace..4 and spades ace..6 are home, the other 23 cards in the stock
+        foundations = [Pile()] + [Pile([Card.from_code(code) for code in range(first, last)])
+                                  for first, last in ((13, 22), (26, 30), (39, 45))]
+        used = set(tops.values()) | {30, 45, 8, 0} | {card.code for pile in foundations for card in pile.cards}
+        stock = Pile([Card.from_code(code) for code in range(52) if code not in used])
+        self.assertLessEqual(len(stock.cards), MAX_STOCK)
+        game = SolitaireGame.from_piles(tableau, foundations, stock, Pile())
+        state = GameState.from_game(game)
+
+        self.assertTrue(state.can_place_foundation(state.tableau_top(3), 0))
+        state.move_tableau_to_foundation(3, 0)
+        game.move_tableau_to_foundation(3, 0)
+        self.assertEqual(state.tableau_len(3), 3)
+        self.assertEqual(state.foundation_top(0), 0)
+        self.assertTrue(state.flip_top_tableau_card(3))
+        self.assertFalse(state.flip_top_tableau_card(3))
+        game.flip_top_tableau_card(3)
+        self.assertEqual(state.face_down(3), 2)
+
+        top = state.tableau_top(3)
+        self.assertEqual(top, 8)
+        self.assertTrue(state.can_place_tableau(top, 0))
+        state.move_tableau_to_tableau(3, 0, 1)
+        game.move_tableau_to_tableau(3, 0, 1)
+        self.assertEqual(state.tableau_top(0), top)
+        self.assertEqual(state.tableau_len(0), 2)
+        state.draw_from_stock()
+        game.draw_from_stock()
+        self.assertEqual(state.waste_top(), game.waste.cards[-1].code)
+        self.assertEqual(layout(state.to_game()), layout(game))
+
+    def test_oversized_stock_or_waste_is_refused(self):
+        """More cards than the packed stock or waste region holds raises instead of shifting fields."""
+        cards = [Card.from_code(code) for code in range(MAX_STOCK + 1)]
+        tableau = [Pile() for _ in range(7)]
+        foundations = [Pile() for _ in range(4)]
+        for stock, waste in ((Pile(cards), Pile()), (Pile(), Pile(cards))):
+            game = SolitaireGame.from_piles(tableau, foundations, stock, waste)
+            with self.assertRaises(ValueError):
+                GameState.from_game(game)
+
+
+if __name__ == '__main__':
+    unittest.main()
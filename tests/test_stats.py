@@ -0,0 +1,49 @@
+import unittest
+
+from batch import play_stats, run_until
+from stats import StatsAggregator, wilson_interval
+
+
+class TestStatsAggregator(unittest.TestCase):
+    """Tests for the streaming campaign statistics."""
+
+    def test_wilson_interval(self):
+        low, high = wilson_interval(50, 100)
+        self.assertAlmostEqual(low, 0.4038, places=4)
+        self.assertAlmostEqual(high, 0.5962, places=4)
+        self.assertEqual(wilson_interval(0, 0), (0.0, 1.0))
+        self.assertEqual(wilson_interval(0, 10)[0], 0.0)
+
+    def test_counts_every_game(self):
+        stats = StatsAggregator(max_moves=100)
+        stats.add({'outcome': 'win', 'moves': 95, 'score': 52, 'stock_passes': 1})
+        stats.add({'outcome': 'blocked', 'moves': 5000, 'score': 3, 'stock_passes': 0})
+        stats.add({'outcome': 'max_passes', 'moves': 40, 'score': 0, 'stock_passes': 3})
+        self.assertEqual(stats.games, 3)
+        self.assertEqual(stats.wins, 1)
+        self.assertEqual(sum(stats.move_bins), 3)
+        self.assertEqual(stats.move_bins[-1], 1)  # overflow bin
+        self.assertEqual(stats.score_bins[52], 1)
+        self.assertEqual(stats.pass_bins, [1, 1, 0, 1])
+        self.assertEqual(stats.loss_reasons(), {'max_passes': 0.5, 'blocked': 0.5, 'move_limit': 0.0})
+
+    def test_merge_matches_single_run(self):
+        """Chunks merged together equal one aggregator over all the games."""
+        whole = play_stats(12, max_moves=150, first_deal=0)
+        merged = play_stats(5, max_moves=150, first_deal=0).merge(play_stats(7, max_moves=150, first_deal=5))
+        self.assertEqual(merged.as_dict(), whole.as_dict())
+        self.assertEqual(StatsAggregator.from_dict(whole.as_dict()).as_dict(), whole.as_dict())
+        with self.assertRaises(ValueError):
+            whole.merge(StatsAggregator(max_moves=500))
+
+    def test_run_until_stops_early(self):
+        """A loose target stops after the first chunks, whatever the worker count."""
+        one = run_until(0.2, 1000, workers=1, chunk_size=10, max_moves=100, min_games=20)
+        two = run_until(0.2, 1000, workers=2, chunk_size=10, max_moves=100, min_games=20)
+        self.assertLess(one.games, 1000)
+        self.assertTrue(one.converged(0.2, 20))
+        self.assertEqual(one.as_dict(), two.as_dict())
+
+
+if __name__ == '__main__':
+    unittest.main()
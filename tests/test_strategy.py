@@ -0,0 +1,96 @@
+import unittest
+
+from card import Card
+from game import SolitaireGame
+from pile import Pile
+from simulator import SolitaireSimulator
+from strategy import GreedyStrategy, RandomStrategy, Strategy, compare_strategies
+
+
+class FirstMove(Strategy):
+    """Plays the first legal move offered."""
+
+    def choose(self, view, moves):
+        return moves[0]
+
+
+class IllegalMove(Strategy):
+    """Always answers with a move that is never legal."""
+
+    def choose(self, view, moves):
+        return ('move_tableau_to_tableau', 0, 0, 1)
+
+
+class AlwaysDraw(Strategy):
+    """Draws whether or not drawing is legal."""
+
+    def choose(self, view, moves):
+        return ('draw_from_stock',)
+
+
+class TestStrategies(unittest.TestCase):
+    """Tests for pluggable strategies and the comparison harness."""
+
+    def test_greedy_strategy_matches_builtin(self):
+        """GreedyStrategy plays exactly the games of the built-in greedy order."""
+        for seed in range(15):
+            builtin = SolitaireSimulator(verbose=False, max_moves=300, seed=seed)
+            builtin.run_simulation()
+            plugged = SolitaireSimulator(verbose=False, max_moves=300, seed=seed, strategy=GreedyStrategy())
+            plugged.run_simulation()
+            self.assertEqual(plugged.get_result(), builtin.get_result())
+            self.assertGreater(plugged.decisions, 0)
+
+    def test_legal_moves_are_playable(self):
+        """Every listed tableau move obeys the placement rules."""
+        simulator = SolitaireSimulator(verbose=False, max_moves=200, seed=3, strategy=RandomStrategy(3))
+        simulator.run_simulation()
+        game = simulator.game
+        for move in game.legal_moves():
+            if move[0] == 'move_tableau_to_tableau':
+                src, dest, count = move[1:]
+                cards = game.tableau[src].cards[-count:]
+                self.assertLessEqual(count, len(game.tableau[src].cards) - game.tableau[src].face_down)
+                self.assertTrue(game.can_place_tableau_sequence(cards, game.tableau[dest]))
+
+    def test_strategy_sees_read_only_view(self):
+        """The view reports the live game in card codes."""
+        simulator = SolitaireSimulator(verbose=False, seed=8, strategy=FirstMove())
+        view = simulator.view
+        self.assertEqual(view.tableau_len(6), 7)
+        self.assertEqual(view.face_down(6), 6)
+        self.assertEqual(view.tableau_top(0), simulator.game.tableau[0].cards[-1].code)
+        simulator.make_best_move()
+        self.assertEqual(simulator.moves_made, 1)
+
+    def test_illegal_choice_is_rejected(self):
+        simulator = SolitaireSimulator(verbose=False, seed=1, strategy=IllegalMove())
+        with self.assertRaises(ValueError):
+            simulator.make_best_move()
+
+    def test_illegal_draw_is_rejected(self):
+        """With the stock and waste empty, a draw is as illegal as any other bad move."""
+        tableau = [Pile([Card.from_code(51)]), Pile([Card.from_code(11)])] + [Pile() for _ in range(5)]
+        game = SolitaireGame.from_piles(tableau, [Pile() for _ in range(4)], Pile(), Pile())
+        simulator = SolitaireSimulator(verbose=False, game=game, strategy=AlwaysDraw())
+        with self.assertRaises(ValueError):
+            simulator.make_best_move()
+
+    def test_strategy_must_implement_choose(self):
+        with self.assertRaises(TypeError):
+            Strategy()
+
+    def test_compare_strategies_report(self):
+        """Both strategies are scored on the same deals in the pool."""
+        report = compare_strategies(['greedy', 'random'], 4, first_deal=10, workers=2, max_moves=150)
+        self.assertEqual(set(report), {'greedy', 'random'})
+        for row in report.values():
+            self.assertEqual(row['games'], 4)
+            self.assertTrue(0.0 <= row['win_rate'] <= 1.0)
+            self.assertGreater(row['decisions_per_sec'], 0)
+        with self.assertRaises(ValueError):
+            compare_strategies(['nope'], 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
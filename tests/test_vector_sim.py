@@ -0,0 +1,68 @@
+import random
+import unittest
+from card import Card
+from game import SolitaireGame
+from pile import Pile
+from simulator import SolitaireSimulator
+
+try:
+    import numpy
+    from vector_sim import VectorSimulator
+except ImportError:  # numpy is optional
+    numpy = None
+
+
+def endgame(tableau_cards, stock_cards=(), waste_cards=()):
+    """
+    Utility to build a position where every card not listed is on the foundations.
+    Only the top card of each tableau pile is face up.
+    """
+    listed = {card.code for pile in tableau_cards for card in pile} | \
+        {card.code for card in stock_cards} | {card.code for card in waste_cards}
+    foundations = []
+    for suit in range(4):
+        cards = []
+        for code in range(suit * 13, suit * 13 + 13):
+            if code in listed:
+                break
+            cards.append(Card.from_code(code))
+        foundations.append(Pile(cards))
+    tableau = [Pile(list(cards), max(0, len(cards) - 1)) for cards in tableau_cards]
+    return SolitaireGame.from_piles(tableau, foundations, Pile(list(stock_cards)), Pile(list(waste_cards)))
+
+
+@unittest.skipUnless(numpy, "numpy is not installed")
+class TestVectorSimulator(unittest.TestCase):
+    """The lockstep engine must reproduce the scalar simulator game for game."""
+
+    def assert_matches_scalar(self, games, max_moves):
+        simulators = [SolitaireSimulator(verbose=False, max_moves=max_moves, game=game) for game in games]
+        vector = VectorSimulator.from_games(games, max_moves)  # snapshot before playing
+        vector.run()
+        for i, simulator in enumerate(simulators):
+            simulator.run_simulation()
+            self.assertEqual(vector.result(i), simulator.get_result(), f"game {i}")
+
+    def test_matches_scalar_on_seeded_deals(self):
+        games = []
+        for seed in range(25):
+            random.seed(seed)
+            games.append(SolitaireGame())
+        self.assert_matches_scalar(games, max_moves=150)
+
+    def test_win_and_blocked_endgames(self):
+        kings = [[Card('king', suit)] for suit in ('hearts', 'diamonds', 'clubs', 'spades')]
+        won = endgame(kings + [[], [], []])
+        # Foundations up to the nines; kings and jacks on top cover the tens and queens
+        stuck = endgame([[Card('10', 'hearts'), Card('king', 'hearts')],
+                         [Card('10', 'diamonds'), Card('king', 'diamonds')],
+                         [Card('10', 'clubs'), Card('king', 'clubs')],
+                         [Card('10', 'spades'), Card('king', 'spades')],
+                         [Card('queen', 'hearts'), Card('queen', 'diamonds'), Card('jack', 'hearts')],
+                         [Card('queen', 'clubs'), Card('queen', 'spades'), Card('jack', 'diamonds')],
+                         [Card('jack', 'spades'), Card('jack', 'clubs')]])
+        self.assert_matches_scalar([won, stuck], max_moves=100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import threading
+import time
+import unittest
+
+from game import SolitaireGame
+from simulator import SolitaireSimulator
+from solver import apply_move
+from worker import EngineWorker, MOVE, HINT, DONE
+
+
+def collect(worker, timeout=30.0):
+    """Polls the worker until its job reports DONE. Returns every message."""
+    messages = []
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        batch = worker.poll()
+        messages.extend(batch)
+        if any(kind == DONE for kind, _ in batch):
+            return messages
+        time.sleep(0.01)
+    raise AssertionError("worker did not finish")
+
+
+class TestEngineWorker(unittest.TestCase):
+    """Tests for the background autoplay/hint worker used by the GUI."""
+
+    def test_autoplay_streams_the_simulator_game(self):
+        """Replaying the streamed moves on the live game ends where the simulator does."""
+        for seed in range(5):
+            game = SolitaireGame(seed)
+            worker = EngineWorker()
+            worker.start_autoplay(game)
+            messages = collect(worker)
+            for kind, payload in messages:
+                if kind == MOVE:
+                    apply_move(game, payload)
+
+            simulator = SolitaireSimulator(verbose=False, seed=seed)
+            simulator.run_simulation()
+            self.assertEqual(messages[-1], (DONE, simulator.outcome))
+            self.assertEqual(sum(kind == MOVE for kind, _ in messages), simulator.moves_made)
+            self.assertEqual(game.hash, simulator.game.hash)
+
+    def test_snapshot_leaves_game_untouched(self):
+        game = SolitaireGame(3)
+        before = game.hash
+        worker = EngineWorker()
+        worker.start_autoplay(game)
+        collect(worker)
+        self.assertEqual(game.hash, before)
+
+    def test_cancel_drops_late_messages(self):
+        worker = EngineWorker()
+        worker.start_autoplay(SolitaireGame(1))
+        worker.cancel()
+        worker.thread.join(10)
+        self.assertFalse(worker.busy())
+        self.assertEqual(worker.poll(), [])
+
+    def test_hint_is_first_winning_move(self):
+        # Find a deal the solver settles quickly, then ask the worker about it
+        for seed in range(20):
+            game = SolitaireGame(seed)
+            worker = EngineWorker()
+            worker.start_hint(game, max_nodes=20000)
+            messages = collect(worker)
+            (move, status), = [payload for kind, payload in messages if kind == HINT]
+            if move is not None:
+                self.assertEqual(status, 'solvable')
+                apply_move(game, move)
+                return
+        self.skipTest("no quickly solvable deal in range")
+
+    def test_solve_honours_cancel(self):
+        from solver import solve, UNKNOWN
+        cancel = threading.Event()
+        cancel.set()
+        self.assertEqual(solve(SolitaireGame(0), cancel=cancel).status, UNKNOWN)
+
+    def test_run_simulation_honours_cancel(self):
+        cancel = threading.Event()
+        cancel.set()
+        simulator = SolitaireSimulator(verbose=False, seed=0)
+        self.assertFalse(simulator.run_simulation(cancel=cancel))
+        self.assertEqual((simulator.outcome, simulator.moves_made), ('cancelled', 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import random
+import unittest
+import zobrist
+from simulator import SolitaireSimulator
+from state import GameState
+
+
+class TestZobrist(unittest.TestCase):
+    """Tests for the incrementally maintained position hash."""
+
+    def test_incremental_hash_matches_full_hash(self):
+        """After a whole simulated game the running hash equals a fresh one."""
+        for seed in range(20):
+            random.seed(seed)
+            simulator = SolitaireSimulator(verbose=False, max_moves=300)
+            simulator.run_simulation()
+            game = simulator.game
+            self.assertEqual(game.hash, zobrist.hash_game(game))
+            self.assertEqual(game.hash, zobrist.hash_state(GameState.from_game(game)))
+
+    def test_tableau_move_hash_predicts_move(self):
+        """tableau_move_hash gives the hash the move and flip actually produce."""
+        random.seed(3)
+        simulator = SolitaireSimulator(verbose=False)
+        game = simulator.game
+        for src in range(7):
+            card = game.tableau[src].cards[-1]
+            dests = game.tableau_destinations(card) & ~(1 << src)
+            if dests:
+                dest = (dests & -dests).bit_length() - 1
+                expected = game.tableau_move_hash(src, dest, 1)
+                game.move_tableau_to_tableau(src, dest, 1)
+                game.flip_top_tableau_card(src)
+                self.assertEqual(game.hash, expected)
+                return
+        self.skipTest("no tableau move in this deal")
+
+    def test_detect_cycles_records_positions(self):
+        """With detect_cycles each move adds at most one position to the seen set."""
+        random.seed(5)
+        simulator = SolitaireSimulator(verbose=False, detect_cycles=True)
+        simulator.run_simulation()
+        self.assertGreater(len(simulator.seen_positions), 1)
+        self.assertLessEqual(len(simulator.seen_positions), simulator.moves_made + 1)
+        self.assertIsNone(SolitaireSimulator(verbose=False).seen_positions)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,279 @@
+# Lockstep NumPy simulator → plays K games at once with the same greedy priority
+# order as SolitaireSimulator.make_best_non_draw_move. Every step evaluates each
+# tier as a vectorized mask over all games still running; finished games drop out.
+# Results match the scalar simulator deal for deal.
+
+import sys
+import time
+
+import numpy as np
+
+import state as S
+from card import RANK_OF, SUIT_OF, COLOR_OF
+from game import SolitaireGame
+from simulator import MAX_MOVES, OUTCOMES
+from state import GameState
+
+WIN, MAX_PASSES, BLOCKED, MOVE_LIMIT = range(4)
+
+NONE = 52  # "no card" sentinel code
+RANK = np.array(RANK_OF + (-2,), dtype=np.int16)
+SUIT = np.array(SUIT_OF + (-1,), dtype=np.int16)
+COLOR = np.array(COLOR_OF + (-1,), dtype=np.int16)
+
+_PILE_SLOTS = np.arange(S.MAX_PILE)
+_PILE_BITS = (1 << np.arange(7)).astype(np.uint8)
+
+
+def _foundation_accepts(cards, tops):
+    """Broadcasts the foundation rule over card and foundation-top arrays."""
+    return np.where(tops == NONE,
+                    RANK[cards] == 0,
+                    (SUIT[cards] == SUIT[tops]) & (RANK[cards] == RANK[tops] + 1)) & (cards != NONE)
+
+
+def _build_children():
+    """CHILDREN[top] holds the two codes that may be stacked on top (NONE pair for aces)."""
+    children = np.full((53, 2), NONE, dtype=np.int16)
+    for top in range(52):
+        if RANK_OF[top] > 0:
+            children[top] = [code for code in range(52)
+                             if RANK_OF[code] == RANK_OF[top] - 1 and COLOR_OF[code] != COLOR_OF[top]]
+    return children
+
+
+CHILDREN = _build_children()
+# LOWEST_BIT[m] is the index of the lowest set bit of a 7-bit pile mask
+LOWEST_BIT = np.array([(m & -m).bit_length() - 1 for m in range(128)], dtype=np.int16)
+
+
+class VectorSimulator:
+    # Initialize VectorSimulator from packed GameStates (fresh, unplayed deals)
+    def __init__(self, states, max_moves=MAX_MOVES):
+        k = len(states)
+        bufs = np.frombuffer(b''.join(state.key() for state in states), dtype=np.uint8).reshape(k, S.SIZE)
+        self.max_moves = max_moves
+        self.ids = np.arange(k)
+
+        self.tab_len = bufs[:, S.TABLEAU_LEN:S.TABLEAU_LEN + 7].astype(np.int16)
+        self.face_down = bufs[:, S.FACE_DOWN:S.FACE_DOWN + 7].astype(np.int16)
+        self.tableau = bufs[:, S.TABLEAU:S.STOCK].reshape(k, 7, S.MAX_PILE).astype(np.int16)
+        self.tableau[_PILE_SLOTS >= self.tab_len[:, :, None]] = NONE
+        self.ftop = bufs[:, S.FOUNDATION_TOP:S.FOUNDATION_TOP + 4].astype(np.int16)
+        self.ftop[self.ftop == S.EMPTY] = NONE
+        self.stock = bufs[:, S.STOCK:S.STOCK + S.MAX_STOCK].astype(np.int16)
+        self.stock_len = bufs[:, S.STOCK_LEN].astype(np.int16)
+        self.waste = bufs[:, S.WASTE:S.WASTE + S.MAX_STOCK].astype(np.int16)
+        self.waste_len = bufs[:, S.WASTE_LEN].astype(np.int16)
+        self.passes = bufs[:, S.PASSES].astype(np.int16)
+        self.lost = bufs[:, S.MAX_PASSES_FLAG] == 1
+        self.moves = np.zeros(k, dtype=np.int32)
+        # Last tableau-to-tableau move, -1 when the previous move was anything else
+        self.last_src = np.full(k, -1, dtype=np.int16)
+        self.last_dest = np.full(k, -1, dtype=np.int16)
+
+        self.result_outcome = np.full(k, -1, dtype=np.int8)
+        self.result_moves = np.zeros(k, dtype=np.int32)
+        self.result_score = np.zeros(k, dtype=np.int16)
+        self.result_passes = np.zeros(k, dtype=np.int16)
+
+    @classmethod
+    def from_games(cls, games, max_moves=MAX_MOVES):
+        return cls([GameState.from_game(game) for game in games], max_moves)
+
+    def __len__(self):
+        """Number of games still running."""
+        return len(self.ids)
+
+    def run(self):
+        """Steps every game to completion and returns the per-game result arrays."""
+        while len(self.ids):
+            self.step()
+        return {
+            'outcome': self.result_outcome,
+            'moves': self.result_moves,
+            'score': self.result_score,
+            'stock_passes': self.result_passes,
+        }
+
+    def result(self, i):
+        """Result of game i in the same dict shape as SolitaireSimulator.get_result()."""
+        return {
+            'outcome': OUTCOMES[self.result_outcome[i]],
+            'moves': int(self.result_moves[i]),
+            'score': int(self.result_score[i]),
+            'stock_passes': int(self.result_passes[i]),
+        }
+
+    def _score(self):
+        return np.where(self.ftop == NONE, 0, RANK[self.ftop] + 1).sum(axis=1)
+
+    def _finish(self, mask, outcome):
+        """Records results for the masked games and drops them from the batch."""
+        ids = self.ids[mask]
+        self.result_outcome[ids] = outcome[mask]
+        self.result_moves[ids] = self.moves[mask]
+        self.result_score[ids] = self._score()[mask]
+        self.result_passes[ids] = self.passes[mask]
+        keep = ~mask
+        for name in ('ids', 'tab_len', 'face_down', 'tableau', 'ftop', 'stock', 'stock_len',
+                     'waste', 'waste_len', 'passes', 'lost', 'moves', 'last_src', 'last_dest'):
+            setattr(self, name, getattr(self, name)[keep])
+
+    def _flip(self, g, piles):
+        """Turns up the top card of the given piles where it is face down."""
+        exposed = (self.tab_len[g, piles] > 0) & (self.face_down[g, piles] == self.tab_len[g, piles])
+        self.face_down[g[exposed], piles[exposed]] -= 1
+
+    def step(self):
+        """Runs one iteration of the run_simulation loop for every active game."""
+        # --- Loop condition: won, lost on passes, or out of moves ---
+        won = self._score() == 52
+        capped = self.moves >= self.max_moves if self.max_moves is not None else np.zeros(len(self.ids), bool)
+        done = won | self.lost | capped
+        if done.any():
+            outcome = np.where(won, WIN, np.where(self.lost, MAX_PASSES, MOVE_LIMIT)).astype(np.int8)
+            self._finish(done, outcome)
+        k = len(self.ids)
+        if k == 0:
+            return
+        rows = np.arange(k)
+
+        has_waste = self.waste_len > 0
+        wtop = np.where(has_waste, self.waste[rows, np.maximum(self.waste_len - 1, 0)], NONE)
+        has_cards = self.tab_len > 0
+        ttop = np.where(has_cards,
+                        self.tableau[rows[:, None], np.arange(7), np.maximum(self.tab_len - 1, 0)],
+                        NONE)
+
+        # --- 1. Waste to Foundation ---
+        acc1 = _foundation_accepts(wtop[:, None], self.ftop)
+        t1 = acc1.any(axis=1)
+        # --- 2. Tableau top card to Foundation ---
+        acc2 = _foundation_accepts(ttop[:, :, None], self.ftop[:, None, :]).reshape(k, 28)
+        t2 = acc2.any(axis=1) & ~t1
+        # accepts[g, code] is a bitmask of the tableau piles card `code` may go on
+        accepts = np.zeros((k, 53), dtype=np.uint8)
+        for dest in range(7):
+            accepts[rows[:, None], CHILDREN[ttop[:, dest]]] |= _PILE_BITS[dest]
+            accepts[~has_cards[:, dest], :NONE] |= _PILE_BITS[dest]
+        accepts[:, NONE] = 0
+        # --- 3. Tableau sequence to Tableau: first (src, start, dest) in scan order ---
+        start_ok = ((_PILE_SLOTS >= self.face_down[:, :, None])
+                    & (_PILE_SLOTS < self.tab_len[:, :, None])
+                    & (self.tab_len[:, :, None] > 1))
+        # Allowed destinations per source: never itself, never a direct reversal
+        dest_mask = np.broadcast_to(0x7f ^ _PILE_BITS, (k, 7)).copy()
+        reversal = np.flatnonzero(self.last_src >= 0)
+        dest_mask[reversal, self.last_dest[reversal]] &= ~_PILE_BITS[self.last_src[reversal]]
+        acc3 = (accepts[rows[:, None, None], self.tableau] & dest_mask[:, :, None]
+                * start_ok).reshape(k, -1)
+        t3 = acc3.any(axis=1) & ~(t1 | t2)
+        # --- 4. Waste to Tableau ---
+        acc4 = accepts[rows, wtop]
+        t4 = (acc4 > 0) & ~(t1 | t2 | t3)
+        # --- 5. Stock draw ---
+        t5 = ~(t1 | t2 | t3 | t4)
+
+        made = t1 | t2 | t3 | t4
+        self.moves[made] += 1
+        self.last_src[t1 | t2 | t4] = -1
+        self.last_dest[t1 | t2 | t4] = -1
+
+        g = np.flatnonzero(t1)
+        if len(g):
+            f = acc1[g].argmax(axis=1)
+            self.ftop[g, f] = wtop[g]
+            self.waste_len[g] -= 1
+
+        g = np.flatnonzero(t2)
+        if len(g):
+            idx = acc2[g].argmax(axis=1)
+            src, f = idx // 4, idx % 4
+            self.ftop[g, f] = ttop[g, src]
+            self.tab_len[g, src] -= 1
+            self.tableau[g, src, self.tab_len[g, src]] = NONE
+            self._flip(g, src)
+
+        g = np.flatnonzero(t3)
+        if len(g):
+            idx = (acc3[g] > 0).argmax(axis=1)
+            src, start = idx // S.MAX_PILE, idx % S.MAX_PILE
+            dest = LOWEST_BIT[acc3[g, idx]]
+            count = self.tab_len[g, src] - start
+            dest_len = self.tab_len[g, dest]
+            for offset in range(S.MAX_PILE):
+                m = offset < count
+                if not m.any():
+                    break
+                gm = g[m]
+                self.tableau[gm, dest[m], dest_len[m] + offset] = self.tableau[gm, src[m], start[m] + offset]
+                self.tableau[gm, src[m], start[m] + offset] = NONE
+            self.tab_len[g, src] = start
+            self.tab_len[g, dest] = dest_len + count
+            self._flip(g, src)
+            self.last_src[g] = src
+            self.last_dest[g] = dest
+
+        g = np.flatnonzero(t4)
+        if len(g):
+            dest = LOWEST_BIT[acc4[g]]
+            self.tableau[g, dest, self.tab_len[g, dest]] = wtop[g]
+            self.tab_len[g, dest] += 1
+            self.waste_len[g] -= 1
+
+        g = np.flatnonzero(t5)
+        if len(g):
+            self._draw(g)
+
+    def _draw(self, g):
+        """Vectorized SolitaireGame.draw_from_stock for the games in g."""
+        empty = self.stock_len[g] == 0
+        out_of_passes = empty & (self.passes[g] >= 3)
+        self.lost[g[out_of_passes]] = True
+        blocked = empty & ~out_of_passes & (self.waste_len[g] == 0)
+
+        recycle = g[empty & ~out_of_passes & ~blocked]
+        if len(recycle):
+            n = self.waste_len[recycle]
+            for offset in range(S.MAX_STOCK):
+                m = offset < n
+                if not m.any():
+                    break
+                self.stock[recycle[m], offset] = self.waste[recycle[m], n[m] - 1 - offset]
+            self.stock_len[recycle] = n
+            self.waste_len[recycle] = 0
+            self.passes[recycle] += 1
+
+        draw = g[~out_of_passes & ~blocked]
+        top = self.stock_len[draw] - 1
+        self.waste[draw, self.waste_len[draw]] = self.stock[draw, top]
+        self.stock_len[draw] = top
+        self.waste_len[draw] += 1
+        self.moves[draw] += 1
+        self.last_src[draw] = -1
+        self.last_dest[draw] = -1
+
+        if blocked.any():
+            mask = np.zeros(len(self.ids), dtype=bool)
+            mask[g[blocked]] = True
+            self._finish(mask, np.full(len(self.ids), BLOCKED, dtype=np.int8))
+
+
+def simulate_games(games, max_moves=MAX_MOVES):
+    """Plays a list of freshly dealt SolitaireGames in lockstep."""
+    return VectorSimulator.from_games(games, max_moves).run()
+
+
+if __name__ == "__main__":
+    num_games = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    start = time.perf_counter()
+    results = simulate_games([SolitaireGame() for _ in range(num_games)])
+    elapsed = time.perf_counter() - start
+    counts = np.bincount(results['outcome'], minlength=len(OUTCOMES))
+    print(f"--- Lockstep batch of {num_games} games ---")
+    print(f"Win rate:       {counts[WIN] / num_games:.2%}")
+    print(f"Moves per game: {results['moves'].mean():.1f}")
+    print(f"Games per sec:  {num_games / elapsed:.1f}")
+    for outcome, count in zip(OUTCOMES, counts):
+        print(f"  {outcome:<11} {count}")
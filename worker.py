@@ -0,0 +1,125 @@
+# Engine worker → runs the greedy simulator (autoplay) or the solver (hint) on a
+# snapshot of a game in a background thread and streams the results back
+# through a thread-safe queue, so a Tk mainloop can poll it with root.after.
+# Every job can be cancelled; messages carry a job id so a cancelled job's late
+# messages are dropped.
+
+import queue
+import threading
+
+from simulator import SolitaireSimulator, MAX_MOVES
+from solver import solve, SOLVABLE
+from state import GameState
+
+# Message kinds put on the queue as (job_id, kind, payload)
+MOVE = 'move'      # payload: a solver-style move tuple, e.g. ('move_waste_to_tableau', 3)
+HINT = 'hint'      # payload: (first move or None, solver status)
+DONE = 'done'      # payload: the simulator outcome or the solver status
+ERROR = 'error'    # payload: the exception raised by the job
+
+
+def snapshot(game):
+    """An independent copy of a SolitaireGame (new piles over the shared cards), safe to use off the Tk thread."""
+    return GameState.from_game(game).to_game()
+
+
+class MoveQueueSink:
+    """Event sink that turns simulator move events into move tuples on a queue."""
+
+    # Initialize MoveQueueSink
+    def __init__(self, out, job_id):
+        self.out = out
+        self.job_id = job_id
+
+    def emit(self, event, **fields):
+        if event == 'draw':
+            move = ('draw_from_stock',)
+        elif event == 'waste_to_foundation':
+            move = ('move_waste_to_foundation', fields['foundation'])
+        elif event == 'tableau_to_foundation':
+            move = ('move_tableau_to_foundation', fields['tableau'], fields['foundation'])
+        elif event == 'tableau_to_tableau':
+            move = ('move_tableau_to_tableau', fields['src'], fields['dest'], fields['count'])
+        elif event == 'waste_to_tableau':
+            move = ('move_waste_to_tableau', fields['tableau'])
+        else:
+            return
+        self.out.put((self.job_id, MOVE, move))
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class EngineWorker:
+    """
+    Runs one engine job at a time in a daemon thread. Starting a new job
+    cancels the previous one. Results arrive on self.messages.
+    """
+
+    # Initialize EngineWorker
+    def __init__(self):
+        self.messages = queue.Queue()
+        self.job_id = 0
+        self.thread = None
+        self.cancel_event = threading.Event()
+
+    def busy(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def cancel(self):
+        """Stops the running job; anything it still queues is dropped by poll."""
+        self.cancel_event.set()
+        self.job_id += 1
+
+    def _start(self, target, *args):
+        self.cancel()
+        self.cancel_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, args=(target, self.job_id, self.cancel_event) + args,
+                                       daemon=True)
+        self.thread.start()
+        return self.job_id
+
+    def _run(self, target, job_id, cancel, *args):
+        try:
+            target(job_id, cancel, *args)
+        except Exception as exc:  # report instead of dying silently in the thread
+            self.messages.put((job_id, ERROR, exc))
+
+    def start_autoplay(self, game, max_moves=MAX_MOVES):
+        """Plays the greedy simulator from a snapshot of game, streaming each move. Returns the job id."""
+        return self._start(self._autoplay, snapshot(game), max_moves)
+
+    def start_hint(self, game, max_nodes=200000, max_seconds=10.0):
+        """Searches from a snapshot of game for the first move of a win. Returns the job id."""
+        return self._start(self._hint, snapshot(game), max_nodes, max_seconds)
+
+    def _autoplay(self, job_id, cancel, game, max_moves):
+        simulator = SolitaireSimulator(verbose=False, game=game, max_moves=max_moves,
+                                       sink=MoveQueueSink(self.messages, job_id))
+        simulator.run_simulation(cancel=cancel)
+        if cancel.is_set():
+            return
+        self.messages.put((job_id, DONE, simulator.get_result()['outcome']))
+
+    def _hint(self, job_id, cancel, game, max_nodes, max_seconds):
+        result = solve(game, max_nodes=max_nodes, max_seconds=max_seconds, cancel=cancel)
+        if cancel.is_set():
+            return
+        move = result.moves[0] if result.status == SOLVABLE and result.moves else None
+        self.messages.put((job_id, HINT, (move, result.status)))
+        self.messages.put((job_id, DONE, result.status))
+
+    def poll(self, limit=None):
+        """Messages of the current job waiting on the queue (at most limit); stale ones are dropped."""
+        ready = []
+        while limit is None or len(ready) < limit:
+            try:
+                job_id, kind, payload = self.messages.get_nowait()
+            except queue.Empty:
+                break
+            if job_id == self.job_id:
+                ready.append((kind, payload))
+        return ready
@@ -0,0 +1,71 @@
+# Zobrist keys → one random 64-bit number per (card, place) so a position hash
+# can be updated with a few XORs per move. SolitaireGame keeps its hash current
+# in every mutating method; hash_game/hash_state compute it from scratch.
+
+import random
+
+from pile import MAX_PILE, MAX_STOCK
+
+# Fixed seed so every process (pool workers, saved tables) agrees on the keys
+_rng = random.Random(0x5011747)
+
+
+def _keys(n):
+    return [_rng.getrandbits(64) for _ in range(n)]
+
+
+# TABLEAU[(code * 7 + pile) * MAX_PILE + depth]: card at a depth in a tableau pile
+TABLEAU = _keys(52 * 7 * MAX_PILE)
+# FACE_UP[code]: XORed in while a tableau card is face up
+FACE_UP = _keys(52)
+# STOCK[code * MAX_STOCK + i] / WASTE[code * MAX_STOCK + i]: card at position i (bottom is 0)
+STOCK = _keys(52 * MAX_STOCK)
+WASTE = _keys(52 * MAX_STOCK)
+# FOUNDATION[code]: card is home. Which slot holds a suit does not change the position.
+FOUNDATION = _keys(52)
+# PASSES[n]: number of stock recycles so far; LOST: the pass limit was hit
+PASSES = _keys(4)
+LOST = _keys(1)[0]
+
+
+def hash_game(game):
+    """Hash of a SolitaireGame computed from scratch."""
+    h = PASSES[game.stock_passes]
+    if game.max_passes_reached:
+        h ^= LOST
+    for p, pile in enumerate(game.tableau):
+        for depth, card in enumerate(pile.cards):
+            h ^= TABLEAU[(card.code * 7 + p) * MAX_PILE + depth]
+            if depth >= pile.face_down:
+                h ^= FACE_UP[card.code]
+    for foundation in game.foundations:
+        for card in foundation.cards:
+            h ^= FOUNDATION[card.code]
+    for i, card in enumerate(game.stock.cards):
+        h ^= STOCK[card.code * MAX_STOCK + i]
+    for i, card in enumerate(game.waste.cards):
+        h ^= WASTE[card.code * MAX_STOCK + i]
+    return h
+
+
+def hash_state(state):
+    """Hash of a GameState; equal to hash_game of the same position."""
+    h = PASSES[state.stock_passes]
+    if state.max_passes_reached:
+        h ^= LOST
+    for p in range(7):
+        face_down = state.face_down(p)
+        for depth, code in enumerate(state.tableau_pile(p)):
+            h ^= TABLEAU[(code * 7 + p) * MAX_PILE + depth]
+            if depth >= face_down:
+                h ^= FACE_UP[code]
+    for f in range(4):
+        top = state.foundation_top(f)
+        if top is not None:
+            for code in range(top - state.foundation_len(f) + 1, top + 1):
+                h ^= FOUNDATION[code]
+    for i, code in enumerate(state.stock_cards()):
+        h ^= STOCK[code * MAX_STOCK + i]
+    for i, code in enumerate(state.waste_cards()):
+        h ^= WASTE[code * MAX_STOCK + i]
+    return h